@@ -1,6 +1,6 @@
 #!/bin/bash
 
-for module in $(ls test/[^_]*)
+for module in $(ls test/[^_]*.py)
 do
   module=${module##*/}
   module=${module%.*}
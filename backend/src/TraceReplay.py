@@ -0,0 +1,41 @@
+import argparse
+import os
+
+import pandas as pd
+
+from simulation.TraceAnalysis import read_trace, get_hop_histogram, get_cost_by_target_position, \
+    estimate_cache_hit_rate
+
+replay_parser = argparse.ArgumentParser(prog="TraceReplay.py",
+                                        description="Analyzes the trace files recorded by SimulationWriter.py "
+                                                    "with the -R option, without running the simulation again.")
+replay_parser.add_argument("traces", help="The trace files to analyze.", nargs="+", metavar="trace")
+replay_parser.add_argument("-b", "--bins", help="The number of bins of target positions. Default is 10.",
+                           type=int, default=10)
+replay_parser.add_argument("-c", "--cache-sizes", help="The sizes of the LRU caches of IPAROs whose hit rates "
+                                                       "are estimated. Default is 16, 64 and 256.",
+                           type=int, nargs="+", default=[16, 64, 256], dest="cache_sizes")
+replay_parser.add_argument("-o", "--output", help="The directory to write the analysis to as CSV files. By "
+                                                  "default, the analysis is only printed.")
+
+if __name__ == '__main__':
+    args = replay_parser.parse_args()
+    for path in args.traces:
+        traversals = read_trace(path)
+        name = os.path.splitext(os.path.basename(path))[0]
+        hop_histogram = get_hop_histogram(traversals)
+        cost_by_position = get_cost_by_target_position(traversals, args.bins)
+        cache_hit_rates = pd.Series([estimate_cache_hit_rate(traversals, size) for size in args.cache_sizes],
+                                    index=pd.Index(args.cache_sizes, name="Cache Size"), name="Hit Rate")
+        print(f"{name}: {len(traversals)} traversals")
+        print("Hop histogram:")
+        print(hop_histogram)
+        print("Mean hops by target position:")
+        print(cost_by_position)
+        print("Estimated cache hit rates:")
+        print(cache_hit_rates)
+        if args.output:
+            os.makedirs(args.output, exist_ok=True)
+            hop_histogram.to_csv(os.path.join(args.output, f"{name}-Hops.csv"))
+            cost_by_position.to_csv(os.path.join(args.output, f"{name}-Position.csv"))
+            cache_hit_rates.to_csv(os.path.join(args.output, f"{name}-Cache.csv"))
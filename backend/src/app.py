@@ -9,7 +9,7 @@ from system.IPAROFactory import IPAROFactory
 from system.IPFS import IPFS
 from system.IPAROLinkFactory import IPAROLinkFactory
 from system.IPNS import IPNS
-from system.SnapshotsUtils import get_all_snapshots_for_url
+from system.SnapshotsUtils import get_all_snapshots_for_url, get_snapshots_page
 
 app = Flask(__name__)
 
@@ -38,8 +38,8 @@ def get_latest_snapshot():
     if not peer_id:
         return jsonify({"error": "This website has never been archived"}), 404
     
-    cid = ipns.resolve_cid(peer_id)
-    iparo = ipfs.retrieve(cid)
+    link, iparo = ipfs.resolve_latest(ipns.resolve_cid(peer_id))
+    cid = link.cid
     
     return jsonify({
         "cid": cid,
@@ -56,8 +56,17 @@ def get_all_snapshots():
     if not url:
         return jsonify({"error": "Missing 'url'"}), 400
 
+    # Optional pagination, from the snapshot with sequence number 'start' onwards.
+    start = request.args.get("start", type=int, default=0)
+    limit = request.args.get("limit", type=int)
+    if start < 0 or (limit is not None and limit < 0):
+        return jsonify({"error": "'start' and 'limit' must be nonnegative"}), 400
+
     try:
-        snapshots = get_all_snapshots_for_url(url, ipns, ipfs, ipns_records)
+        if limit is None and start == 0:
+            snapshots = get_all_snapshots_for_url(url, ipns, ipfs, ipns_records)
+        else:
+            snapshots = get_snapshots_page(url, ipns, ipfs, ipns_records, start, limit)
         return jsonify([
             {
                 "cid": cid,
@@ -82,8 +91,8 @@ def get_url_version_count():
     if not peer_id:
         return jsonify({"error": "This website has never been archived"}), 404
     
-    cid = ipns.resolve_cid(peer_id)
-    iparo = ipfs.retrieve(cid)
+    link, iparo = ipfs.resolve_latest(ipns.resolve_cid(peer_id))
+    cid = link.cid
     version_count = iparo.seq_num + 1
     
     return jsonify({
@@ -0,0 +1,115 @@
+import json
+import platform
+import statistics
+from dataclasses import dataclass, asdict
+from time import perf_counter_ns
+from typing import Callable
+
+
+@dataclass
+class Benchmark:
+    """
+    A function to time. If it has a setup function, then the setup is run (untimed) before every call,
+    and each repeat times a single call, until the maximum time is reached. Otherwise, each repeat times as
+    many calls as fit in the minimum time, so that fast functions are timed accurately.
+    """
+    name: str
+    func: Callable[[], object]
+    setup: Callable[[], object] | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    median_ns: float
+    min_ns: float
+    mean_ns: float
+    repeat: int
+    number: int
+    """
+    The number of calls timed in each repeat.
+    """
+
+
+def calibrate(func: Callable[[], object], min_time_ns: int) -> int:
+    """
+    Gets the number of calls that take at least the minimum time, by doubling.
+    """
+    number = 1
+    while True:
+        start_time = perf_counter_ns()
+        for _ in range(number):
+            func()
+        if perf_counter_ns() - start_time >= min_time_ns:
+            return number
+        number *= 2
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int = 5, min_time_ns: int = 20_000_000,
+                  max_time_ns: int = 10_000_000_000) -> BenchmarkResult:
+    """
+    Times a benchmark, and gets the median, the minimum and the mean time per call over the repeats.
+
+    :param benchmark: The benchmark.
+    :param repeat: The number of repeats.
+    :param min_time_ns: The minimum time of each repeat of a benchmark without a setup, in nanoseconds.
+    :param max_time_ns: The time after which a benchmark with a setup is not repeated anymore, in nanoseconds.
+    """
+    times = []
+    if benchmark.setup:
+        number = 1
+        for _ in range(repeat):
+            benchmark.setup()
+            start_time = perf_counter_ns()
+            benchmark.func()
+            times.append(perf_counter_ns() - start_time)
+            if sum(times) >= max_time_ns:
+                break
+    else:
+        number = calibrate(benchmark.func, min_time_ns)
+        for _ in range(repeat):
+            start_time = perf_counter_ns()
+            for _ in range(number):
+                benchmark.func()
+            times.append((perf_counter_ns() - start_time) / number)
+    return BenchmarkResult(benchmark.name, statistics.median(times), min(times), statistics.fmean(times),
+                           len(times), number)
+
+
+def save_results(results: list[BenchmarkResult], path: str):
+    """
+    Saves the results to a JSON file, along with the versions of Python and of the platform.
+    """
+    output = {"python": platform.python_version(), "platform": platform.platform(),
+              "benchmarks": {result.name: asdict(result) for result in results}}
+    with open(path, "w") as file:
+        json.dump(output, file, indent=2)
+
+
+def load_results(path: str) -> dict[str, BenchmarkResult]:
+    """
+    Loads the results saved with ``save_results``, by name.
+    """
+    with open(path) as file:
+        benchmarks = json.load(file)["benchmarks"]
+    return {name: BenchmarkResult(**result) for name, result in benchmarks.items()}
+
+
+def compare_results(results: list[BenchmarkResult], baseline: dict[str, BenchmarkResult],
+                    threshold: float = 0.2) -> list[tuple[str, float, bool]]:
+    """
+    Compares the median times of the benchmarks with those of a baseline. Benchmarks that are not in
+    the baseline are left out.
+
+    :param results: The results of the benchmarks.
+    :param baseline: The results of the baseline, by name.
+    :param threshold: The fraction by which a median time may exceed that of the baseline.
+    :returns: The name of each benchmark, the ratio of its median time to that of the baseline, and
+        whether it is a regression.
+    """
+    comparison = []
+    for result in results:
+        if result.name in baseline:
+            ratio = result.median_ns / baseline[result.name].median_ns
+            comparison.append((result.name, ratio, ratio > 1 + threshold))
+    return comparison
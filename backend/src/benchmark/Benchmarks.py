@@ -0,0 +1,156 @@
+import random
+from itertools import cycle
+from typing import Iterator
+
+import numpy as np
+
+from benchmark.BenchmarkRunner import Benchmark
+from simulation.CommandLineParser import CommandLineParser
+from simulation.CommandLineValidator import validator
+from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
+from simulation.IPFS import ipfs, Mode
+from simulation.LinkingStrategy import LinkingStrategy
+from simulation.Operation import StoreOperation, GetAtTOperation, GetNthOperation, reset, URL
+from simulation.VersionDensity import VersionDensity
+
+# The same version densities as in run.sh.
+DENSITY_ARGS = ["", "-l 2", "-b 20", "-m 0.5 0 300 -m 0.5 1000 400"]
+# One policy of each kind.
+POLICY_ARGS = ["-s", "-p 4", "-c", "-r 4", "-u 4", "-g 4", "-e 2", "-j", "-U 4", "-G 20", "-E 2 10", "-C 0.001"]
+# The policies whose stores get slower with the volume, which take too long to store 10000 versions in a
+# benchmark (at least a minute each, and up to half an hour for Temporal Min Gap).
+SLOW_POLICY_ARGS = ["-c", "-r 4", "-u 4", "-g 4", "-U 4", "-G 20", "-E 2 10"]
+SLOW_POLICY_MAX_VOLUME = 1000
+VOLUMES = [100, 1000, 10000]
+# The policy of the chains that the IPFS primitives are timed on.
+PRIMITIVE_POLICY_ARGS = "-e 2"
+# The number of random targets that the lookups cycle through.
+NUM_TARGETS = 100
+# The policies and the densities whose lookup costs are counted by default: the temporal calendar policy
+# against temporal exponential, on the skewed densities of run.sh.
+LOOKUP_POLICY_ARGS = ["-C 0.001", "-E 2 10"]
+LOOKUP_DENSITY_ARGS = ["-b 20", "-m 0.5 0 300 -m 0.5 1000 400"]
+LOOKUP_VOLUMES = [1000, 10000]
+# The number of iterations of each lookup operation whose retrieves are counted.
+LOOKUP_ITERATIONS = 300
+
+
+def parse_policy_and_density(policy_args: str, density_args: str) -> tuple[LinkingStrategy, VersionDensity]:
+    """
+    Gets the policy and the version density from their command-line arguments.
+    """
+    parser = CommandLineParser(validator.parse_args(f"{policy_args} {density_args}".split()))
+    return parser.parse_policy(), parser.parse_density()
+
+
+def store_chain(policy: LinkingStrategy, density: VersionDensity, volume: int) -> IPAROSimulationEnvironment:
+    """
+    Replaces the data in the IPFS and the IPNS with a chain of versions, which is the same for every
+    call with the same arguments.
+    """
+    reset(reset_data=True)
+    random.seed(0)
+    np.random.seed(0)
+    env = IPAROSimulationEnvironment(policy, volume, density, [])
+    StoreOperation(env, save_to_file=False).execute()
+    reset()
+    return env
+
+
+def get_store_operation_benchmark(name: str, policy: LinkingStrategy, density: VersionDensity,
+                                  volume: int) -> Benchmark:
+    """
+    Times storing a whole chain of versions with the store operation.
+    """
+    env = IPAROSimulationEnvironment(policy, volume, density, [])
+    operations = []
+
+    def setup():
+        reset(reset_data=True)
+        random.seed(0)
+        np.random.seed(0)
+        operations.append(StoreOperation(env, save_to_file=False))
+
+    return Benchmark(name, lambda: operations.pop().execute(), setup)
+
+
+def get_strategy_benchmark(name: str, policy: LinkingStrategy) -> Benchmark:
+    """
+    Times choosing the links of the next version of the chain in the IPFS. The latest version is
+    retrieved beforehand, like in the store operation.
+    """
+    first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+    return Benchmark(name, lambda: policy.get_candidate_nodes(latest_link, latest_iparo, first_link))
+
+
+def get_primitive_benchmarks(suffix: str, volume: int) -> list[Benchmark]:
+    """
+    Gets the benchmarks of the IPFS primitives on the chain in the IPFS.
+    """
+    latest_link, latest_iparo = ipfs.get_link_to_latest_node(URL)
+    first_link = ipfs.retrieve_nth_iparo(0, latest_link, latest_iparo)
+    rng = random.Random(0)
+    numbers = cycle([rng.randint(0, volume - 1) for _ in range(NUM_TARGETS)])
+    timestamps = cycle([rng.randint(first_link.timestamp, latest_link.timestamp) for _ in range(NUM_TARGETS)])
+    return [
+        Benchmark(f"IPFS.store/{suffix}", lambda: ipfs.store(latest_iparo)),
+        Benchmark(f"IPFS.retrieve/{suffix}", lambda: ipfs.retrieve(latest_link.cid)),
+        Benchmark(f"IPFS.retrieve_nth_iparo/{suffix}",
+                  lambda: ipfs.retrieve_nth_iparo(next(numbers), latest_link, latest_iparo)),
+        Benchmark(f"IPFS.retrieve_closest_iparo/{suffix}",
+                  lambda: ipfs.retrieve_closest_iparo(latest_link, set(), next(timestamps), Mode.CLOSEST)),
+    ]
+
+
+def iter_benchmarks(volumes: list[int] | None = None, policy_args: list[str] | None = None,
+                    density_args: list[str] | None = None) -> Iterator[Benchmark]:
+    """
+    Iterates through the benchmarks of every volume, policy and density. Each benchmark must be run before
+    the next one is taken, since the benchmarks of the primitives and of the policies run on the chain
+    that was stored last.
+
+    :param volumes: The version volumes. Default is ``VOLUMES``.
+    :param policy_args: The command-line arguments of each policy. Default is ``POLICY_ARGS``.
+    :param density_args: The command-line arguments of each version density. Default is ``DENSITY_ARGS``.
+    """
+    for volume in volumes or VOLUMES:
+        for density_arg in DENSITY_ARGS if density_args is None else density_args:
+            policy, density = parse_policy_and_density(PRIMITIVE_POLICY_ARGS, density_arg)
+            store_chain(policy, density, volume)
+            yield from get_primitive_benchmarks(f"{policy}/{density}/{volume}", volume)
+            for policy_arg in policy_args or POLICY_ARGS:
+                if policy_arg in SLOW_POLICY_ARGS and volume > SLOW_POLICY_MAX_VOLUME:
+                    continue
+                policy, density = parse_policy_and_density(policy_arg, density_arg)
+                suffix = f"{policy}/{density}/{volume}"
+                yield get_store_operation_benchmark(f"StoreOperation/{suffix}", policy, density, volume)
+                # The last store operation leaves its chain in the IPFS.
+                yield get_strategy_benchmark(f"{type(policy).__name__}.get_candidate_nodes/{suffix}", policy)
+
+
+def iter_lookup_costs(volumes: list[int] | None = None, policy_args: list[str] | None = None,
+                      density_args: list[str] | None = None) -> Iterator[tuple[str, float, int, float, int]]:
+    """
+    Iterates through the IPFS retrieves of the Time and Nth operations on the chain of every volume, policy
+    and density, which are counted rather than timed.
+
+    :param volumes: The version volumes. Default is ``LOOKUP_VOLUMES``.
+    :param policy_args: The command-line arguments of each policy. Default is ``LOOKUP_POLICY_ARGS``.
+    :param density_args: The command-line arguments of each version density. Default is ``LOOKUP_DENSITY_ARGS``.
+    :returns: The name of each chain, with the mean and the maximum retrieves of the Time operation and then
+        of the Nth operation.
+    """
+    for volume in volumes or LOOKUP_VOLUMES:
+        for density_arg in LOOKUP_DENSITY_ARGS if density_args is None else density_args:
+            for policy_arg in policy_args or LOOKUP_POLICY_ARGS:
+                policy, density = parse_policy_and_density(policy_arg, density_arg)
+                env = store_chain(policy, density, volume)
+                env.iterations = LOOKUP_ITERATIONS
+                costs = []
+                for operation in (GetAtTOperation, GetNthOperation):
+                    random.seed(0)
+                    op = operation(env, save_to_file=False)
+                    op.execute()
+                    retrieves = op.opcounts["IPFS Retrieve"]
+                    costs += [float(retrieves.mean()), int(retrieves.max())]
+                yield f"{policy}/{density}/{volume}", *costs
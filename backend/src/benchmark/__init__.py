@@ -0,0 +1,4 @@
+__all__ = ["BenchmarkRunner", "Benchmarks"]
+
+# Import the submodules
+from . import BenchmarkRunner, Benchmarks
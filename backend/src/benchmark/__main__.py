@@ -0,0 +1,69 @@
+import argparse
+import re
+import sys
+
+from benchmark.Benchmarks import iter_benchmarks, iter_lookup_costs
+from benchmark.BenchmarkRunner import run_benchmark, save_results, load_results, compare_results
+
+benchmark_parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                           description="Times the IPFS primitives, the policies and the store "
+                                                       "operation of the simulation.")
+benchmark_parser.add_argument("-V", "--volumes", help="The version volumes. Default is 100, 1000 and 10000 (or "
+                                                      "1000 and 10000 with -L).", type=int, nargs="+")
+benchmark_parser.add_argument("-p", "--policy", help="The command-line arguments of a policy to benchmark, such "
+                                                     "as -p='-g 4' or -p=-s. Can be repeated. By default, one "
+                                                     "policy of each kind is benchmarked.",
+                              action="append", dest="policies")
+benchmark_parser.add_argument("-d", "--density", help="The command-line arguments of a version density to "
+                                                      "benchmark, such as -d='-l 2' (or -d= for uniform). Can be "
+                                                      "repeated. By default, the densities of run.sh are "
+                                                      "benchmarked.", action="append", dest="densities")
+benchmark_parser.add_argument("-k", "--filter", help="Only runs the benchmarks whose names match a regular "
+                                                     "expression, such as 'IPFS' or 'Max-Gap/.*/1000'.")
+benchmark_parser.add_argument("-r", "--repeat", help="The number of times each benchmark is timed. Default is 5.",
+                              type=int, default=5)
+benchmark_parser.add_argument("-o", "--output", help="The JSON file to save the results to.")
+benchmark_parser.add_argument("-c", "--compare", help="The JSON file of a baseline to compare the results with. "
+                                                      "Exits with status 1 if any benchmark regressed.",
+                              metavar="baseline")
+benchmark_parser.add_argument("-t", "--threshold", help="The fraction by which the median time of a benchmark may "
+                                                        "exceed that of the baseline. Default is 0.2.",
+                              type=float, default=0.2)
+benchmark_parser.add_argument("-L", "--lookups", help="Counts the mean and the maximum IPFS retrieves of the Time "
+                                                      "and Nth operations instead of timing anything. By default, "
+                                                      "the temporal calendar and temporal exponential policies "
+                                                      "are counted on BHLT and Multipeak at volumes of 1000 and "
+                                                      "10000.", action="store_true")
+
+if __name__ == '__main__':
+    args = benchmark_parser.parse_args()
+    if args.lookups:
+        for name, time_mean, time_max, nth_mean, nth_max in iter_lookup_costs(args.volumes, args.policies,
+                                                                              args.densities):
+            print(f"{name}: Time {time_mean:.1f} (max {time_max}), Nth {nth_mean:.1f} (max {nth_max}) retrieves",
+                  flush=True)
+        sys.exit(0)
+    pattern = re.compile(args.filter) if args.filter else None
+    results = []
+    for benchmark in iter_benchmarks(args.volumes, args.policies, args.densities):
+        if pattern and not pattern.search(benchmark.name):
+            # The store operations are still run, since the later benchmarks depend on their chains.
+            if benchmark.setup:
+                benchmark.setup()
+                benchmark.func()
+            continue
+        result = run_benchmark(benchmark, args.repeat)
+        results.append(result)
+        print(f"{result.name}: {result.median_ns / 1000:.3f} μs (min {result.min_ns / 1000:.3f} μs)", flush=True)
+
+    if args.output:
+        save_results(results, args.output)
+    if args.compare:
+        regressions = 0
+        print(f"Compared with {args.compare}:")
+        for name, ratio, regressed in compare_results(results, load_results(args.compare), args.threshold):
+            print(f"{'REGRESSED' if regressed else 'ok':>9} {ratio:6.2f}x {name}")
+            regressions += regressed
+        if regressions:
+            print(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+            sys.exit(1)
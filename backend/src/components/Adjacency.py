@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix, coo_matrix
+
+from simulation.IPARO import IPARO
+from simulation.TimeUnit import TimeUnit
+
+# The largest number of nodes whose adjacency matrix is charted pair by pair. Larger matrices are binned.
+DENSE_MAX_NODES = 100
+# The number of bins of each axis of a binned adjacency matrix.
+NUM_BINS = 100
+# The largest number of nodes whose graph image is drawn, which is as many inches wide as there are nodes.
+GRAPH_IMAGE_MAX_NODES = 20
+
+
+def get_links(iparos: list[IPARO], start_time: int) -> tuple[csr_matrix, np.ndarray]:
+    """
+    Gets the links and the timestamps of the IPAROs of a chain in one pass.
+
+    :param iparos: The IPAROs, which are numbered from 0 to the number of IPAROs minus one.
+    :param start_time: The time from which the timestamps are measured, in the unit of the timestamps.
+    :returns: The sparse adjacency matrix, whose entry at (source, destination) is true if the source
+        links to the destination, and the timestamp of each IPARO in seconds (or NaN if it is missing).
+    """
+    n = max((iparo.seq_num for iparo in iparos), default=-1) + 1
+    num_links = [len(iparo.linked_iparos) for iparo in iparos]
+    sources = np.repeat(np.array([iparo.seq_num for iparo in iparos], dtype=np.int64), num_links)
+    destinations = np.fromiter((link.seq_num for iparo in iparos for link in iparo.linked_iparos),
+                               dtype=np.int64, count=sum(num_links))
+    matrix = coo_matrix((np.ones(len(sources), dtype=bool), (sources, destinations)), shape=(n, n)).tocsr()
+    timestamps = np.full(n, np.nan)
+    timestamps[[iparo.seq_num for iparo in iparos]] = [(iparo.timestamp - start_time) / TimeUnit.SECONDS
+                                                       for iparo in iparos]
+    return matrix, timestamps
+
+
+def get_pairs(matrix: csr_matrix, timestamps: np.ndarray, sources: np.ndarray,
+              destinations: np.ndarray) -> pd.DataFrame:
+    """
+    Describes pairs of nodes, with the timestamps of both nodes, whether the source links to the destination
+    ('N/A' if the source is not after the destination, since links only go backwards) and their relationship
+    ('Self', 'Linked' or 'None').
+    """
+    linked = np.asarray(matrix[sources, destinations]).ravel().astype(bool)
+    return pd.DataFrame({"Source": sources, "Destination": destinations,
+                         "Source Timestamp": timestamps[sources],
+                         "Destination Timestamp": timestamps[destinations],
+                         "Linked": np.select([linked, sources > destinations], ["Yes", "No"], "N/A"),
+                         "Relationship": np.select([sources == destinations, linked], ["Self", "Linked"], "None")})
+
+
+def get_all_pairs(matrix: csr_matrix, timestamps: np.ndarray) -> pd.DataFrame:
+    """
+    Describes every pair of nodes (see ``get_pairs``), which makes a row per cell of the adjacency matrix.
+    """
+    n = matrix.shape[0]
+    return get_pairs(matrix, timestamps, np.tile(np.arange(n), n), np.repeat(np.arange(n), n))
+
+
+def get_linked_pairs(matrix: csr_matrix, timestamps: np.ndarray) -> pd.DataFrame:
+    """
+    Describes the pairs of nodes that are linked and the pairs of each node with itself (see ``get_pairs``),
+    which only makes a row per link and per node.
+    """
+    links = matrix.tocoo()
+    n = matrix.shape[0]
+    pairs = get_pairs(matrix, timestamps, np.concatenate((links.row, np.arange(n))).astype(np.int64),
+                      np.concatenate((links.col, np.arange(n))).astype(np.int64))
+    return pairs.sort_values(["Source", "Destination"], ascending=[True, False], ignore_index=True)
+
+
+def get_binned_adjacency(matrix: csr_matrix, num_bins: int = NUM_BINS) -> pd.DataFrame:
+    """
+    Bins the adjacency matrix, so that it can be charted for many nodes. Each axis is split into (at most)
+    a number of bins of consecutive nodes.
+
+    :returns: A row for each pair of bins, with the first and last node of the source and destination bins,
+        the number of links from the source bin to the destination bin, the number of pairs of nodes that
+        could be linked (where the source is after the destination), and the fraction of those pairs that are
+        linked (or NaN if there are none).
+    """
+    n = matrix.shape[0]
+    edges = np.unique(np.linspace(0, n, min(num_bins, n) + 1).astype(np.int64))
+    links = matrix.tocoo()
+    num_axis_bins = len(edges) - 1
+    source_bins = np.searchsorted(edges, links.row, side='right') - 1
+    destination_bins = np.searchsorted(edges, links.col, side='right') - 1
+    num_links = np.zeros((num_axis_bins, num_axis_bins), dtype=np.int64)
+    np.add.at(num_links, (source_bins, destination_bins), 1)
+    # The number of earlier nodes of each destination bin for each source node, summed over each source bin.
+    node_pairs = np.clip(np.arange(n)[:, None] - edges[None, :-1], 0, np.diff(edges)[None, :])
+    num_pairs = np.add.reduceat(node_pairs, edges[:-1], axis=0)
+    sources, destinations = np.divmod(np.arange(num_axis_bins * num_axis_bins), num_axis_bins)
+    return pd.DataFrame({"Source Start": edges[sources], "Source End": edges[sources + 1] - 1,
+                         "Destination Start": edges[destinations], "Destination End": edges[destinations + 1] - 1,
+                         "Links": num_links.ravel(), "Pairs": num_pairs.ravel(),
+                         "Linked Fraction": np.where(num_pairs.ravel() > 0,
+                                                     num_links.ravel() / np.maximum(num_pairs.ravel(), 1), np.nan)})
@@ -0,0 +1,89 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+
+DownsamplingMethod = Literal['lttb', 'min-max']
+DOWNSAMPLING_METHOD_NAMES = {'lttb': "Largest Triangle Three Buckets", 'min-max': "Minimum and Maximum per Bucket"}
+
+
+def get_lttb_indices(x: np.ndarray, y: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Chooses the points of a line that keep its shape with the Largest Triangle Three Buckets algorithm. The
+    first and last points are always kept, and the points in between are split into buckets, from which the
+    point that forms the largest triangle with the point kept in the previous bucket and the average of the
+    next bucket is kept.
+
+    :param x: The x-coordinates of the line, in increasing order.
+    :param y: The y-coordinates of the line.
+    :param num_points: The number of points to keep.
+    :returns: The indices of the points to keep, in increasing order.
+    """
+    n = len(x)
+    if num_points >= n or num_points < 3:
+        return np.arange(n)
+    # The edges of the buckets of the points between the first and the last, which all have a point.
+    edges = np.linspace(1, n - 1, num_points - 1).astype(np.int64)
+    indices = np.empty(num_points, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    previous = 0
+    for i in range(num_points - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        average_x = x[end:next_end].mean()
+        average_y = y[end:next_end].mean()
+        areas = np.abs((x[previous] - average_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (average_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        indices[i + 1] = previous
+    return indices
+
+
+def get_min_max_indices(y: np.ndarray, num_points: int) -> np.ndarray:
+    """
+    Chooses the points with the minimum and the maximum value of each bucket (along with the first and last
+    points), which keeps the range of the values, such as the spread of a scatter plot.
+
+    :param y: The values.
+    :param num_points: The maximum number of points to keep, which makes half as many buckets.
+    :returns: The indices of the points to keep, in increasing order.
+    """
+    n = len(y)
+    if num_points >= n or num_points < 4:
+        return np.arange(n)
+    buckets = pd.Series(y).groupby(np.arange(n) * ((num_points - 2) // 2) // n)
+    return np.unique(np.concatenate(([0, n - 1], buckets.idxmin().to_numpy(), buckets.idxmax().to_numpy())))
+
+
+def downsample(df: pd.DataFrame, x: str, y: str, num_points: int, by: list[str] | None = None,
+               method: DownsamplingMethod = 'lttb') -> pd.DataFrame:
+    """
+    Reduces each series of a DataFrame to at most a number of points before it is charted, so that charts of
+    many iterations render quickly. The number of points is usually the width of the chart in pixels, since
+    more points cannot be told apart. Rows without a value are left out.
+
+    :param df: The data, with a row per point.
+    :param x: The column of the x-coordinates.
+    :param y: The column of the y-coordinates.
+    :param num_points: The maximum number of points of each series.
+    :param by: The columns that identify each series (such as the policy), if there is more than one.
+    :param method: 'lttb' to keep the shape of lines, or 'min-max' to keep the range of the values of each
+    bucket, such as for scatter plots.
+    :returns: The rows of the points that are kept, in the order of the x-coordinates in each series.
+    """
+    df = df.dropna(subset=[x, y])
+    # The columns are grouped and sorted by their values, since they may also be levels of the index.
+    series = df.groupby([df[column] for column in by], sort=False, observed=True) if by else [(None, df)]
+    partial_dfs = []
+    for _, data in series:
+        data = data.iloc[np.argsort(data[x].to_numpy(), kind='stable')]
+        if method == 'lttb':
+            indices = get_lttb_indices(data[x].to_numpy(dtype=np.float64), data[y].to_numpy(dtype=np.float64),
+                                       num_points)
+        else:
+            indices = get_min_max_indices(data[y].to_numpy(dtype=np.float64), num_points)
+        partial_dfs.append(data.iloc[indices])
+    if not partial_dfs:
+        return df
+    return pd.concat(partial_dfs)
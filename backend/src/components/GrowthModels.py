@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from scipy.stats import t
+
+# The candidate growth laws of the cost, as the function of the volume that the cost is linear in. The constant
+# law has no such function.
+GROWTH_LAWS: dict[str, Callable[[np.ndarray], np.ndarray] | None] = {
+    "Constant": None,
+    "Logarithmic": np.log,
+    "Square Root": np.sqrt,
+    "Linear": lambda volumes: volumes,
+    "Linearithmic": lambda volumes: volumes * np.log(volumes),
+}
+EXTRAPOLATION_VOLUMES = [10 ** 5, 10 ** 6, 10 ** 7]
+CONFIDENCE_LEVEL = 0.95
+
+
+def get_design_matrix(law: str, volumes: np.ndarray) -> np.ndarray:
+    """
+    Gets the design matrix of a growth law, whose columns are the intercept and (unless the law is constant)
+    the function of the volume.
+    """
+    volumes = np.asarray(volumes, dtype=np.float64)
+    function = GROWTH_LAWS[law]
+    if function is None:
+        return np.ones((len(volumes), 1))
+    return np.column_stack((np.ones(len(volumes)), function(volumes)))
+
+
+@dataclass
+class GrowthFit:
+    """
+    A growth law fitted to the costs of the iterations of runs with different volumes, with ordinary least
+    squares.
+    """
+    law: str
+    coefficients: np.ndarray
+    covariance: np.ndarray
+    """
+    The covariance of the coefficients.
+    """
+    degrees_of_freedom: int
+    bic: float
+    """
+    The Bayesian information criterion, which is lower for laws that fit better with fewer coefficients.
+    """
+
+    def predict(self, volumes: np.ndarray,
+                confidence_level: float = CONFIDENCE_LEVEL) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Predicts the mean cost at each volume.
+
+        :returns: The predicted mean costs, and the lower and upper bounds of their confidence intervals (which
+            are missing values if there are no degrees of freedom left).
+        """
+        design_matrix = get_design_matrix(self.law, volumes)
+        means = design_matrix @ self.coefficients
+        if self.degrees_of_freedom <= 0:
+            return means, np.full_like(means, np.nan), np.full_like(means, np.nan)
+        errors = np.sqrt(np.einsum("ij,jk,ik->i", design_matrix, self.covariance, design_matrix))
+        margins = t.ppf((1 + confidence_level) / 2, self.degrees_of_freedom) * errors
+        return means, means - margins, means + margins
+
+
+def fit_growth_law(law: str, volumes: np.ndarray, means: np.ndarray, stds: np.ndarray,
+                   counts: np.ndarray) -> GrowthFit | None:
+    """
+    Fits a growth law to the summaries of runs, which gives the same fit as the iterations of the runs would,
+    since the mean, the standard deviation and the number of iterations of each run are sufficient.
+
+    :param law: The name of the growth law, in ``GROWTH_LAWS``.
+    :param volumes: The volume of each run.
+    :param means: The mean cost of each run.
+    :param stds: The standard deviation of the costs of each run (missing if there is one iteration).
+    :param counts: The number of iterations of each run.
+    :returns: The fit, or None if there are fewer volumes than coefficients.
+    """
+    design_matrix = get_design_matrix(law, volumes)
+    num_coefficients = design_matrix.shape[1]
+    if len(np.unique(volumes)) < num_coefficients:
+        return None
+    means = np.asarray(means, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    weighted_design_matrix = design_matrix * counts[:, None]
+    precision = design_matrix.T @ weighted_design_matrix
+    coefficients = np.linalg.solve(precision, weighted_design_matrix.T @ means)
+    # The squared errors of the means, and the squared deviations of the iterations from the means.
+    rss = (np.sum(counts * (means - design_matrix @ coefficients) ** 2)
+           + np.sum((counts - 1) * np.nan_to_num(np.asarray(stds, dtype=np.float64)) ** 2))
+    num_iterations = int(np.sum(counts))
+    degrees_of_freedom = num_iterations - num_coefficients
+    variance = rss / degrees_of_freedom if degrees_of_freedom > 0 else np.nan
+    # A perfect fit has no likelihood, so the residuals are floored to prefer the law with fewer coefficients.
+    bic = (num_iterations * np.log(max(rss / num_iterations, np.finfo(np.float64).tiny))
+           + num_coefficients * np.log(num_iterations))
+    return GrowthFit(law, coefficients, variance * np.linalg.inv(precision), degrees_of_freedom, bic)
+
+
+def fit_growth_laws(volumes: np.ndarray, means: np.ndarray, stds: np.ndarray, counts: np.ndarray,
+                    laws: list[str] | None = None) -> list[GrowthFit]:
+    """
+    Fits each growth law that can be fitted (see ``fit_growth_law``), from the best fit to the worst.
+
+    :param laws: The names of the growth laws. Default is every law in ``GROWTH_LAWS``.
+    """
+    fits = [fit_growth_law(law, volumes, means, stds, counts) for law in laws or GROWTH_LAWS]
+    # Sorting is stable, so laws that fit equally well stay in the order of GROWTH_LAWS, from the simplest.
+    return sorted((fit for fit in fits if fit is not None), key=lambda fit: fit.bic)
+
+
+def predict_costs(summary: pd.DataFrame, volumes: list[int] | np.ndarray, law: str | None = None,
+                  by: str = 'Policy') -> pd.DataFrame:
+    """
+    Fits a growth law to the summary of each policy, and predicts its mean costs at some volumes.
+
+    :param summary: The summary of the runs, from ``get_summary_data`` (with the columns 'Scale', 'count',
+        'mean' and 'std').
+    :param volumes: The volumes at which the costs are predicted.
+    :param law: The name of the growth law. Default is the law that fits each policy best.
+    :param by: The column that identifies the runs of each policy.
+    :returns: A row per policy and volume, with the law, the predicted mean cost and the bounds of its
+        confidence interval. Policies whose law cannot be fitted are left out.
+    """
+    volumes = np.asarray(volumes, dtype=np.float64)
+    partial_dfs = []
+    for name, runs in summary.reset_index(drop=True).groupby(by, sort=False):
+        fits = fit_growth_laws(runs['Scale'].to_numpy(), runs['mean'].to_numpy(), runs['std'].to_numpy(),
+                               runs['count'].to_numpy(), None if law is None else [law])
+        if not fits:
+            continue
+        means, lower, upper = fits[0].predict(volumes)
+        partial_dfs.append(pd.DataFrame({by: name, 'Scale': volumes, 'Law': fits[0].law, 'Mean': means,
+                                         'Lower': lower, 'Upper': upper}))
+    if not partial_dfs:
+        return pd.DataFrame(columns=[by, 'Scale', 'Law', 'Mean', 'Lower', 'Upper'])
+    return pd.concat(partial_dfs, ignore_index=True)
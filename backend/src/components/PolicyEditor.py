@@ -37,7 +37,7 @@ class PolicyEditor:
             st.form_submit_button(on_click=self.set_stage, args=(1,))
         if ss['stage'] > 0:
             policy_group = ss['policy_group']
-            if policy_group not in ['single', 'comprehensive']:
+            if policy_group not in ['single', 'comprehensive', 'skewbinary']:
                 with st.form('policy_param_form'):
                     st.subheader("Select Policy Parameters")
                     if policy_group == 'tempexp':
@@ -49,6 +49,10 @@ class PolicyEditor:
                         st.number_input("Enter Base (Greater than 1)",
                                         min_value=1.001, step=0.001, value=2.0,
                                         format="%.3f", key="param1")
+                    elif policy_group == 'tempcalendar':
+                        st.number_input("Enter Resolution (seconds)",
+                                        min_value=0.000001, step=0.001,
+                                        value=0.001, format="%.6f", key="param1")
                     elif policy_group == 'tempmingap':
                         st.number_input("Enter Time Unit (seconds) ",
                                         min_value=0.001, step=0.001,
@@ -2,8 +2,11 @@ from pathlib import Path
 from typing import Literal
 
 import pandas as pd
+import streamlit as st
 
 from simulation.LinkingStrategy import *
+from simulation.OnlineStatistics import STATISTICS
+from simulation.ResultsStore import load_results, load_summaries, get_results_mtime
 from simulation.VersionDensity import *
 
 RESULTS_FOLDER = Path("../results")
@@ -14,18 +17,17 @@ OP_NAMES_ABBREVIATED = OP_NAMES.copy()
 OP_NAMES_ABBREVIATED['Nth'] = "Retrieve at Nth"
 OP_TYPES = list(OP_NAMES.keys())
 DENSITY_NAMES = {"bhlt": "BHLT", "linear": "Linear", "multipeak": "Multipeak", "uniform": "Uniform"}
-ACTIONS = ["IPNS Get", "IPNS Update", "IPFS Store", "IPFS Retrieve", "Links"]
-POLICY_GROUPS_FILES = {subpath.name:
-                           [param for param in subpath.iterdir() if param.is_dir()]
-                       for subpath in RESULTS_FOLDER.iterdir() if subpath.is_dir()}
-POLICY_GROUPS = {subpath.name:
-                     [param.name for param in subpath.iterdir() if param.is_dir()]
-                 for subpath in RESULTS_FOLDER.iterdir() if subpath.is_dir()}
+ACTIONS = ["IPNS Get", "IPNS Update", "IPFS Store", "IPFS Retrieve", "Links", "Bytes Stored", "Bytes Retrieved"]
+# The levels of the index of the results cube, from which each run (and its iterations) is sliced.
+CUBE_INDEX = ["Density", "Operation", "Group", "Param", "Volume", "Iteration"]
+# The names of the quartiles in the summaries.
+QUARTILE_NAMES = {"25%": "q1", "50%": "median", "75%": "q3"}
 POLICY_GROUP_NAMES = {"single": "Single", "previous": "Previous", "comprehensive": "Comprehensive",
                       "random": "Random", "sequniform": "Sequential Uniform",
                       "seqmaxgap": "Sequential Max-Gap", "seqexp": "Sequential Exponential",
+                      "skewbinary": "Skew Binary",
                       "tempuniform": "Temporal Uniform", "tempmingap": "Temporal Min-Gap",
-                      "tempexp": "Temporal Exponential"}
+                      "tempexp": "Temporal Exponential", "tempcalendar": "Temporal Calendar"}
 POLICY_PARAM_NAMES = {"Previous": "K",
                       "Random": "K",
                       "Sequential-Uniform": "K",
@@ -33,19 +35,8 @@ POLICY_PARAM_NAMES = {"Previous": "K",
                       "Sequential-Exponential": "B",
                       "Temporal-Uniform": "K",
                       "Temporal-Min-Gap": "T",
-                      "Temporal-Exponential": "B"}
-
-POLICY_GROUP_COMBINATIONS = [(group, param)
-                             for group, params in POLICY_GROUPS.items()
-                             for param in params]
-
-ENVIRONMENTS = [file.name[:file.name.find(".csv")].split("-")
-                for subpath in RESULTS_FOLDER.iterdir() if subpath.is_dir()
-                for param in subpath.iterdir() if param.is_dir()
-                for file in param.iterdir() if file.is_file()]
-
-SCALES = list(set([int(x[0]) for x in ENVIRONMENTS]))
-DENSITIES = list(set([x[1] for x in ENVIRONMENTS]))
+                      "Temporal-Exponential": "B",
+                      "Temporal-Calendar": "R"}
 COLOR_SCHEME = "category10"
 COLOR_SCHEME_PAIRED = "tableau20"
 NUM_COLUMNS = 3
@@ -65,10 +56,13 @@ class Action(IntEnum):
     IPFS_STORE = 3
     IPFS_RETRIEVE = 4
     LINKS = 5
+    BYTES_STORED = 6
+    BYTES_RETRIEVED = 7
 
 ACTION_LIST = [ACTIONS[action - 1] for action in Action]
-RETRIEVE_ACTION_LIST = [action for action in Action if action != Action.LINKS]
-UNSAFE_LIST_ALL_ACTIONS = [5]
+RETRIEVE_ACTION_LIST = [Action.IPNS_GET, Action.IPNS_UPDATE, Action.IPFS_STORE, Action.IPFS_RETRIEVE]
+BYTES_ACTION_LIST = [Action.BYTES_STORED, Action.BYTES_RETRIEVED]
+UNSAFE_LIST_ALL_ACTIONS = ["Resilience"]
 
 def shorten_group_name(policy_group: str):
     return policy_group.replace("Temporal", "Temp.").replace("Exponential", "Exp.")
@@ -79,28 +73,110 @@ def shorten_parameter_name(policy_param: str):
 
 def format_policy_params(group: str, param):
     name= f"{group} ({POLICY_PARAM_NAMES[group]} = {param}"
-    if group == "Temporal-Min-Gap":
+    if group in ("Temporal-Min-Gap", "Temporal-Calendar"):
         name += "s"
     name += ")"
     return name
 
+@st.cache_resource(max_entries=1, show_spinner="Loading the results...")
+def load_results_cube(mtime: float) -> pd.DataFrame:
+    """
+    Loads the results cube, which has every iteration of every run in the results folder, indexed by
+    ``CUBE_INDEX``. It is cached once for all sessions and pages, so it must not be modified in place.
+
+    :param mtime: The modification time of the results, which is only used to invalidate the cache.
+    """
+    cube = load_results(RESULTS_FOLDER).set_index(CUBE_INDEX).sort_index()
+    cube.index = cube.index.remove_unused_levels()
+    return cube
+
+
+def get_results_cube() -> pd.DataFrame:
+    """
+    Gets the results cube, which is only loaded again when a policy directory of the results folder was
+    modified.
+    """
+    return load_results_cube(get_results_mtime(RESULTS_FOLDER))
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_summary_table(mtime: float) -> pd.DataFrame:
+    """
+    Loads the summaries of the runs whose iterations were not kept, indexed by the keys of the runs in the
+    results cube (without the iteration) and the statistic. Like the results cube, it must not be modified
+    in place.
+
+    :param mtime: The modification time of the results, which is only used to invalidate the cache.
+    """
+    return load_summaries(RESULTS_FOLDER).set_index(CUBE_INDEX[:-1] + ["Statistic"]).sort_index()
+
+
+def get_summary_table() -> pd.DataFrame:
+    """
+    Gets the summaries of the runs whose iterations were not kept.
+    """
+    return load_summary_table(get_results_mtime(RESULTS_FOLDER))
+
+
+def get_policy_groups() -> dict[str, list[str]]:
+    """
+    Gets the parameters of each policy group with results.
+    """
+    policy_groups = {}
+    for group, param in get_policy_group_combinations():
+        policy_groups.setdefault(group, []).append(param)
+    return policy_groups
+
+
+def get_policy_group_combinations() -> list[tuple[str, str]]:
+    """
+    Gets the policy group and parameter of each policy with results.
+    """
+    return list(get_results_cube().index.droplevel(["Density", "Operation", "Volume", "Iteration"]).unique())
+
+
+def get_scales() -> list[int]:
+    """
+    Gets the version volumes with results.
+    """
+    return list(get_results_cube().index.levels[CUBE_INDEX.index("Volume")])
+
+
+def get_densities() -> list[str]:
+    """
+    Gets the version densities with results.
+    """
+    return list(get_results_cube().index.levels[CUBE_INDEX.index("Density")])
+
+
+def get_action_name(action: int | Action | str) -> str:
+    """
+    Gets the name of the CSV column of an action, which is either an ``Action`` or a column name.
+    """
+    return action if isinstance(action, str) else ACTIONS[action - 1]
+
+
 def get_summary_data(policies: pd.DataFrame,
                      density: str,
                      operation: str,
                      scales: list[int] | int | None = None,
-                     actions: list[int | Action] | None = None,
+                     actions: list[int | Action | str] | None = None,
                      agg_func: Literal['mean', 'max', 'median', 'all'] = 'all',
                      analyze_all_iterations: bool = False) -> pd.Series | pd.DataFrame:
     """
-    Gets the summary data from the generated CSV files. The default setting is to analyze the summary
-    conveniently located at the bottom of the CSV file, but it can also analyze all iterations instead, and
-    in doing so, ignores the ``agg_func`` argument.
+    Gets the summary data from the results cube. The default setting is to summarize the iterations of each
+    run (like ``DataFrame.describe``), but it can also analyze all iterations instead, and in doing so, ignores
+    the ``agg_func`` argument. Runs whose iterations were not kept are summarized from their online statistics
+    (and left out when all iterations are analyzed), and runs without results are left out, so the data is empty
+    (with the same columns) if no run has results.
 
     :param policies: The name of all listed densities (defined as a nx2 DataFrame whose columns are 'Group' and 'Param')
     :param density: The density to use.
     :param operation: The operation, capitalized. This parameter is case-sensitive.
-    :param scales: The scales to iterate through, defaults to SCALES.
-    :param actions: The action indices, which defaults to [Action.IPFS_RETRIEVE]. Index 0 is automatically added.
+    :param scales: The scales to iterate through, defaults to every scale with results.
+    :param actions: The actions (or the names of the columns), which defaults to [Action.IPFS_RETRIEVE]. Results
+    that do not have a column (such as the byte counts of results that were generated before they were recorded)
+    have missing values instead.
     :param agg_func: The aggregate function. Currently set to mean by default.
     :param analyze_all_iterations: Whether to analyze all iterations instead of just the summary.
     """
@@ -108,38 +184,40 @@ def get_summary_data(policies: pd.DataFrame,
 
     if actions is None:
         actions = [Action.IPFS_RETRIEVE]
-    actions.append(0)
+    action_names = [get_action_name(action) for action in actions]
     index = ['Policy', 'Scale']
     if scales is None:
-        scales = SCALES
+        scales = get_scales()
     elif isinstance(scales, int):
         scales = [scales]
         index.remove('Scale')
+    cube = get_results_cube()
+    summaries = get_summary_table()
     for i, row in policies.iterrows():
         policy_group = row['Group']
         policy_param = row['Param']
         for scale in scales:
-            # Get number of iterations based on operation
-            if operation == "Store":
-                n_iter = scale
-            elif operation == "Unsafe-List":
-                n_iter = scale - 1
+            key = (density, operation, policy_group, policy_param, scale)
+            if key in cube.index:
+                run = cube.loc[key]
+            elif not analyze_all_iterations and key in summaries.index:
+                run = None
             else:
-                n_iter = 10
-            filename = RESULTS_FOLDER / policy_group / policy_param / f"{scale}-{density}-{operation}.csv"
+                continue
             policy_name = format_policy_params(policy_group, policy_param) if policy_group in POLICY_PARAM_NAMES else policy_group
             if analyze_all_iterations:
                 if 'Iteration' not in index:
                     index.append('Iteration')
-                partial_df = (pd.read_csv(filename, nrows=n_iter, usecols=actions)
-                              .assign(Iteration=pd.Series(np.arange(1, n_iter + 1)), Policy=policy_name,
+                partial_df = (run.reindex(columns=action_names)
+                              .assign(Iteration=run.index.to_numpy(), Policy=policy_name,
                                       Scale=scale, Density=density))
             else:
-                partial_df = (pd.read_csv(filename, skiprows=n_iter, usecols=actions, index_col=0).transpose()
+                summary = (run.reindex(columns=action_names).describe() if run is not None
+                           else summaries.loc[key].reindex(index=STATISTICS, columns=action_names))
+                partial_df = (summary.transpose()
                               .assign(Policy=policy_name, Scale=scale, Density=density)
-                              .rename(columns={"25%": "q1", "50%": "median", "75%": "q3"}))
-                if len(actions) > 2:
-                    action_names = [ACTIONS[action - 1] for action in actions[:-1]]
+                              .rename(columns=QUARTILE_NAMES))
+                if len(actions) > 1:
                     partial_df = partial_df.assign(Action=action_names)
                     if 'Action' not in index:
                         index.append('Action')
@@ -150,6 +228,18 @@ def get_summary_data(policies: pd.DataFrame,
                 partial_dfs.append(partial_df)
             else:
                 partial_dfs.append(partial_df[agg_func])
+    if not partial_dfs:
+        # No run has results, so the data is empty but has the same columns as otherwise.
+        if analyze_all_iterations:
+            index.append('Iteration')
+            columns = action_names + ['Iteration', 'Policy', 'Scale', 'Density']
+        else:
+            columns = [QUARTILE_NAMES.get(name, name) for name in STATISTICS] + ['Policy', 'Scale', 'Density']
+            if len(actions) > 1:
+                index.append('Action')
+                columns.append('Action')
+        df = pd.DataFrame(columns=columns).set_index(index, drop=False)
+        return df if agg_func == 'all' or analyze_all_iterations else df[agg_func]
     df = pd.concat(partial_dfs)
 
     return df
@@ -186,10 +276,14 @@ def select_policy(strategy_type: str, param: str) -> LinkingStrategy:
             return SequentialSMaxGapStrategy(int(param))
         case 'sequential-exponential':
             return SequentialExponentialStrategy(float(param))
+        case 'skew-binary':
+            return SkewBinaryStrategy()
         case 'temporal-uniform':
             return TemporalUniformStrategy(int(param))
         case 'temporal-min-gap':
             return TemporalMinGapStrategy(float(param))
+        case 'temporal-calendar':
+            return TemporalCalendarStrategy(float(param))
         case _:
             base = float(param)
             return TemporalExponentialStrategy(base, 10)
@@ -1,11 +1,11 @@
 import altair as alt
 import matplotlib.pyplot as plt
 import networkx as nx
-import numpy as np
-import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
 
+from components.Adjacency import get_links, get_all_pairs, get_linked_pairs, get_binned_adjacency, \
+    DENSE_MAX_NODES, NUM_BINS, GRAPH_IMAGE_MAX_NODES
 from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
 from simulation.IPFS import ipfs
 from simulation.LinkingStrategy import LinkingStrategy
@@ -41,71 +41,47 @@ def policy_visualization():
     operation = StoreOperation(environment, save_to_file=False)
     operation.execute()
 
-    nx_graph = nx.DiGraph()
     first_link, latest_link, _ = ipfs.get_links_to_first_and_latest_nodes(URL)
     start_time: int = operation.get_start_time()
-
-    srcs = np.arange(node_number)
-    dests = np.arange(node_number)
-    xs, ys = np.meshgrid(srcs, dests)
-    xx = np.ravel(xs)
-    yy = np.ravel(ys)
-    df = pd.DataFrame({"Source": xx, "Destination": yy,
-                       "Source Timestamp": np.zeros_like(xx, dtype=np.float64),
-                       "Destination Timestamp": np.zeros_like(xx, dtype=np.float64),
-                       "Linked": np.full_like(xx, "N/A", dtype='<U3')})
-    df.loc[df['Source'] > df['Destination'], 'Linked'] = "No"
-    positions = {}
-    timestamps = {}
-    absolute_timestamps = {}
-    for iparo in ipfs.get_all_iparos(URL):
-        curr_num = iparo.seq_num
-        nx_graph.add_node(curr_num)
-        timestamp = (iparo.timestamp - start_time) / TimeUnit.SECONDS
-        absolute_timestamp = (iparo.timestamp - start_time) / (latest_link.timestamp - start_time)
-        absolute_timestamps[curr_num] = round(absolute_timestamp * 20) / 20
-        for link in iparo.linked_iparos:
-            nx_graph.add_edge(curr_num, link.seq_num)
-            df.loc[(df['Destination'] == link.seq_num) & (df['Source'] == curr_num), "Linked"] = "Yes"
-            df.loc[df['Destination'] == link.seq_num, 'Destination Timestamp'] = \
-                (link.timestamp - start_time) / TimeUnit.SECONDS
-        df.loc[df['Source'] == curr_num, 'Source Timestamp'] = timestamp
-        timestamps[curr_num] = timestamp
-    height = 0
-    for iparo in ipfs.get_all_iparos(URL):
-        seq_num = iparo.seq_num
-        index = 0
-        curr_num = seq_num - 1
-        while curr_num >= 0 and absolute_timestamps[curr_num] == absolute_timestamps[seq_num]:
-            index += 1
-            curr_num -= 1
-        if height < index + 1:
-            height = index + 1
-        positions[seq_num] = (absolute_timestamps[seq_num], index)
-    df = df.assign(Relationship=np.where(np.ravel(xx == yy), "Self", "Linked"))
-    df.loc[(df['Linked'] != 'Yes') & (df['Relationship'] != 'Self'), 'Relationship'] = 'None'
+    iparos = ipfs.get_all_iparos(URL)
+    matrix, timestamps = get_links(iparos, start_time)
+    is_binned = node_number > DENSE_MAX_NODES
     st.title("Graph Visualization")
     max_time = (latest_link.timestamp - start_time) / TimeUnit.SECONDS
     tabs = st.tabs(["Plots", "Graph Image"])
 
     with tabs[0]:
         st.header("Adjacency Matrix")
-        df.loc[df['Relationship'] == 'Self', 'Destination Timestamp'] = df.loc[
-            df['Relationship'] == 'Self', 'Source Timestamp']
-        chart_seq_num = alt.Chart(df,
-                                  title=alt.TitleParams(f'Adjacency Matrix - {policy} - {node_number} Nodes, {density}',
-                                                        anchor='middle')
-                                  ).mark_rect().encode(
-            x=alt.X("Destination:O", title="Destination Node"),
-            y=alt.Y("Source:O", title="Source Node"),
-            color=alt.Color("Linked:N", scale=alt.Scale(domain=['N/A', "Yes", "No"], range=['gray', 'lime', 'red']))
-        )
+        title = alt.TitleParams(f'Adjacency Matrix - {policy} - {node_number} Nodes, {density}', anchor='middle')
+        if is_binned:
+            st.text(f"Since there are more than {DENSE_MAX_NODES} nodes, the nodes are grouped into {NUM_BINS} bins "
+                    f"of consecutive nodes, and each cell shows the fraction of the pairs of nodes that are linked.")
+            chart_seq_num = alt.Chart(get_binned_adjacency(matrix), title=title).mark_rect().encode(
+                x=alt.X("Destination Start:O", title="Destination Node (Start of Bin)"),
+                y=alt.Y("Source Start:O", title="Source Node (Start of Bin)"),
+                color=alt.Color("Linked Fraction:Q", scale=alt.Scale(scheme="viridis")),
+                tooltip=["Source Start:Q", "Source End:Q", "Destination Start:Q", "Destination End:Q",
+                         alt.Tooltip("Links:Q", format=","), alt.Tooltip("Pairs:Q", format=","),
+                         alt.Tooltip("Linked Fraction:Q", format=".3f")]
+            )
+        else:
+            df = get_all_pairs(matrix, timestamps)
+            chart_seq_num = alt.Chart(df, title=title).mark_rect().encode(
+                x=alt.X("Destination:O", title="Destination Node"),
+                y=alt.Y("Source:O", title="Source Node"),
+                color=alt.Color("Linked:N", scale=alt.Scale(domain=['N/A', "Yes", "No"],
+                                                            range=['gray', 'lime', 'red']))
+            )
         st.altair_chart(chart_seq_num)
         st.header("Time Graph")
         st.text("Note that the source and destination timestamps are relative to the absolute minimum, or the first "
                 "timestamp in the case of a multipeak distribution.")
+        if is_binned:
+            st.text(f"Since there are more than {DENSE_MAX_NODES} nodes, only the linked pairs of nodes are shown.")
+            df_display = get_linked_pairs(matrix, timestamps)
+        else:
+            df_display = df.loc[df['Source'] >= df['Destination']]
         tabs2 = st.tabs(['Graph', 'Data'])
-        df_display = df.loc[df['Source'] >= df['Destination']]
         with tabs2[0]:
             st.markdown("**Note**: Saving the chart requires the `vl-convert-python` dependency. To install, "
                         "please use this command:"
@@ -116,7 +92,7 @@ def policy_visualization():
                                    ).mark_circle().encode(
                 x=alt.X("Destination Timestamp:Q", title="Destination Timestamp (Seconds)",
                         scale=alt.Scale(domain=[0, max(1000, max_time)])),
-                y=alt.Y("Source:O", title="Sequence Number of Source Node"),
+                y=alt.Y("Source:Q" if is_binned else "Source:O", title="Sequence Number of Source Node"),
                 color=alt.Color("Relationship:O", title="Node Relationship",
                                 scale=alt.Scale(domain=["Self", "Linked", "None"],
                                                 range=["orange", "blue", "gray"]),
@@ -133,6 +109,29 @@ def policy_visualization():
 
     with tabs[1]:
         st.header("Graph Image")
+        if node_number > GRAPH_IMAGE_MAX_NODES:
+            st.info(f"The graph image is only drawn for up to {GRAPH_IMAGE_MAX_NODES} nodes.")
+            return
+        nx_graph = nx.DiGraph()
+        positions = {}
+        absolute_timestamps = {}
+        for iparo in iparos:
+            curr_num = iparo.seq_num
+            nx_graph.add_node(curr_num)
+            nx_graph.add_edges_from((curr_num, link.seq_num) for link in iparo.linked_iparos)
+            absolute_timestamp = (iparo.timestamp - start_time) / (latest_link.timestamp - start_time)
+            absolute_timestamps[curr_num] = round(absolute_timestamp * 20) / 20
+        height = 0
+        for iparo in iparos:
+            seq_num = iparo.seq_num
+            index = 0
+            curr_num = seq_num - 1
+            while curr_num >= 0 and absolute_timestamps[curr_num] == absolute_timestamps[seq_num]:
+                index += 1
+                curr_num -= 1
+            if height < index + 1:
+                height = index + 1
+            positions[seq_num] = (absolute_timestamps[seq_num], index)
         fig, ax = plt.subplots()
         nx.draw_networkx_nodes(nx_graph, positions, ax=ax)
         nx.draw_networkx_labels(nx_graph, positions, ax=ax, font_color="white")
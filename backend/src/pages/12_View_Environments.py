@@ -38,7 +38,7 @@ def view_environments():
     st.title("View Environments")
     st.markdown("Note that each key will be considered as part of the file name. "
                 "In fact, the file structure is `[Policy Group]/[Policy Param Key]/"
-                "[Volume]-[Density Key]-[Operation Shorthand].csv`")
+                "[Volume]-[Density Key]-[Operation Shorthand].npz`")
     st.header("Policies")
     policy_list = [[policy, group, param_key, arg, False]
                    for arg, policy, group, param_key in ss['policies']]
@@ -87,15 +87,39 @@ def view_environments():
     }, num_rows="dynamic")
 
     st.header("Other Settings")
-    st.text("For parallel execution, please refer to the command-line application and the bash script for it.")
+    st.text("Each policy, version density and version volume is simulated as a background job, with as many jobs "
+            "running at once as there are CPU cores.")
     ss['iterations'] = st.number_input("Number of Iterations", min_value=1, value=10,
                                        help="Number of iterations for each operation besides the store operation. "
                                             "Number of iterations for the store operation are only affected by the "
                                             "version volume.")
+    ss['ci_width'] = st.number_input("Target Width of the Confidence Interval", min_value=0.0, value=0.0,
+                                     step=0.01,
+                                     help="If this is more than 0, each operation besides the store operation "
+                                          "keeps iterating until the 95% confidence interval of its mean number "
+                                          "of IPFS retrieves is at most this fraction of the mean wide, so noisy "
+                                          "operations run more iterations and deterministic ones stop after the "
+                                          "minimum number of iterations. The number of iterations above is then "
+                                          "not used.")
+    ss['min_iterations'] = st.number_input("Minimum Number of Iterations", min_value=1, value=3,
+                                           disabled=not ss['ci_width'],
+                                           help="The minimum number of iterations of each operation when the "
+                                                "target width of the confidence interval is set.")
+    ss['max_iterations'] = st.number_input("Maximum Number of Iterations", min_value=ss['min_iterations'],
+                                           value=max(1000, ss['min_iterations']), disabled=not ss['ci_width'],
+                                           help="The maximum number of iterations of each operation when the "
+                                                "target width of the confidence interval is set.")
+    ss["summary_only"] = st.checkbox("Only Save Summaries",
+                                     help="Saves only the summary of the iterations of each operation besides the "
+                                          "store operation, which takes much less memory and disk space for many "
+                                          "iterations, but leaves these operations out of the iteration-level "
+                                          "analysis.")
     ss["recompute_storage"] = st.checkbox("Recompute 'Add Node' Costs",
                                           help="Recomputing 'Add Node' costs will make the average storage cost "
                                                "more reliable but requires a lot more time.")
     ss["verbose"] = st.checkbox("Verbose", help="Add debugging output to the console.")
+    ss["profile"] = st.checkbox("Profile", help="Saves a cProfile profile of each operation next to the results, "
+                                                "which shows where the time is spent, at the cost of a slower run.")
     # ss['parallel'] = st.checkbox("Allow Parallel Computation", help="Allows a multiprocessing pool to expedite the "
     #                                                                 "simulation process. However, this may come with "
     #                                                                 "the risk of using up more memory.")
@@ -1,44 +1,103 @@
 import os
 
+import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
 
 from components.utils import RESULTS_FOLDER
-from simulation.CommandLineParser import CommandLineParser
-from simulation.CommandLineValidator import validator
-from simulation.IPAROSimulation import IPAROSimulation
-from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
-from simulation.Operation import reset
+from simulation.JobExecutor import JobExecutor, JobTable, JobStatus, JOB_TABLE_NAME, FINISHED_STATUSES
 
-if __name__ == '__main__':
-    if 'simulate' not in ss:
-        st.switch_page("pages/12_View_Environments.py")
+# The time between two refreshes of the job table, in seconds.
+REFRESH_INTERVAL = 1
+
+
+@st.cache_resource
+def get_job_executor() -> JobExecutor:
+    """
+    Gets the job executor, which is shared by every session and keeps running between reruns.
+    """
+    os.makedirs(RESULTS_FOLDER, exist_ok=True)
+    return JobExecutor(JobTable(str(RESULTS_FOLDER / JOB_TABLE_NAME)))
 
-    del ss['simulate']
-    for policy_args, _, policy_group, subdir in ss['policies']:
+
+def submit_jobs(executor: JobExecutor):
+    """
+    Submits a job for each policy, version density and version volume of the environments.
+    """
+    for policy_args, policy_name, policy_group, subdir in ss['policies']:
         for _, density_row in ss['densities_data'].iterrows():
             for _, v in ss['volume_data'].iterrows():
                 density_key: str = density_row['Version Density Key']
                 density_args = density_row['Command-Line Args']
+                volume = int(v['Chain Length'])
 
-                path = str(os.path.join(RESULTS_FOLDER, policy_group, subdir))
-                raw_args = (f"{policy_args} {density_args} -V {int(v['Chain Length'])} -k {density_key} "
-                            f"-n {ss['iterations']}").split(" ")
+                path = os.path.abspath(os.path.join(RESULTS_FOLDER, policy_group, subdir))
+                raw_args = (f"{policy_args} {density_args} -V {volume} -k {density_key} "
+                            f"-n {ss['iterations']}").split()
+                if ss['ci_width']:
+                    raw_args.extend(['-a', str(ss['ci_width']), '-I', str(ss['min_iterations']), '-N',
+                                     str(ss['max_iterations'])])
+                if ss['summary_only']:
+                    raw_args.append('-Z')
+                if ss['recompute_storage']:
+                    raw_args.append("-S")
                 if ss['verbose']:
                     raw_args.append("-v")
+                if ss['profile']:
+                    raw_args.append("-f")
 
                 raw_args.extend(['-o', path])
-                args = validator.parse_args(raw_args)
-                parser = CommandLineParser(args)
-                policy = parser.parse_policy()
-                volume = parser.parse_volume()
-                operations = parser.parse_operations()
-                density = parser.parse_density()
-                iterations = parser.parse_iterations()
-                verbose = parser.parse_verbosity()
-                output_dir = parser.parse_output_directory().strip()
-                env = IPAROSimulationEnvironment(policy, volume, density, operations, path, verbose,
-                                                 recompute_storage=ss['recompute_storage'], iterations=iterations)
-                sim = IPAROSimulation(env)
-                sim.run()
-                reset(reset_data=True)
+                executor.submit(f"{policy_name} - {density_key} - {volume}", raw_args)
+
+
+@st.fragment(run_every=REFRESH_INTERVAL)
+def display_jobs(executor: JobExecutor):
+    jobs = executor.table.get_jobs()
+    if not jobs:
+        st.info("There are no simulation jobs.")
+        return
+    df = pd.DataFrame({"ID": [job.id for job in jobs], "Name": [job.name for job in jobs],
+                       "Status": [job.status.value for job in jobs],
+                       "Progress": [job.progress * 100 for job in jobs],
+                       "Started": pd.to_datetime([job.started for job in jobs], unit='s'),
+                       "Finished": pd.to_datetime([job.finished for job in jobs], unit='s'),
+                       "Message": [job.message for job in jobs]})
+    num_active = sum(job.status not in FINISHED_STATUSES for job in jobs)
+    st.text(f"{num_active} of {len(jobs)} jobs are queued or running, with up to {executor.max_workers} at once.")
+    st.dataframe(df, hide_index=True, column_config={
+        "Progress": st.column_config.ProgressColumn(min_value=0, max_value=100, format="%.0f%%")
+    })
+
+    columns = st.columns(3)
+    active_ids = [job.id for job in jobs if job.status not in FINISHED_STATUSES]
+    retry_ids = [job.id for job in jobs if job.status in FINISHED_STATUSES - {JobStatus.DONE}]
+    with columns[0]:
+        cancelled_ids = st.multiselect("Jobs to Cancel", active_ids)
+        if st.button("Cancel Jobs", disabled=not cancelled_ids):
+            for job_id in cancelled_ids:
+                executor.cancel(job_id)
+    with columns[1]:
+        retried_ids = st.multiselect("Jobs to Retry", retry_ids)
+        if st.button("Retry Jobs", disabled=not retried_ids):
+            for job_id in retried_ids:
+                executor.retry(job_id)
+    with columns[2]:
+        if st.button("Clear Finished Jobs"):
+            executor.table.remove_finished_jobs()
+
+
+def simulation_writer_output():
+    executor = get_job_executor()
+    if 'simulate' in ss:
+        del ss['simulate']
+        submit_jobs(executor)
+    st.title("Simulation Jobs")
+    st.text("The simulations run in the background, so they keep running if this page is closed. The results of "
+            "each operation show up in the report pages as soon as they are saved.")
+    display_jobs(executor)
+    if st.button("Add Simulations"):
+        st.switch_page("pages/12_View_Environments.py")
+
+
+if __name__ == '__main__':
+    simulation_writer_output()
@@ -13,7 +13,7 @@ def cost_density_map():
     scale = ss['scale']
     log_scale = ss['log_scale']
     partial_summaries = []
-    for density in DENSITIES:
+    for density in get_densities():
         partial_summary: pd.Series = get_summary_data(ss['selected_policies'], density, "Store", scale,
                                               [Action.LINKS], 'mean')
         partial_summary_df = pd.DataFrame({"Mean": partial_summary, "Density": partial_summary.map(lambda x: density)})
@@ -28,7 +28,7 @@ def cost_density_map():
     for op in OP_TYPES:
         st.subheader(OP_NAMES[op])
         partial_summaries = []
-        for density in DENSITIES:
+        for density in get_densities():
             partial_summary: pd.Series = get_summary_data(ss['selected_policies'], density, op, scale,
                                                           [Action.IPFS_RETRIEVE], 'mean')
             partial_summary_df = pd.DataFrame(
@@ -10,7 +10,7 @@ def cost_calculator():
     if 'density' not in ss:
         st.switch_page("pages/2_General_Settings.py")
 
-    policies = pd.DataFrame([[policy, param] for policy, param in POLICY_GROUP_COMBINATIONS],
+    policies = pd.DataFrame([[policy, param] for policy, param in get_policy_group_combinations()],
                             columns=["Group", "Param"])
 
     density = ss['density']
@@ -30,6 +30,9 @@ def cost_calculator():
         ipfs_store_time = st.number_input("IPFS Store Time (Nanoseconds)", min_value=0, value=800)
         ipns_get_time = st.number_input("IPNS Get Time (Nanoseconds)", min_value=0, value=1000)
         ipns_update_time = st.number_input("IPNS Update Time (Nanoseconds)", min_value=0, value=1000)
+        transfer_time = st.number_input("IPFS Transfer Time (Nanoseconds Per Byte Retrieved)", min_value=0.0,
+                                        value=0.0, help="Results that were generated before bytes were "
+                                                        "recorded have no transfer time.")
         st.subheader("Retrieve Operation Counts")
         list_all = st.number_input("List All Count", min_value=0, value=10)
         retrieve_first = st.number_input("Retrieve First Operation Count", min_value=0, value=1000)
@@ -40,7 +43,8 @@ def cost_calculator():
         partial_dfs = []
         for op in OP_NAMES:
             partial_df = pd.DataFrame(get_summary_data(policies, operation=op, density=density, scales=[scale],
-                                                       actions=RETRIEVE_ACTION_LIST.copy(), agg_func='mean'))
+                                                       actions=RETRIEVE_ACTION_LIST + [Action.BYTES_RETRIEVED],
+                                                       agg_func='mean')).fillna(0)
             partial_df = partial_df.assign(Operation=op).reset_index().drop(columns='Scale').rename(
                 columns={'mean': 'Mean Time'})
             partial_dfs.append(partial_df)
@@ -58,7 +62,8 @@ def cost_calculator():
     tabs = st.tabs(['Time Cost Per Operation', 'Time Cost Per Operation Data'])
     with tabs[0]:
         # The columns are sorted by action name
-        operation_costs = np.dot(table, np.array([ipfs_retrieve_time, ipfs_store_time, ipns_get_time, ipns_update_time]))
+        operation_costs = np.dot(table, np.array([transfer_time, ipfs_retrieve_time, ipfs_store_time, ipns_get_time,
+                                                  ipns_update_time]))
         operation_costs_long = (pd.DataFrame(operation_costs, index=table.index,
                                              columns=['Time Per Operation (μs)']) / 1000).reset_index()
         operation_costs_long['Operation'] = operation_costs_long['Operation'].replace(OP_NAMES_ABBREVIATED)
@@ -2,8 +2,12 @@ import altair as alt
 import streamlit as st
 from streamlit import session_state as ss
 
+from components.Downsampling import downsample
 from components.utils import *
 
+# The width of the charts, in pixels.
+CHART_WIDTH = 600
+
 
 def resilience_report():
     if 'selected_policies' not in ss:
@@ -17,7 +21,7 @@ def resilience_report():
         st.error("There are too few points to analyze for a volume of 1.")
     else:
         partial_dfs = []
-        for density in DENSITIES:
+        for density in get_densities():
             partial_df = get_summary_data(policies_selected, density, 'Unsafe-List',
                                           [scale], UNSAFE_LIST_ALL_ACTIONS.copy(), analyze_all_iterations=True)
             partial_dfs.append(partial_df)
@@ -27,6 +31,11 @@ def resilience_report():
         with st.expander("Settings"):
             n_points = st.number_input("Number of Points for Moving Average", min_value=1, value=max(1, scale // 10))
             max_x = st.number_input("Maximum Nodes Missing", min_value=0, max_value=scale - 1, value=scale - 1)
+            num_points = st.number_input("Maximum Number of Points Per Density or Policy", min_value=4,
+                                         value=CHART_WIDTH,
+                                         help="The moving averages and the points are reduced to this number "
+                                              "of points before they are charted, keeping the shape of the moving "
+                                              "averages and the range of the points. The data is never reduced.")
         st.header("By Density")
         for name in ss['policy_names']:
             st.subheader(name)
@@ -43,10 +52,13 @@ def resilience_report():
             'Percent Reachable (Moving Average)'] = rolling_average
             tabs = st.tabs(['Chart', 'Data'])
             with tabs[0]:
-                base = alt.Chart(data.loc[data['Missing Nodes'] <= max_x, :]
-                                 ).encode(x=alt.X("Missing Nodes:Q",
-                                                  scale=alt.Scale(type='linear', domain=[0, max_x])))
-                chart = (base.mark_line().encode(
+                shown_data = data.loc[data['Missing Nodes'] <= max_x, :]
+                x = alt.X("Missing Nodes:Q", scale=alt.Scale(type='linear', domain=[0, max_x]))
+                line_base = alt.Chart(downsample(shown_data, 'Missing Nodes', 'Percent Reachable (Moving Average)',
+                                                 num_points, by=['Density'])).encode(x=x)
+                base = alt.Chart(downsample(shown_data, 'Missing Nodes', 'Percent Reachable', num_points,
+                                            by=['Density'], method='min-max')).encode(x=x)
+                chart = (line_base.mark_line().encode(
                     y=alt.Y("Percent Reachable (Moving Average):Q",
                             title="Percent Reachable"),
                     color=alt.Color('Density:O', scale=alt.Scale(scheme=COLOR_SCHEME)))
@@ -57,7 +69,7 @@ def resilience_report():
                                             legend=alt.Legend(title="Density", symbolOpacity=1, symbolType='stroke')),
                             opacity=alt.value(0.05)
                         )).configure_legend(labelLimit=400
-                                            ).properties(title=title, height=400, width=600)
+                                            ).properties(title=title, height=400, width=CHART_WIDTH)
                 st.altair_chart(chart)
             with tabs[1]:
                 st.dataframe(data[['Missing Nodes', 'Percent Reachable', 'Percent Reachable (Moving Average)']],
@@ -69,10 +81,13 @@ def resilience_report():
         df_density = df.loc[df['Density'] == density]
         tabs = st.tabs(['Chart', 'Data'])
         with tabs[0]:
-            base = alt.Chart(df_density.loc[df_density['Missing Nodes'] <= max_x, :]
-                             ).encode(x=alt.X("Missing Nodes:Q",
-                                              scale=alt.Scale(type='linear', domain=[0, max_x])))
-            chart = (base.mark_line().encode(
+            shown_data = df_density.loc[df_density['Missing Nodes'] <= max_x, :]
+            x = alt.X("Missing Nodes:Q", scale=alt.Scale(type='linear', domain=[0, max_x]))
+            line_base = alt.Chart(downsample(shown_data, 'Missing Nodes', 'Percent Reachable (Moving Average)',
+                                             num_points, by=['Policy'])).encode(x=x)
+            base = alt.Chart(downsample(shown_data, 'Missing Nodes', 'Percent Reachable', num_points,
+                                        by=['Policy'], method='min-max')).encode(x=x)
+            chart = (line_base.mark_line().encode(
                 y=alt.Y("Percent Reachable (Moving Average):Q",
                         title="Percent Reachable"),
                 color=alt.Color('Policy:O', scale=alt.Scale(scheme=COLOR_SCHEME)))
@@ -83,7 +98,7 @@ def resilience_report():
                                         legend=alt.Legend(title="Policy", symbolOpacity=1, symbolType='stroke')),
                         opacity=alt.value(0.05)
                     )).configure_legend(labelLimit=400
-                                        ).properties(title=title, height=400, width=600)
+                                        ).properties(title=title, height=400, width=CHART_WIDTH)
             st.altair_chart(chart)
         with tabs[1]:
             st.dataframe(df[['Missing Nodes', 'Percent Reachable', 'Percent Reachable (Moving Average)']],
@@ -1,6 +1,7 @@
 import streamlit as st
 from streamlit import session_state as ss
 
+from components.GrowthModels import EXTRAPOLATION_VOLUMES, predict_costs
 from components.Heatmap import Heatmap
 from components.utils import *
 
@@ -14,21 +15,22 @@ def policy_growth_rate():
 
     st.title("Cost Map")
     log_scale = ss['log_scale']
+    volumes = st.multiselect("Predicted Volumes", [10 ** i for i in range(1, 9)], EXTRAPOLATION_VOLUMES,
+                             help="The mean costs at these volumes are predicted with the growth law that fits "
+                                  "the measured volumes of each policy best. Volumes that were measured are not "
+                                  "predicted.")
+    predicted_volumes = sorted(volume for volume in volumes if volume not in get_scales())
     partial_dfs = []
-    for op in OP_NAMES_ABBREVIATED:
-        partial_df = pd.DataFrame({'Mean':
-                                       get_summary_data(policies_selected, 'Uniform', op,
-                                                        SCALES.copy(), agg_func='mean'),
-                                   'Operation': op})
-        partial_df['Operation'] = partial_df['Operation'].replace(OP_NAMES_ABBREVIATED) + ' - IPFS Retrieves'
-        partial_dfs.append(partial_df)
-
-    partial_df = pd.DataFrame({'Mean':
-                                   get_summary_data(policies_selected, 'Uniform', 'Store',
-                                                    SCALES.copy(), actions=[Action.LINKS], agg_func='mean'),
-                               'Operation': 'Add Node - Links'})
-    partial_dfs.append(partial_df)
-    df = pd.concat(partial_dfs).reset_index()
+    operations = [(op, [Action.IPFS_RETRIEVE], OP_NAMES_ABBREVIATED[op] + ' - IPFS Retrieves')
+                  for op in OP_NAMES_ABBREVIATED]
+    operations.append(('Store', [Action.LINKS], 'Add Node - Links'))
+    for op, actions, operation_name in operations:
+        summary = get_summary_data(policies_selected, 'Uniform', op, get_scales(), actions=actions)
+        measured = summary.reset_index(drop=True).rename(columns={'mean': 'Mean'})
+        predicted = predict_costs(summary, predicted_volumes).astype({'Scale': int})
+        for partial_df in (measured, predicted):
+            partial_dfs.append(partial_df[['Policy', 'Scale', 'Mean']].assign(Operation=operation_name))
+    df = pd.concat(partial_dfs, ignore_index=True)
 
     df_policies = dict(tuple(df.groupby('Policy')))
     for name, df in df_policies.items():
@@ -36,6 +38,8 @@ def policy_growth_rate():
         heatmap = Heatmap(df, 'Scale:O', 'Operation:O', 'Mean:Q',
                           'Number of Actions Required',
                           f'{name} - {density}', log_scale=log_scale)
+        if predicted_volumes:
+            st.caption(f"The mean costs at the volumes {', '.join(map(str, predicted_volumes))} are predicted.")
         heatmap.display()
 
 
@@ -1,7 +1,7 @@
 import streamlit as st
 from streamlit import session_state as ss
 
-from components.utils import DENSITIES, SCALES
+from components.utils import get_densities, get_scales
 
 
 def general_settings():
@@ -10,10 +10,10 @@ def general_settings():
     with st.form("form"):
         st.header("Filter Settings")
         st.subheader("Version Density Settings")
-        density = st.selectbox("Density", DENSITIES, help="Version density to be displayed.")
+        density = st.selectbox("Density", get_densities(), help="Version density to be displayed.")
         st.subheader("Version Volume Settings")
-        scale = st.selectbox("Version Volume", SCALES, help="The chain length (in number of IPAROs), to "
-                                                            "be used for the Cost Map")
+        scale = st.selectbox("Version Volume", get_scales(), help="The chain length (in number of IPAROs), to "
+                                                                   "be used for the Cost Map")
 
         st.subheader("Graph Display Settings")
         log_scale = st.checkbox("Logarithmic Scale", help="Use logarithmic scale on both the X-axis and "
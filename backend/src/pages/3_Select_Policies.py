@@ -12,8 +12,8 @@ def select_policies():
     st.text("Before accessing any report page, please select the policies to use. You may "
             "select 1 to 10 policies.")
     error_message = st.empty()
-    groups = POLICY_GROUPS.keys()
-    lists = pd.DataFrame([[policy, param, False] for policy, param in POLICY_GROUP_COMBINATIONS],
+    groups = get_policy_groups().keys()
+    lists = pd.DataFrame([[policy, param, False] for policy, param in get_policy_group_combinations()],
                          columns=["Group", "Param", "Used"])
     with st.form('policy_group_form'):
         st.markdown("### Step 1: Select Policy Groups")
@@ -2,7 +2,7 @@ import streamlit as st
 from streamlit import session_state as ss
 
 from components.LayeredBoxPlot import LayeredBoxPlot
-from components.utils import Action, get_summary_data, OP_TYPES
+from components.utils import Action, get_summary_data, OP_TYPES, RETRIEVE_ACTION_LIST
 
 
 def summary_report():
@@ -16,7 +16,7 @@ def summary_report():
         ctr = st.container()
         policies = ss['selected_policies']
         density = ss['density']
-        actions = [action for action in Action if action != Action.LINKS]
+        actions = RETRIEVE_ACTION_LIST.copy()
         scale = ss['scale']
         if operation == 'Store':
             actions.append(Action.LINKS)
@@ -38,18 +38,31 @@ def spacetime_tradeoff():
         policies_selected = ss['selected_policies']
         n_policies_selected = len(ss['policy_names'])
         scale_type: Literal['identity', 'symlog'] = 'symlog' if log_scale else 'identity'
+        in_bytes = st.toggle("Measure in bytes", help="Measures the storage in bytes stored per IPARO and the "
+                                                      "retrieval in bytes retrieved, instead of in links and "
+                                                      "retrieve operations.")
+        if in_bytes:
+            storage_action, retrieval_action = Action.BYTES_STORED, Action.BYTES_RETRIEVED
+            storage_name, retrieval_name = "IPFS Bytes Stored Per IPARO", "IPFS Bytes Retrieved"
+        else:
+            storage_action, retrieval_action = Action.LINKS, Action.IPFS_RETRIEVE
+            storage_name, retrieval_name = "IPFS Links Per IPARO", "IPFS Retrieves"
+        nth_name, time_name = f"{retrieval_name} (Nth)", f"{retrieval_name} (Time)"
         df1 = get_summary_data(policies_selected, density, 'Store', scale,
-                               [Action.LINKS], agg_func='mean')
-        df1.name = "IPFS Links Per IPARO"
+                               [storage_action], agg_func='mean')
+        df1.name = storage_name
         df2 = get_summary_data(policies_selected, density, 'Nth', scale,
-                               [Action.IPFS_RETRIEVE], agg_func='mean')
-        df2.name = "IPFS Retrieves (Nth)"
+                               [retrieval_action], agg_func='mean')
+        df2.name = nth_name
         df3 = get_summary_data(policies_selected, density, 'Time', scale,
-                               [Action.IPFS_RETRIEVE], agg_func='mean')
-        df3.name = "IPFS Retrieves (Time)"
+                               [retrieval_action], agg_func='mean')
+        df3.name = time_name
         df_combined = pd.concat([df1, df2, df3], axis=1)
+        if in_bytes and df_combined.isna().any(axis=None):
+            st.warning("Some results were generated before bytes were recorded, so they are not shown.")
+            df_combined = df_combined.dropna()
         df = df_combined.reset_index()
-        df_long = df.melt(['Policy', 'IPFS Links Per IPARO'])
+        df_long = df.melt(['Policy', storage_name])
         st.header("Space-Time Tradeoff")
         tabs = st.tabs(["Scatterplot Results 📈", "Scatterplot Data 🔢"])
         with tabs[0]:
@@ -57,10 +70,10 @@ def spacetime_tradeoff():
                                                              f"Performance - Mean",
                                                              align='center', anchor="middle",
                                                              fontSize=20)).mark_point().encode(
-                x=alt.X("IPFS Links Per IPARO:Q", title="IPFS Links Per IPARO").scale(type=scale_type),
+                x=alt.X(f"{storage_name}:Q", title=storage_name).scale(type=scale_type),
                 color=alt.Color("Policy:O", legend=alt.Legend(labelLimit=400),
                                 scale=alt.Scale(scheme=COLOR_SCHEME)),
-                y=alt.Y("value:Q", title="IPFS Retrieve Operations").scale(type=scale_type),
+                y=alt.Y("value:Q", title=retrieval_name).scale(type=scale_type),
                 shape="variable:O",
                 opacity=alt.value(0.5)).properties(width=600, height=300 + 20 * len(policies_selected))
             st.altair_chart(chart)
@@ -72,28 +85,28 @@ def spacetime_tradeoff():
                 "(in IPFS link traversals) and the mean amount of storage space.")
         st.subheader("Retrieval by Time")
         tabs_ranked_time = st.tabs(["Ranked Results 🏆", "Ranking Data 🔢"])
-        df_ranked = df_long.assign(Tradeoff=lambda x: x['IPFS Links Per IPARO'] * x.value
+        df_ranked = df_long.assign(Tradeoff=lambda x: x[storage_name] * x.value
                                    ).sort_values('Tradeoff')
         with tabs_ranked_time[0]:
-            df_ranked_time: pd.DataFrame = df_ranked.loc[df_ranked.variable == "IPFS Retrieves (Time)"]
+            df_ranked_time: pd.DataFrame = df_ranked.loc[df_ranked.variable == time_name]
             display_chart(df_ranked_time, n_policies_selected,
                           "Retrieval by Time", scale_type)
         with tabs_ranked_time[1]:
             display_df_time = rank_and_sort_tradeoff(df_ranked_time)
             display_df_time = display_df_time.drop(columns=["variable"]
-                                                   ).rename(columns={"value": "IPFS Retrieves (Nth)"}
+                                                   ).rename(columns={"value": time_name}
                                                             ).set_index(["Policy"])
             st.dataframe(display_df_time)
         st.subheader("Retrieval by Sequence Number")
         tabs_ranked_nth = st.tabs(["Ranked Results 🏆", "Ranking Data 🔢"])
         with tabs_ranked_nth[0]:
-            df_ranked_nth: pd.DataFrame = df_ranked.loc[df_ranked.variable == "IPFS Retrieves (Nth)"]
+            df_ranked_nth: pd.DataFrame = df_ranked.loc[df_ranked.variable == nth_name]
             display_chart(df_ranked_nth, n_policies_selected,
                           "Sequence Number", scale_type)
         with tabs_ranked_nth[1]:
             display_df_nth = rank_and_sort_tradeoff(df_ranked_nth)
             display_df_nth = display_df_nth.drop(columns=["variable"]
-                                                 ).rename(columns={"value": "IPFS Retrieves (Nth)"}
+                                                 ).rename(columns={"value": nth_name}
                                                           ).set_index(["Policy"])
             st.dataframe(display_df_nth)
     except UnboundLocalError:  # Ignored
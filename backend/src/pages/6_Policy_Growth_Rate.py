@@ -1,12 +1,49 @@
+import altair as alt
+
 from components.CheckboxGroup import CheckboxGroup
+from components.GrowthModels import GROWTH_LAWS, EXTRAPOLATION_VOLUMES, CONFIDENCE_LEVEL, predict_costs
 from components.LayeredBoxPlot import LayeredBoxPlot
 from components.utils import *
 import streamlit as st
 from streamlit import session_state as ss
 
 
-def display_chart(df: pd.DataFrame, title: str, y_title: str, log_scale: bool):
-    tabs = st.tabs(["Results By Scale 📈", "Results by Policy 📈", "Summary Data 🔢"])
+# The name of the setting that picks the growth law that fits each policy best.
+BEST_FIT = "Best Fit"
+# The number of volumes at which the fitted curves are charted.
+NUM_CURVE_POINTS = 50
+
+
+def display_extrapolation(df: pd.DataFrame, title: str, y_title: str, log_scale: bool, law: str | None,
+                          volumes: list[int]):
+    scale_type = "log" if log_scale else "linear"
+    curve_volumes = np.unique(np.concatenate((np.geomspace(df['Scale'].min(), max(volumes), NUM_CURVE_POINTS),
+                                              volumes))).round()
+    curves = predict_costs(df, curve_volumes, law)
+    if curves.empty:
+        st.warning("There are too few volumes to fit the growth laws.")
+        return
+    x = alt.X("Scale:Q", title="Volume", scale=alt.Scale(type="log"))
+    y_scale = alt.Scale(type=scale_type)
+    color = alt.Color("Policy:N", scale=alt.Scale(scheme=COLOR_SCHEME))
+    curve_base = alt.Chart(curves).encode(x=x, color=color)
+    chart = (curve_base.mark_area(opacity=0.2).encode(y=alt.Y("Lower:Q", title=y_title, scale=y_scale),
+                                                      y2="Upper:Q")
+             + curve_base.mark_line().encode(y=alt.Y("Mean:Q", scale=y_scale),
+                                             tooltip=["Policy", "Law", "Scale", "Mean", "Lower", "Upper"])
+             + alt.Chart(df.reset_index(drop=True)).mark_circle(size=60).encode(
+                x=x, y=alt.Y("mean:Q", scale=y_scale), color=color)
+             ).properties(title=title, height=400, width=600)
+    st.altair_chart(chart)
+    st.caption(f"The lines are the fitted growth laws, the bands are their {CONFIDENCE_LEVEL:.0%} confidence "
+               f"intervals of the mean, and the points are the measured means.")
+    predictions = predict_costs(df, volumes, law)
+    st.dataframe(predictions.astype({'Scale': int}).set_index(['Policy', 'Scale']))
+
+
+def display_chart(df: pd.DataFrame, title: str, y_title: str, log_scale: bool, law: str | None,
+                  volumes: list[int]):
+    tabs = st.tabs(["Results By Scale 📈", "Results by Policy 📈", "Summary Data 🔢", "Extrapolation 🔮"])
     display_index = ['Policy', 'Scale', 'Density']
     with tabs[0]:
         plot1 = LayeredBoxPlot(df, title, y_title,
@@ -18,6 +55,8 @@ def display_chart(df: pd.DataFrame, title: str, y_title: str, log_scale: bool):
         plot2.display()
     with tabs[2]:
         st.dataframe(df.set_index(display_index))
+    with tabs[3]:
+        display_extrapolation(df, title, y_title, log_scale, law, volumes)
 
 
 def policy_growth_rate():
@@ -32,20 +71,27 @@ def policy_growth_rate():
     store_df: pd.DataFrame = get_summary_data(policies_selected, density,
                                               "Store", actions=[Action.LINKS])
     store_retrievals_df: pd.DataFrame = get_summary_data(policies_selected, density, "Store")
+    with st.expander("Extrapolation Settings"):
+        law = st.selectbox("Growth Law", [BEST_FIT, *GROWTH_LAWS],
+                           help="The growth law that is fitted to the mean costs of each policy. The best fit "
+                                "is the law with the lowest Bayesian information criterion.")
+        law = None if law == BEST_FIT else law
+        volumes = st.multiselect("Predicted Volumes", [10 ** i for i in range(1, 9)], EXTRAPOLATION_VOLUMES)
+        volumes = sorted(volumes) or EXTRAPOLATION_VOLUMES
     st.header("Storage")
     st.subheader("Link Storage Memory Performance")
     display_chart(store_df, "IPFS Storage Memory Performance", "Number of Links Per IPARO",
-                  log_scale)
+                  log_scale, law, volumes)
     st.subheader("IPFS Storage Time Performance")
     display_chart(store_retrievals_df, "IPFS Storage Time Performance", "Number of IPFS Retrieves",
-                  log_scale)
+                  log_scale, law, volumes)
     st.header("Retrieval")
     st.subheader("Retrieval by Time")
     display_chart(time_retrieval_df, "IPFS Time Retrieval Performance", "Number of IPFS Retrieves",
-                  log_scale)
+                  log_scale, law, volumes)
     st.subheader("Retrieval by Nth")
     display_chart(nth_retrieval_df, "IPFS Nth Retrieval Performance", "Number of IPFS Retrieves",
-                  log_scale)
+                  log_scale, law, volumes)
 
 
 if __name__ == '__main__':
@@ -14,9 +14,13 @@ def cost_map():
     scale = ss['scale']
     log_scale = ss['log_scale']
     density = ss['density']
+    in_bytes = st.toggle("Measure in bytes", help="Measures the storage in bytes stored per IPARO and the "
+                                                  "retrieval in bytes stored and retrieved, instead of in links "
+                                                  "and action counts.")
+    storage_title = "Mean Bytes Stored Per IPARO" if in_bytes else "Mean Storage Link Count"
 
     summary: pd.Series = get_summary_data(ss['selected_policies'], density, "Store", scale,
-                                          [Action.LINKS], 'mean')
+                                          [Action.BYTES_STORED if in_bytes else Action.LINKS], 'mean')
 
     summary_df = summary.reset_index().rename(columns={'mean': 'Mean'})
 
@@ -41,7 +45,7 @@ def cost_map():
                 power += 1
         chart_storage = (alt.Chart(summary_df, title=title).mark_bar().encode(
             x=alt.X('Mean:Q'),
-            y=alt.Y('Policy:O', title="Mean Storage Link Count",
+            y=alt.Y('Policy:O', title=storage_title,
                     scale=alt.Scale(type="symlog"),
                     axis=alt.Axis(values=y_axis_values)))
                          .configure_axis(labelFontSize=16, labelColor='black', titleColor='black', titleFontSize=16)
@@ -49,7 +53,7 @@ def cost_map():
                          .configure_legend(labelLimit=400).properties(height=500))
     else:
         chart_storage = (alt.Chart(summary_df, title=title).mark_bar().encode(
-            x=alt.X('Mean:Q', title="Mean Storage Link Count"),
+            x=alt.X('Mean:Q', title=storage_title),
             y=alt.Y('Policy:O')).configure_axisX(labelLimit=400).configure_axisY(labelLimit=400)
                          .configure_axis(labelFontSize=16, labelColor='black', titleColor='black',
                                          titleFontSize=16)).properties(height=500)
@@ -58,18 +62,19 @@ def cost_map():
     with tabs[0]:
         st.altair_chart(chart_storage)
     with tabs[1]:
-        st.dataframe(summary_df.rename(columns={"Mean": "Mean Link Count"}), hide_index=True)
+        st.dataframe(summary_df.rename(columns={"Mean": storage_title}), hide_index=True)
 
     st.header("Time Requirements")
     for op in OP_TYPES:
         st.subheader(OP_NAMES[op])
+        actions = BYTES_ACTION_LIST.copy() if in_bytes else RETRIEVE_ACTION_LIST.copy()
         summary: pd.DataFrame = get_summary_data(ss['selected_policies'], density, op, [scale],
-                                                 RETRIEVE_ACTION_LIST.copy(), 'mean'
-                                                 ).reset_index()
+                                                 actions, 'mean').reset_index()
         summary_df = summary.reset_index().drop(columns=["index"]
                                                 ).rename(columns={'mean': 'Mean'})
         map = Heatmap(summary_df, "Action:O", "Policy:O", "Mean:Q",
-                      title=f"Mean Action Counts for {OP_NAMES[op]}", subtitle=f"{density} - Chain Length {scale}",
+                      title=f"Mean {'Byte' if in_bytes else 'Action'} Counts for {OP_NAMES[op]}",
+                      subtitle=f"{density} - Chain Length {scale}",
                       log_scale=log_scale)
         map.display()
 
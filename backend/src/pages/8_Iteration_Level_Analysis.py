@@ -5,7 +5,11 @@ import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
 
-from components.utils import OP_TYPES, get_summary_data, Action, ACTION_LIST, COLOR_SCHEME
+from components.Downsampling import downsample, DOWNSAMPLING_METHOD_NAMES
+from components.utils import OP_TYPES, get_summary_data, Action, ACTION_LIST, RETRIEVE_ACTION_LIST, COLOR_SCHEME
+
+# The width of each faceted chart, in pixels.
+CHART_WIDTH = 200
 
 
 def iteration_level_analysis():
@@ -16,16 +20,27 @@ def iteration_level_analysis():
     st.markdown("**Warning**: The iteration-level analysis may take longer than the summary-level analysis since up "
                 "to 10000 data points may be analyzed as opposed to roughly 8 for summary-level for each operation, "
                 "especially for the Store action.")
-    bar = st.empty()
-    st.header("Results")
     density = ss['density']
     log_scale = ss['log_scale']
     scale = ss['scale']
+    with st.expander("Chart Settings"):
+        st.text("Each line is reduced to a number of points before it is charted, which is the width of the "
+                "charts by default. To see more details, narrow down the iterations or increase the number of "
+                "points. The iteration data is never reduced.")
+        num_points = st.number_input("Maximum Number of Points Per Line", min_value=3, value=CHART_WIDTH)
+        method = st.selectbox("Downsampling Method", DOWNSAMPLING_METHOD_NAMES.keys(),
+                              format_func=DOWNSAMPLING_METHOD_NAMES.get,
+                              help="Largest Triangle Three Buckets keeps the shape of each line, whereas the "
+                                   "minimum and maximum per bucket keep the range of its values.")
+        # A slider needs a range, so a single iteration is always shown.
+        min_iteration, max_iteration = st.slider("Iterations", 1, scale, (1, scale)) if scale > 1 else (1, 1)
+    bar = st.empty()
+    st.header("Results")
     scale_type: Literal['identity', 'symlog'] = 'symlog' if log_scale else 'identity'
     for i, op_type in enumerate(OP_TYPES):
         bar.progress(i / 6, text=f"Gathering data. Please wait... ({5 * i} / 30)")
         st.subheader(op_type)
-        actions = [action for action in Action if action != Action.LINKS]
+        actions = RETRIEVE_ACTION_LIST.copy()
         if op_type == 'Store':
             actions.append(Action.LINKS)
 
@@ -37,10 +52,12 @@ def iteration_level_analysis():
 
         summary_long: pd.DataFrame = summary.melt(id_vars=["Policy", "Density", "Scale", "Iteration"],
                                                   var_name="Action", value_name="Action Count")
+        chart_data = downsample(summary_long[summary_long["Iteration"].between(min_iteration, max_iteration)],
+                                "Iteration", "Action Count", num_points, by=["Policy", "Action"], method=method)
         tabs = st.tabs(['Iteration Results By Policy', 'Iteration Results By Action', 'Iteration Data'])
         title = alt.TitleParams(f'Linking Policy Performance - {density} - {op_type}', anchor='middle')
         with tabs[0]:
-            chart1 = alt.Chart(summary_long).mark_line(point=True, opacity=0.2).encode(
+            chart1 = alt.Chart(chart_data).mark_line(point=True, opacity=0.2).encode(
                 x=alt.X("Iteration:Q", title="Iteration Number"),
                 y=alt.Y(f"Action Count:Q", title="Operation Count", scale=alt.Scale(type=scale_type)),
                 color=alt.Color("Policy:O", legend=alt.Legend(labelLimit=400),
@@ -49,7 +66,7 @@ def iteration_level_analysis():
                 tooltip=["Policy:O", alt.Tooltip("Iteration:Q", format=","),
                          alt.Tooltip("Action Count:Q", format=",")]
             ).properties(
-                width=200,
+                width=CHART_WIDTH,
                 height=200
             ).facet(
                 column=alt.Column("Action:O", title="Type of Operation", sort=ACTION_LIST,
@@ -59,7 +76,7 @@ def iteration_level_analysis():
             st.altair_chart(chart1)
             bar.progress((5 * i + 2) / 30, text=f"Rendering charts. Please wait... ({5 * i + 2} / 30)")
         with tabs[1]:
-            chart2 = alt.Chart(summary_long).mark_line(point=True, opacity=0.2).encode(
+            chart2 = alt.Chart(chart_data).mark_line(point=True, opacity=0.2).encode(
                 x=alt.X("Iteration:Q", title="Iteration Number"),
                 y=alt.Y(f"Action Count:Q", title="Operation Count", scale=alt.Scale(type=scale_type)),
                 color=alt.Color("Action:O", legend=alt.Legend(labelLimit=400),
@@ -68,7 +85,7 @@ def iteration_level_analysis():
                 tooltip=["Action:O", alt.Tooltip("Iteration:Q", format=","),
                          alt.Tooltip("Action Count:Q", format=",")]
             ).properties(
-                width=200,
+                width=CHART_WIDTH,
                 height=200
             ).facet(
                 column=alt.Column("Policy:O", title="Policy",
@@ -88,6 +105,10 @@ def iteration_level_analysis():
                                               scales=scale,
                                               operation='Store', actions=[Action.LINKS],
                                               analyze_all_iterations=True)
+    summary1 = downsample(summary1[summary1["Iteration"].between(min_iteration, max_iteration)],
+                          "Iteration", "IPFS Retrieve", num_points, by=["Policy"], method=method)
+    summary2 = downsample(summary2[summary2["Iteration"].between(min_iteration, max_iteration)],
+                          "Iteration", "Links", num_points, by=["Policy"], method=method)
 
     st.header("Individual Chart for Add Node")
     tabs = st.tabs(["Storage Retrieve Costs", "Link Costs"])
@@ -4,6 +4,7 @@ import pandas as pd
 import streamlit as st
 from streamlit import session_state as ss
 
+from components.Adjacency import DENSE_MAX_NODES, GRAPH_IMAGE_MAX_NODES
 from components.utils import POLICY_GROUP_NAMES, DENSITY_NAMES
 from simulation.CommandLineParser import CommandLineParser
 from simulation.CommandLineValidator import validator, post_validate
@@ -102,7 +103,10 @@ def policy_visualization_settings():
     if ss['stage'] > 2:
         with st.form("node_number"):
             st.subheader("Step 1d: Set Node Number")
-            ss['node_num'] = st.slider("Number of Nodes", 1, 20, 10)
+            ss['node_num'] = st.number_input("Number of Nodes", 1, 10000, 10,
+                                             help=f"The adjacency matrix is binned for more than {DENSE_MAX_NODES} "
+                                                  f"nodes, and the graph image is only drawn for up to "
+                                                  f"{GRAPH_IMAGE_MAX_NODES} nodes.")
             st.form_submit_button(on_click=set_stage, args=(4,))
 
     if ss['stage'] > 3:
@@ -1,6 +1,7 @@
 from sys import stderr
 
 from simulation.CommandLineValidator import operation_choices
+from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
 from simulation.LinkingStrategy import *
 from simulation.VersionDensity import *
 
@@ -34,10 +35,14 @@ class CommandLineParser:
             return SequentialSMaxGapStrategy(s)
         elif base := args.seqexp:
             return SequentialExponentialStrategy(base)
+        elif args.skewbinary:
+            return SkewBinaryStrategy()
         elif n := args.tempuniform:
             return TemporalUniformStrategy(n)
         elif t := args.tempmingap:
             return TemporalMinGapStrategy(t)
+        elif r := args.tempcalendar:
+            return TemporalCalendarStrategy(r)
         elif t := tuple(args.tempexp):
             base, time_unit = t
             return TemporalExponentialStrategy(base, time_unit)
@@ -79,6 +84,85 @@ class CommandLineParser:
         """
         return self.args.iterations
 
+    def parse_ci_width(self):
+        """
+        Parses the relative width of the confidence interval at which the operations stop iterating (0 if the
+        number of iterations is fixed).
+        """
+        return self.args.ci_width
+
+    def parse_max_iterations(self):
+        """
+        Parses the maximum number of iterations when the number of iterations is adaptive.
+        """
+        return self.args.max_iterations
+
+    def parse_min_iterations(self):
+        """
+        Parses the minimum number of iterations when the number of iterations is adaptive.
+        """
+        return self.args.min_iterations
+
+    def parse_summary_only(self):
+        """
+        Parses whether only the summary of the iterations of each operation is saved.
+        """
+        return self.args.summary_only
+
+    def parse_range_widths(self):
+        """
+        Parses the widths of the time windows for the range operation.
+        """
+        return self.args.range_widths
+
+    def parse_index_interval(self):
+        """
+        Parses the number of versions covered by each index object (0 if index objects are not used).
+        """
+        return self.args.index_interval
+
+    def parse_version_tree_fanout(self):
+        """
+        Parses the fanout of the version tree (0 if the version tree is not used).
+        """
+        return self.args.version_tree_fanout
+
+    def parse_page_size(self):
+        """
+        Parses the number of versions read by each iteration of the forward operation.
+        """
+        return self.args.page_size
+
+    def parse_delta_links(self):
+        """
+        Parses whether the links are delta encoded.
+        """
+        return self.args.delta_links
+
+    def parse_timing(self):
+        """
+        Parses whether the latency of each iteration is recorded.
+        """
+        return self.args.timing
+
+    def parse_trace_memory(self):
+        """
+        Parses whether the peak memory allocated in each iteration is recorded.
+        """
+        return self.args.trace_memory
+
+    def parse_trace(self):
+        """
+        Parses whether the traversals are recorded in a trace file.
+        """
+        return self.args.trace
+
+    def parse_profile(self):
+        """
+        Parses whether the operations are profiled.
+        """
+        return self.args.profile
+
     def parse_verbosity(self):
         """
         Parses whether the output is verbose.
@@ -96,3 +180,18 @@ class CommandLineParser:
         Parses the output directory.
         """
         return self.args.output
+
+    def parse_environment(self) -> IPAROSimulationEnvironment:
+        """
+        Parses the whole simulation environment.
+        """
+        output_dir = self.parse_output_directory()
+        return IPAROSimulationEnvironment(self.parse_policy(), self.parse_volume(), self.parse_density(),
+                                          self.parse_operations(), output_dir.strip() if output_dir else None,
+                                          self.parse_verbosity(), self.parse_recompute_storage(),
+                                          self.parse_iterations(), self.parse_range_widths(),
+                                          self.parse_index_interval(), self.parse_version_tree_fanout(),
+                                          self.parse_page_size(), self.parse_delta_links(), self.parse_timing(),
+                                          self.parse_trace_memory(), self.parse_trace(), self.parse_profile(),
+                                          self.parse_ci_width(), self.parse_max_iterations(),
+                                          self.parse_summary_only(), self.parse_min_iterations())
@@ -2,7 +2,7 @@ import os
 from argparse import ArgumentParser, ArgumentTypeError
 from sys import stderr
 
-operation_choices = ["first", "latest", "time", "nth", "list", "unsafe-list"]
+operation_choices = ["first", "latest", "time", "nth", "list", "unsafe-list", "range", "time-ipns", "nth-ipns", "forward"]
 
 
 # Utility methods used to check validity of command-line args.
@@ -21,6 +21,17 @@ def check_positive_int(val):
     return ival
 
 
+def check_valid_fanout(val):
+    """
+    A method that will return the parsed integer (at least 2), or raise ArgumentTypeError
+    if the input is invalid.
+    """
+    ival = check_positive_int(val)
+    if ival < 2:
+        raise ArgumentTypeError(f"{val} is an invalid fanout (must be at least 2)")
+    return ival
+
+
 def check_float(val):
     """
     A method that will return the parsed float,
@@ -62,6 +73,10 @@ def check_valid_bhlt_slope(x):
     return check_predicate(x, lambda x: x > 0 and x != 1)
 
 
+def check_valid_fraction(x):
+    return check_predicate(x, lambda x: 0 < x <= 1)
+
+
 def dir_path(s: str):
     try:
         if not s.endswith(os.sep):
@@ -122,6 +137,12 @@ policy_exclusive_group.add_argument("-e", "--seqexp", help="Sequential Exponenti
                                                            "the nodes that are 1, 2, 6, and 15 versions prior "
                                                            "would be linked, as well as subsequent nodes.",
                                     type=check_greater_than_one, metavar="base")
+policy_exclusive_group.add_argument("-j", "--skewbinary", help="Skew Binary policy, which links to the previous "
+                                                               "version, the first version, and one jump version, "
+                                                               "where the jumps are laid out like a skew-binary "
+                                                               "random-access list. Each version has at most three "
+                                                               "links, and any version can be reached in a "
+                                                               "logarithmic number of hops.", action="store_true")
 policy_exclusive_group.add_argument("-U", "--tempuniform", help="""Temporal N-Uniform Prior. Links to N prior 
                                                                 versions (distributed uniformly across the 
                                                                 window of time), the immediate previous 
@@ -142,6 +163,14 @@ policy_exclusive_group.add_argument("-E", "--tempexp", help="Temporal exponentia
                                                             "with the first version. T is measured in seconds, "
                                                             "and base is any number greater than one.",
                                     nargs=2, type=check_greater_than_zero, metavar=("base", "unit"))
+policy_exclusive_group.add_argument("-C", "--tempcalendar", help="Temporal calendar (with resolution R). Links "
+                                                                 "to the latest version before the start of the "
+                                                                 "current year, month, day, hour, minute and second, "
+                                                                 "and then before the start of each tenth of a "
+                                                                 "second down to R. Also links with the immediate "
+                                                                 "previous and the first versions. R is measured in "
+                                                                 "seconds and is 0.001 by default.",
+                                    nargs='?', const=0.001, type=check_greater_than_zero, metavar="R")
 
 # Version Volume group - case-insensitive
 volume_group = validator.add_argument("-V", "--volume", help="The version volume used for the "
@@ -183,6 +212,29 @@ validator.add_argument("-n", "--number-of-iterations", help="Number of iteration
                                                             "which means the number of iterations for the storage "
                                                             "depends on the version volume.",
                        default=10, type=check_positive_int, metavar="iterations", dest="iterations")
+validator.add_argument("-a", "--ci-width", help="""Makes the number of iterations of each operation after storing
+                                             adaptive: the operation keeps iterating until the 95%% confidence
+                                             interval of the mean number of IPFS retrieves is at most this
+                                             fraction of the mean wide (such as 0.05), with at least the minimum
+                                             and at most the maximum number of iterations, instead of running the
+                                             number of iterations. The number of iterations used is the number of
+                                             rows of the results. By default, every operation runs the number of
+                                             iterations.""",
+                       default=0, type=check_greater_than_zero, metavar="width", dest="ci_width")
+validator.add_argument("-N", "--max-iterations", help="""The maximum number of iterations of each operation when
+                                                   the number of iterations is adaptive. Default is 1000.""",
+                       default=1000, type=check_positive_int, metavar="iterations", dest="max_iterations")
+validator.add_argument("-I", "--min-iterations", help="""The minimum number of iterations of each operation when
+                                                   the number of iterations is adaptive, so that operations whose
+                                                   retrieve count does not vary stop early. Default is 3.""",
+                       default=3, type=check_positive_int, metavar="iterations", dest="min_iterations")
+validator.add_argument("-Z", "--summary-only", help="""Saves only the summary of the iterations of each operation
+                                                 after storing (the count, the mean, the standard deviation, the
+                                                 minimum, the quartiles and the maximum of each column), which
+                                                 is computed online in constant memory, instead of every
+                                                 iteration. The quartiles are estimated within 1%%. These
+                                                 operations are then left out of the iteration-level analysis.""",
+                       action="store_true", dest="summary_only")
 validator.add_argument("-k", "--densitykey", help="""The density key, which partially determines the
 unique name of the file.""")
 
@@ -194,13 +246,59 @@ validator.add_argument("-S", "--store-average", help="Adds an option to average
                        action="store_true", dest="store_average")
 validator.add_argument("-O", "--operations", help="""The operation to use. Options are 'first' for get 
                                                  first, 'latest' for get latest, 'time' for get at uniformly 
-                                                 distributed time T, 'nth' for get Nth node, and 'list' for list all
-                                                 links.  By default, all operations are included in this simulation 
+                                                 distributed time T, 'nth' for get Nth node, 'list' for list all
+                                                 links, and 'range' for get all versions in a time window. 'time-ipns' and 'nth-ipns'
+                                                 are the same as 'time' and 'nth', but use the version index kept by the IPNS
+                                                 instead of the links. 'forward' reads a page of versions from
+                                                 earliest to latest, starting at a random version.  By default, all operations are included in this simulation 
                                                  and default to the number of iterations. Multiple operation choices 
                                                  are allowed. For instance, '-O list nth' will simulate the retrieve 
                                                  by sequence number and list all operations. Repeated operations are
                                                  not allowed.""",
                        choices=operation_choices, nargs='*', action='extend')
+validator.add_argument("-w", "--range-widths", help="""The widths of the time windows for the 'range' operation,
+                                                    each as a fraction of the time between the first and the latest
+                                                    versions (greater than 0 and at most 1). Each width is simulated
+                                                    as a separate operation. Default is 0.01 and 0.1.""",
+                       nargs='+', default=[0.01, 0.1], type=check_valid_fraction, metavar="width",
+                       dest="range_widths")
+validator.add_argument("-K", "--index-interval", help="""Stores an index object every K versions, which lists
+                                                      the links to the previous K versions and to all the earlier
+                                                      index objects, and is linked from all the following versions.
+                                                      Sequence number and time lookups then go through at most a few
+                                                      index objects. By default, no index objects are stored.""",
+                       default=0, type=check_positive_int, metavar="K", dest="index_interval")
+validator.add_argument("-B", "--version-tree", help="""Makes the IPNS point at the root of a copy-on-write B+ tree
+                                                    of all versions (with at most B entries per node) instead of the
+                                                    latest version. Each store rewrites a logarithmic number of tree
+                                                    nodes, and sequence number and time lookups descend the tree
+                                                    regardless of the policy. By default, no version tree is used.""",
+                       default=0, type=check_valid_fanout, metavar="B", dest="version_tree_fanout")
+validator.add_argument("-D", "--delta-links", help="""Stores the links of each version as the links added to
+                                                    and removed from the links of an earlier version (the one
+                                                    whose sequence number has its lowest set bit cleared), which
+                                                    is much smaller for policies that keep most of the previous
+                                                    links. Resolving the links then costs extra retrieves, which
+                                                    are counted.""",
+                       action="store_true", dest="delta_links")
+validator.add_argument("-P", "--page-size", help="""The number of versions read by each iteration of the
+                                                  'forward' operation. Default is 10.""",
+                       default=10, type=check_positive_int, metavar="size", dest="page_size")
+validator.add_argument("-T", "--timing", help="""Records the wall-clock latency of each iteration (and, for the
+                                              store operation, the time spent in the policy) in nanoseconds.""",
+                       action="store_true", dest="timing")
+validator.add_argument("-M", "--trace-memory", help="""Records the peak amount of memory allocated in each iteration
+                                                    using tracemalloc, which slows down the simulation.""",
+                       action="store_true", dest="trace_memory")
+validator.add_argument("-R", "--trace", help="""Records the sequence numbers of the versions retrieved in each
+                                             iteration in a binary trace file next to the results, which can be
+                                             analyzed with TraceReplay.py without running the simulation again.""",
+                       action="store_true", dest="trace")
+validator.add_argument("-f", "--profile", help="""Profiles the store phase and each other operation with
+                                               cProfile, and saves each profile as a pstats file next to the
+                                               results, named after the policy, the volume, the density and the
+                                               operation. Profiling slows down the simulation.""",
+                       action="store_true", dest="profile")
 validator.add_argument("-v", "--verbose", help="Prints detailed output.", action="store_true")
 validator.add_argument("-i", "--interval", help="""The time interval for simulation.
 Default is 1000. The interval will not be used in the multipeak distribution.""",
@@ -222,6 +320,9 @@ def post_validate(args):
             elif param[1] < 0:
                 print("All means must be nonnegative.", file=stderr)
                 exit(3)
+    if args.ci_width and args.max_iterations < args.min_iterations:
+        print("The maximum number of iterations must be at least the minimum number of iterations.", file=stderr)
+        exit(5)
     if ops := args.operations:
         if len(ops) != len(set(ops)):
             print("Options must be unique.", file=stderr)
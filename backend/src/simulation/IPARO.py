@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from simulation.IPAROLink import IPAROLink
 
 
@@ -17,6 +17,19 @@ class IPARO:
     content: bytes
     # Trailer
     nonce: int = 0  # For now
+    index: IPAROLink | None = None
+    """
+    The link to the latest index object stored before this IPARO, if index objects are used.
+    """
+    link_delta_base: IPAROLink | None = None
+    """
+    The link to the ancestor that the links are encoded against, if the links are delta encoded. In that case,
+    ``linked_iparos`` only contains the links that were added to the links of the ancestor.
+    """
+    removed_links: set[IPAROLink] = field(default_factory=set)
+    """
+    The links of the ancestor that were removed, if the links are delta encoded.
+    """
 
     def __str__(self):
         """
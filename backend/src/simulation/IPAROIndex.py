@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from simulation.IPAROLink import IPAROLink
+
+
+@dataclass
+class IPAROIndex:
+    """
+    An index object that is stored in the IPFS every K versions. It lists the links to the K versions
+    that it covers, as well as the links to all the earlier index objects, so that any earlier version
+    can be reached by retrieving at most two index objects.
+
+    A link to an index object is an ``IPAROLink`` whose sequence number and timestamp are those of
+    the last version it covers, and whose CID is the CID of the index object.
+    """
+    url: str
+    entries: list[IPAROLink]
+    """
+    The links to the versions covered by this index object, sorted by sequence number.
+    """
+
+    prior_indexes: list[IPAROLink]
+    """
+    The links to all the earlier index objects, sorted by sequence number.
+    """
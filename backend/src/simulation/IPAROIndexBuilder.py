@@ -0,0 +1,45 @@
+from simulation.IPAROIndex import IPAROIndex
+from simulation.IPAROLink import IPAROLink
+from simulation.IPFS import ipfs
+
+
+class IPAROIndexBuilder:
+    """
+    Builds the index objects on the archiver's side. The archiver keeps the links to the versions that it
+    stored since the last index object, so building an index object costs one IPFS store and no retrieves.
+    """
+
+    def __init__(self, url: str, interval: int):
+        """
+        :param url: The URL of the versions.
+        :param interval: The number of versions (K) covered by each index object.
+        """
+        self.url = url
+        self.interval = interval
+        self.pending_links: list[IPAROLink] = []
+        self.index_links: list[IPAROLink] = []
+
+    def get_latest_index_link(self) -> IPAROLink | None:
+        """
+        Gets the link to the latest index object, or None if no index object has been stored yet.
+        """
+        return self.index_links[-1] if self.index_links else None
+
+    def add(self, link: IPAROLink) -> int:
+        """
+        Adds the link to a newly stored version, and stores an index object once K versions have
+        been added since the last one.
+
+        :param link: The link to the newly stored version.
+        :returns: The size of the stored index object in bytes, or 0 if no index object was stored.
+        """
+        self.pending_links.append(link)
+        if len(self.pending_links) < self.interval:
+            return 0
+
+        index = IPAROIndex(url=self.url, entries=self.pending_links, prior_indexes=self.index_links.copy())
+        cid, index_bytes = ipfs.store(index)
+        last_link = self.pending_links[-1]
+        self.index_links.append(IPAROLink(seq_num=last_link.seq_num, timestamp=last_link.timestamp, cid=cid))
+        self.pending_links = []
+        return len(index_bytes)
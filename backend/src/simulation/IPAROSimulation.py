@@ -1,6 +1,9 @@
+from typing import Callable
+
 from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
-from simulation.Operation import LatestOperation, StoreOperation, FirstOperation, GetAtTOperation, GetNthOperation, \
-    ListAllOperation, IteratedStoreOperation, UnsafeListAllOperation
+from simulation.Operation import IterableOperation, LatestOperation, StoreOperation, FirstOperation, GetAtTOperation, \
+    GetNthOperation, ListAllOperation, IteratedStoreOperation, UnsafeListAllOperation, GetRangeOperation, \
+    GetNthIPNSOperation, GetAtTIPNSOperation, ForwardOperation
 
 # URL doesn't matter much, but the fact that it exists is important.
 URL = "example.com"
@@ -8,8 +11,17 @@ URL = "example.com"
 
 class IPAROSimulation:
 
-    def __init__(self, env: IPAROSimulationEnvironment):
+    def __init__(self, env: IPAROSimulationEnvironment, progress: Callable[[float], None] | None = None):
+        """
+        :param env: The environment.
+        :param progress: Called with the fraction of the operations (including the store operation) that are
+            done after each iteration, to report the progress of the simulation.
+        """
         self.env = env
+        self.progress = progress
+        self.__num_executed = 0
+        self.__num_operations = 1 + sum(len(env.range_widths) if operation.lower() == "range" else 1
+                                        for operation in env.operations)
 
     def run(self):
         # Create some storage.
@@ -19,7 +31,7 @@ class IPAROSimulation:
         else:
             # Link the IPAROs in the IPFS
             store_op = StoreOperation(env)
-        store_op.execute()
+        self.execute(store_op)
         for op in env.operations:
             self.dispatch(op)
 
@@ -36,13 +48,34 @@ class IPAROSimulation:
                 op = GetAtTOperation(self.env)
             case "nth":
                 op = GetNthOperation(self.env)
+            case "time-ipns":
+                op = GetAtTIPNSOperation(self.env)
+            case "nth-ipns":
+                op = GetNthIPNSOperation(self.env)
             case "first":
                 op = FirstOperation(self.env)
             case "latest":
                 op = LatestOperation(self.env)
+            case "forward":
+                op = ForwardOperation(self.env)
             case "list":
                 op = ListAllOperation(self.env)
             case "unsafe-list":
                 op = UnsafeListAllOperation(self.env)
+            case "range":
+                # One operation per window width.
+                for width in self.env.range_widths:
+                    self.execute(GetRangeOperation(self.env, width))
         if op is not None:
-            op.execute()
+            self.execute(op)
+
+    def execute(self, op: IterableOperation):
+        """
+        Executes an operation, reporting the progress after each of its iterations.
+        """
+        if self.progress:
+            num_executed = self.__num_executed
+            op.on_iteration = lambda i: self.progress((num_executed + (i + 1) / op.iterations)
+                                                      / self.__num_operations)
+        op.execute()
+        self.__num_executed += 1
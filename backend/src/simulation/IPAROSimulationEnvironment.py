@@ -9,7 +9,11 @@ class IPAROSimulationEnvironment:
 
     def __init__(self, linking_strategy: LinkingStrategy, version_volume: int,
                  version_density: VersionDensity, operations: list[str], output_dir: str | None = None,
-                 verbose: bool = False, recompute_storage: bool = False, iterations: int = 10):
+                 verbose: bool = False, recompute_storage: bool = False, iterations: int = 10,
+                 range_widths: list[float] | None = None, index_interval: int = 0, version_tree_fanout: int = 0,
+                 page_size: int = 10, delta_links: bool = False, timing: bool = False,
+                 trace_memory: bool = False, trace: bool = False, profile: bool = False, ci_width: float = 0,
+                 max_iterations: int = 1000, summary_only: bool = False, min_iterations: int = 3):
         self.linking_strategy = linking_strategy
         self.version_density = version_density
         self.version_volume = version_volume
@@ -18,6 +22,31 @@ class IPAROSimulationEnvironment:
         self.iterations = iterations
         self.output_dir = output_dir or "."
         self.recompute_storage = recompute_storage
+        self.range_widths = range_widths or [0.01, 0.1]
+        # The number of versions covered by each index object, or 0 if no index objects are stored.
+        self.index_interval = index_interval
+        # The fanout of the version tree that the IPNS points at, or 0 if the IPNS points at the latest IPARO.
+        self.version_tree_fanout = version_tree_fanout
+        # The number of versions read by each iteration of the forward operation.
+        self.page_size = page_size
+        # Whether the links of each IPARO are stored as a delta against an ancestor.
+        self.delta_links = delta_links
+        # Whether the latency and the peak memory allocated are recorded for each iteration.
+        self.timing = timing
+        self.trace_memory = trace_memory
+        # Whether the sequence numbers retrieved in each iteration are recorded in a binary trace file.
+        self.trace = trace
+        # Whether each operation is profiled with cProfile.
+        self.profile = profile
+        # The relative width of the confidence interval of the mean retrieve count at which the read operations
+        # stop iterating (after at least ``min_iterations`` and at most ``max_iterations`` iterations), or 0 if
+        # they always run ``iterations`` iterations.
+        self.ci_width = ci_width
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        # Whether the read operations only save the online statistics of their iterations instead of every
+        # iteration, which takes constant memory but leaves them out of the iteration-level analysis.
+        self.summary_only = summary_only
 
     def __str__(self):
         return f"{self.version_volume}-{str(self.version_density)}"
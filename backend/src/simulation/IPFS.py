@@ -2,14 +2,21 @@ import gc
 import hashlib
 import pickle
 import random
+from bisect import bisect_left
+from collections import OrderedDict
 from enum import Enum
+from itertools import takewhile
+from typing import Iterator
 
 import numpy as np
 
 from simulation.IPAROException import IPARONotFoundException
 from simulation.IPARO import IPARO
+from simulation.IPAROIndex import IPAROIndex
 from simulation.IPAROLink import IPAROLink
 from simulation.IPNS import ipns
+from simulation.Observer import Observer
+from simulation.VersionTreeNode import VersionTreeNode
 
 
 class Mode(Enum):
@@ -24,17 +31,38 @@ class IPFS:
     retrieving, and linking IPARO objects.
     """
 
+    # The maximum number of resolved link sets of delta encoded IPAROs that are cached.
+    LINK_CACHE_SIZE = 64
+
     def __init__(self):
         self.data: dict[str, bytes] = {}
         self.retrieve_count = 0
         self.store_count = 0
+        # The encoded sizes of the stored and the retrieved objects, in bytes.
+        self.bytes_stored = 0
+        self.bytes_retrieved = 0
+        # The resolved link sets by CID, from least to most recently used.
+        self.link_cache: OrderedDict[str, frozenset[IPAROLink]] = OrderedDict()
+        self.observers: list[Observer] = []
+
+    def add_observer(self, observer: Observer):
+        """
+        Attaches an observer that is notified of every store and retrieve.
+        """
+        self.observers.append(observer)
 
-    def store(self, iparo: IPARO) -> tuple[str, bytes]:
+    def remove_observer(self, observer: Observer):
+        """
+        Detaches an observer.
         """
-        Stores a node with its CID.
+        self.observers.remove(observer)
+
+    def store(self, iparo: IPARO | IPAROIndex | VersionTreeNode) -> tuple[str, bytes]:
+        """
+        Stores a node (or an index object, or a version tree node) with its CID.
 
         Args:
-            iparo (IPARO): The IPARO object to store.
+            iparo (IPARO | IPAROIndex | VersionTreeNode): The object to store.
 
         Returns:
             The tuple containing the CID of the newly stored IPARO as the
@@ -44,7 +72,12 @@ class IPFS:
         sha256_hash = hashlib.sha256(iparo_bytes).hexdigest()
         cid = 'Qm' + sha256_hash[:34]
         self.store_count += 1
+        self.bytes_stored += len(iparo_bytes)
         self.data[cid] = iparo_bytes
+        if self.observers:
+            seq_num = iparo.seq_num if isinstance(iparo, IPARO) else None
+            for observer in self.observers:
+                observer.on_store(cid, seq_num, len(iparo_bytes))
         return cid, iparo_bytes
 
     def remove_nodes(self, url: str, nodes: int) -> dict[str, bytes]:
@@ -79,6 +112,7 @@ class IPFS:
         del self.data
         gc.collect()
         self.data: dict[str, IPARO] = {}
+        self.link_cache.clear()
 
     def retrieve(self, cid) -> IPARO:
         """
@@ -87,18 +121,84 @@ class IPFS:
         """
         self.retrieve_count += 1
         if cid not in self.data:
+            for observer in self.observers:
+                observer.on_not_found(cid)
             raise IPARONotFoundException(cid)
         iparo_bytes = self.data[cid]
-        return pickle.loads(iparo_bytes)
+        self.bytes_retrieved += len(iparo_bytes)
+        iparo = pickle.loads(iparo_bytes)
+        if self.observers:
+            seq_num = iparo.seq_num if isinstance(iparo, IPARO) else None
+            for observer in self.observers:
+                observer.on_retrieve(cid, seq_num, len(iparo_bytes))
+        if isinstance(iparo, IPARO) and iparo.link_delta_base is not None:
+            self.resolve_links(cid, iparo)
+        return iparo
+
+    def resolve_links(self, cid: str, iparo: IPARO):
+        """
+        Replaces the delta encoded links of an IPARO with all of its links, by resolving the links of the
+        ancestor that they are encoded against. Each ancestor that is not cached costs one retrieve, so
+        that the resolution is counted like any other retrieve. If an ancestor is missing, then an
+        IPARONotFoundException is thrown.
+
+        :param cid: The CID of the IPARO.
+        :param iparo: The delta encoded IPARO, which is modified in place.
+        """
+        base_cid = iparo.link_delta_base.cid
+        if base_cid in self.link_cache:
+            self.link_cache.move_to_end(base_cid)
+            base_links = self.link_cache[base_cid]
+        else:
+            base_links = self.retrieve(base_cid).linked_iparos
+            self.__cache_links(base_cid, base_links)
+        iparo.linked_iparos.update(base_links - iparo.removed_links)
+        iparo.link_delta_base = None
+        iparo.removed_links = set()
+        self.__cache_links(cid, iparo.linked_iparos)
+
+    def __cache_links(self, cid: str, links: set[IPAROLink]):
+        self.link_cache[cid] = frozenset(links)
+        self.link_cache.move_to_end(cid)
+        if len(self.link_cache) > self.LINK_CACHE_SIZE:
+            self.link_cache.popitem(last=False)
+
+    def retrieve_index(self, cid) -> IPAROIndex:
+        """
+        Retrieves the index object corresponding to a given CID, if it exists;
+        otherwise, it throws an IPARONotFoundException.
+        """
+        return self.retrieve(cid)
+
+    def retrieve_tree_node(self, cid) -> VersionTreeNode:
+        """
+        Retrieves the version tree node corresponding to a given CID, if it exists;
+        otherwise, it throws an IPARONotFoundException.
+        """
+        return self.retrieve(cid)
+
+    def resolve_latest_node(self, cid: str) -> tuple[IPAROLink, IPARO]:
+        """
+        Gets the latest link and the latest IPARO from the CID that the IPNS points at. If the CID is the
+        root of a version tree, then the rightmost path of the tree is followed to the latest version.
+        """
+        latest_iparo = self.retrieve(cid)
+        if not isinstance(latest_iparo, VersionTreeNode):
+            latest_link = IPAROLink(seq_num=latest_iparo.seq_num, timestamp=latest_iparo.timestamp, cid=cid)
+            return latest_link, latest_iparo
+
+        node = latest_iparo
+        while not node.leaf:
+            node = self.retrieve_tree_node(node.entries[-1].cid)
+        latest_link = node.entries[-1]
+        return latest_link, self.retrieve(latest_link.cid)
 
     def get_link_to_latest_node(self, url: str) -> tuple[IPAROLink, IPARO]:
         """
         A method that fetches the latest link and the latest IPARO.
         """
         latest_cid = ipns.get_latest_cid(url)
-        latest_iparo = self.retrieve(latest_cid)
-        latest_link = IPAROLink(seq_num=latest_iparo.seq_num, timestamp=latest_iparo.timestamp, cid=latest_cid)
-        return latest_link, latest_iparo
+        return self.resolve_latest_node(latest_cid)
 
     def get_links_to_first_and_latest_nodes(self, url: str) -> tuple[IPAROLink, IPAROLink, IPARO]:
         """
@@ -108,20 +208,25 @@ class IPFS:
         :param url: The URL
         :returns: The tuple consisting of the first link, the latest link, and the latest IPARO, in that order.
         """
-        latest_cid = ipns.get_latest_cid(url)
-        latest_iparo = self.retrieve(latest_cid)
-        latest_link = IPAROLink(seq_num=latest_iparo.seq_num, timestamp=latest_iparo.timestamp, cid=latest_cid)
+        latest_link, latest_iparo = self.get_link_to_latest_node(url)
         candidate_links = [link for link in latest_iparo.linked_iparos if link.seq_num == 0]
         first_link = candidate_links[0] if candidate_links else None
         if latest_link.seq_num == 0:
             first_link = latest_link
         return first_link, latest_link, latest_iparo
 
-    def retrieve_nth_iparo(self, number: int, link: IPAROLink) -> IPAROLink:
+    def retrieve_nth_iparo(self, number: int, link: IPAROLink, iparo: IPARO | None = None) -> IPAROLink:
         """
         A method that enables the retrieval of IPARO using a sequence number
         to save IPARO operations by adding the ability to repeatedly apply the
         greedy search method. For bulk retrieval, use the IPAROLinkFactory.
+
+        If the node is not directly linked, but it is covered by the index object linked from
+        the current IPARO, then the index objects are used instead.
+
+        :param number: The sequence number.
+        :param link: The link to the node to start from.
+        :param iparo: The IPARO that the link points to, if it has already been retrieved.
         """
         # It is assumed that there is a link to the previous node.
         if link.seq_num < number:
@@ -129,15 +234,127 @@ class IPFS:
 
         curr_link = link
         while curr_link.seq_num != number:
-            iparo = self.retrieve(curr_link.cid)
+            if iparo is None:
+                iparo = self.retrieve(curr_link.cid)
             candidate_links = [link for link in iparo.linked_iparos if link.seq_num >= number]
             if not candidate_links:
                 raise IPARONotFoundException(number)
             next_link = min(candidate_links, key=lambda link: link.seq_num)
-            curr_link = next_link
+            if next_link.seq_num != number and iparo.index is not None and number <= iparo.index.seq_num:
+                return self.retrieve_nth_iparo_from_index(number, iparo.index)
+            curr_link, iparo = next_link, None
 
         return curr_link
 
+    def retrieve_nth_iparo_from_index(self, number: int, index_link: IPAROLink) -> IPAROLink:
+        """
+        Retrieves the link to an IPARO using a sequence number by going through at most two index objects.
+
+        :param number: The sequence number, which must be covered by the index object or one of its
+        prior index objects.
+        :param index_link: The link to the index object.
+        """
+        index = self.retrieve_index(index_link.cid)
+        if number < index.entries[0].seq_num:
+            # The first prior index object that covers the sequence number.
+            pos = bisect_left(index.prior_indexes, number, key=lambda link: link.seq_num)
+            if pos == len(index.prior_indexes):
+                raise IPARONotFoundException(number)
+            index = self.retrieve_index(index.prior_indexes[pos].cid)
+
+        pos = number - index.entries[0].seq_num
+        if not 0 <= pos < len(index.entries):
+            raise IPARONotFoundException(number)
+        return index.entries[pos]
+
+    def retrieve_closest_iparo_from_index(self, index_link: IPAROLink, timestamp: int,
+                                          mode: Mode = Mode.CLOSEST) -> IPAROLink:
+        """
+        Retrieves the link to the IPARO closest to a given timestamp, according to a given mode, by going
+        through at most three index objects.
+
+        :param index_link: The link to the index object, whose timestamp is at or after the given timestamp.
+        :param timestamp: The timestamp.
+        :param mode: The mode by which we find the IPARO.
+        """
+        index = self.retrieve_index(index_link.cid)
+        # The first index object containing a version at or after the timestamp.
+        pos = bisect_left(index.prior_indexes, timestamp, key=lambda link: link.timestamp)
+        if pos < len(index.prior_indexes):
+            index = self.retrieve_index(index.prior_indexes[pos].cid)
+
+        pos = bisect_left(index.entries, timestamp, key=lambda link: link.timestamp)
+        curr_link = index.entries[pos]
+        if curr_link.timestamp == timestamp or curr_link.seq_num == 0:
+            return curr_link
+
+        # The previous version is either in the same index object or the last one of the prior index object.
+        if pos > 0:
+            prev_link = index.entries[pos - 1]
+        else:
+            prev_link = self.retrieve_index(index.prior_indexes[-1].cid).entries[-1]
+        return self.choose_link(prev_link, curr_link, timestamp, mode)
+
+    def retrieve_nth_iparo_from_tree(self, number: int, root: VersionTreeNode) -> IPAROLink:
+        """
+        Retrieves the link to an IPARO using a sequence number by descending the version tree, which
+        costs one retrieve per level below the root.
+
+        :param number: The sequence number.
+        :param root: The root of the version tree.
+        """
+        node = root
+        while True:
+            pos = bisect_left(node.entries, number, key=lambda link: link.seq_num)
+            if pos == len(node.entries):
+                raise IPARONotFoundException(number)
+            if node.leaf:
+                if node.entries[pos].seq_num != number:
+                    raise IPARONotFoundException(number)
+                return node.entries[pos]
+            node = self.retrieve_tree_node(node.entries[pos].cid)
+
+    def retrieve_closest_iparo_from_tree(self, timestamp: int, root: VersionTreeNode,
+                                         mode: Mode = Mode.CLOSEST) -> IPAROLink:
+        """
+        Retrieves the link to the IPARO closest to a given timestamp, according to a given mode, by
+        descending the version tree (and descending it once more if the previous version is in another leaf).
+
+        :param timestamp: The timestamp.
+        :param root: The root of the version tree.
+        :param mode: The mode by which we find the IPARO.
+        """
+        node = root
+        while True:
+            # The first entry at or after the timestamp, or the last entry if there is none.
+            pos = min(bisect_left(node.entries, timestamp, key=lambda link: link.timestamp), len(node.entries) - 1)
+            if node.leaf:
+                break
+            node = self.retrieve_tree_node(node.entries[pos].cid)
+
+        curr_link = node.entries[pos]
+        if curr_link.timestamp <= timestamp or curr_link.seq_num == 0:
+            return curr_link
+        if pos > 0:
+            prev_link = node.entries[pos - 1]
+        else:
+            prev_link = self.retrieve_nth_iparo_from_tree(curr_link.seq_num - 1, root)
+        return self.choose_link(prev_link, curr_link, timestamp, mode)
+
+    @staticmethod
+    def choose_link(prev_link: IPAROLink, curr_link: IPAROLink, timestamp: int, mode: Mode) -> IPAROLink:
+        """
+        Chooses between two consecutive versions according to a given mode, where the timestamp is
+        at or after the timestamp of the previous version.
+        """
+        time_frac = (timestamp - prev_link.timestamp) / (curr_link.timestamp - prev_link.timestamp)
+        if mode == Mode.CLOSEST:
+            return prev_link if time_frac <= 0.5 else curr_link
+        elif mode == Mode.EARLIEST_AFTER:
+            return curr_link if time_frac > 0 else prev_link
+        else:
+            return prev_link if time_frac < 1 else curr_link
+
     def retrieve_closest_iparo(self, curr_link: IPAROLink, known_links: set[IPAROLink], timestamp: int,
                                mode: Mode = Mode.CLOSEST) \
             -> tuple[IPAROLink, set[IPAROLink]]:
@@ -151,19 +368,14 @@ class IPFS:
             curr_ts = curr_link.timestamp
             if curr_ts == timestamp or curr_link.seq_num == 0:
                 return curr_link, known_links
-            prev_link = self.retrieve_nth_iparo(curr_link.seq_num - 1, curr_link)
+            curr_iparo = self.retrieve(curr_link.cid)
+            if curr_iparo.index is not None and timestamp <= curr_iparo.index.timestamp:
+                return self.retrieve_closest_iparo_from_index(curr_iparo.index, timestamp, mode), known_links
+            prev_link = self.retrieve_nth_iparo(curr_link.seq_num - 1, curr_link, curr_iparo)
             prev_ts = prev_link.timestamp
             # Calculate time fraction.
-            if curr_ts != prev_ts:
-                time_frac = (timestamp - prev_ts) / (curr_ts - prev_ts)
-                if time_frac >= 0:
-                    if mode == Mode.CLOSEST:
-                        chosen_link = prev_link if time_frac <= 0.5 else curr_link
-                    elif mode == Mode.EARLIEST_AFTER:
-                        chosen_link = curr_link if time_frac > 0 else prev_link
-                    else:
-                        chosen_link = prev_link if time_frac < 1 else curr_link
-                    return chosen_link, known_links
+            if curr_ts != prev_ts and timestamp >= prev_ts:
+                return self.choose_link(prev_link, curr_link, timestamp, mode), known_links
 
             # Go over known links...
             iparo = self.retrieve(prev_link.cid)
@@ -177,89 +389,284 @@ class IPFS:
             next_link = min(candidate_links, key=lambda link: (link.timestamp, link.seq_num))
             curr_link = next_link
 
+    def retrieve_links_in_range(self, latest_link: IPAROLink, start: int, end: int) -> list[IPAROLink]:
+        """
+        Retrieves the links to all IPAROs whose timestamps lie between the start and the end of a time window
+        (inclusive). The latest version at or before the end is found first using the greedy search method, and
+        then the chain is walked backwards only as far as the start, reusing the links of every IPARO retrieved
+        along the way.
+
+        :param latest_link: The link to a node at or after the end of the window, usually the latest node.
+        :param start: The earliest timestamp in the window.
+        :param end: The latest timestamp in the window.
+        :returns: The links in the window, sorted from latest to earliest.
+        """
+        if start > end:
+            return []
+        end_link, _ = self.retrieve_closest_iparo(latest_link, {latest_link}, end, Mode.LATEST_BEFORE)
+        # Every version comes after the window.
+        if end_link.timestamp > end:
+            return []
+
+        links = []
+        for link in self.iter_links_from(end_link):
+            if link.timestamp < start:
+                break
+            links.append(link)
+
+        return links
+
+    def retrieve_iparos_in_range(self, url: str, start: int, end: int) -> list[IPAROLink]:
+        """
+        Retrieves the links to all IPAROs of a URL whose timestamps lie between the start and the end of a
+        time window (inclusive). For a window that does not end at the latest node, use
+        ``retrieve_links_in_range``.
+
+        :param url: The URL.
+        :param start: The earliest timestamp in the window.
+        :param end: The latest timestamp in the window.
+        :returns: The links in the window, sorted from latest to earliest.
+        """
+        latest_cid = ipns.get_latest_cid(url)
+        root = self.retrieve(latest_cid)
+        if isinstance(root, VersionTreeNode):
+            return self.retrieve_links_in_range_from_tree(root, start, end)
+        latest_link = IPAROLink(seq_num=root.seq_num, timestamp=root.timestamp, cid=latest_cid)
+        return self.retrieve_links_in_range(latest_link, start, end)
+
+    def retrieve_links_in_range_from_tree(self, root: VersionTreeNode, start: int, end: int) -> list[IPAROLink]:
+        """
+        Retrieves the links to all IPAROs whose timestamps lie between the start and the end of a time window
+        (inclusive) from a version tree, only descending into the subtrees that overlap with the window.
+
+        :param root: The root of the version tree.
+        :param start: The earliest timestamp in the window.
+        :param end: The latest timestamp in the window.
+        :returns: The links in the window, sorted from latest to earliest.
+        """
+        links = []
+        nodes = [root]
+        while nodes:
+            node = nodes.pop()
+            if node.leaf:
+                links.extend(link for link in reversed(node.entries) if start <= link.timestamp <= end)
+                continue
+            # A child covers the versions after the previous entry, up to its own entry.
+            first = bisect_left(node.entries, start, key=lambda link: link.timestamp)
+            for pos in range(first, len(node.entries)):
+                if pos > 0 and node.entries[pos - 1].timestamp > end:
+                    break
+                nodes.append(self.retrieve_tree_node(node.entries[pos].cid))
+        return links
+
     def retrieve_iparo_by_url_and_number(self, url: str, number: int) -> IPAROLink:
         """
-        Retrieves the IPARO CID corresponding to a given sequence number and a URL.
+        Retrieves the IPARO CID corresponding to a given sequence number and a URL. If the IPNS points
+        at a version tree, then the tree is used instead of the links.
         """
-        link, iparo = self.get_link_to_latest_node(url)
+        latest_cid = ipns.get_latest_cid(url)
+        root = self.retrieve(latest_cid)
+        if isinstance(root, VersionTreeNode):
+            return self.retrieve_nth_iparo_from_tree(number, root)
+        link = IPAROLink(seq_num=root.seq_num, timestamp=root.timestamp, cid=latest_cid)
         result = self.retrieve_nth_iparo(number, link)
         return result
 
     def retrieve_iparo_by_url_and_timestamp(self, url: str, timestamp: int, mode: Mode = Mode.CLOSEST) -> IPAROLink:
         """
         Retrieves the IPARO given a URL and a timestamp, according to a given mode, using
-        a greedy search method. For bulk retrieval, use ``IPAROLinkFactory.from_timestamps``.
+        a greedy search method (or the version tree, if the IPNS points at one). For bulk retrieval,
+        use ``IPAROLinkFactory.from_timestamps``.
 
         :param url: The URL.
         :param timestamp: The timestamp.
         :param mode: The mode by which we find the IPARO.
         """
-        latest_link, latest_iparo = self.get_link_to_latest_node(url)
+        latest_cid = ipns.get_latest_cid(url)
+        root = self.retrieve(latest_cid)
+        if isinstance(root, VersionTreeNode):
+            return self.retrieve_closest_iparo_from_tree(timestamp, root, mode)
+        latest_link = IPAROLink(seq_num=root.seq_num, timestamp=root.timestamp, cid=latest_cid)
         link, _ = self.retrieve_closest_iparo(latest_link, {latest_link}, timestamp, mode)
         return link
 
     def get_counts(self) -> dict:
         """
-        Returns the number of store and retrieve operations performed.
+        Returns the number of store and retrieve operations performed, and the number of bytes
+        that they stored and retrieved.
 
         Returns:
-            dict: Dictionary with counts of store and retrieve operations.
+            dict: Dictionary with counts of store and retrieve operations and of their bytes.
         """
-        counts = {"store": self.store_count, "retrieve": self.retrieve_count}
+        counts = {"store": self.store_count, "retrieve": self.retrieve_count,
+                  "bytes_stored": self.bytes_stored, "bytes_retrieved": self.bytes_retrieved}
         return counts
 
     def reset_counts(self):
         """
-        Resets the operation counters.
+        Resets the operation counters, as well as the cache of resolved link sets, so that each
+        measurement starts with a cold cache.
         """
         self.store_count = 0
         self.retrieve_count = 0
+        self.bytes_stored = 0
+        self.bytes_retrieved = 0
+        self.link_cache.clear()
+
+    def iter_links_from(self, link: IPAROLink, iparo: IPARO | None = None) -> Iterator[IPAROLink]:
+        """
+        Lazily yields the link to a node and the links to all of its predecessors, from latest to earliest
+        (in other words, in descending order of sequence numbers). An IPARO is only retrieved when the link
+        to its predecessor is not already known, so a caller that stops early only pays for the links it has
+        read. Only the links that have been discovered but not yet yielded are kept in memory.
+
+        If the link to a predecessor cannot be found (for instance, if some nodes are missing), then it is
+        skipped, and the iteration continues with the next known link.
+
+        :param link: The link to the node to start from.
+        :param iparo: The IPARO that the link points to, if it has already been retrieved.
+        """
+        known_links: dict[int, IPAROLink] = {link.seq_num: link}
+        if iparo is not None:
+            known_links.update({linked_iparo.seq_num: linked_iparo for linked_iparo in iparo.linked_iparos
+                                if linked_iparo.seq_num < link.seq_num})
+        # The link that was yielded last, which is used to look up the next link.
+        prev_link = None
+        for seq_num in reversed(range(link.seq_num + 1)):
+            if seq_num not in known_links and prev_link is not None:
+                try:
+                    prev_iparo = self.retrieve(prev_link.cid)
+                    known_links.update({linked_iparo.seq_num: linked_iparo
+                                        for linked_iparo in prev_iparo.linked_iparos
+                                        if linked_iparo.seq_num <= seq_num})
+                except IPARONotFoundException:
+                    pass
+            prev_link = known_links.pop(seq_num, None)
+            if prev_link is not None:
+                yield prev_link
+
+    def iter_links(self, url: str) -> Iterator[IPAROLink]:
+        """
+        Lazily yields the links to all IPAROs corresponding to the given URL, from latest to earliest.
+        See ``iter_links_from`` for more details.
+        """
+        latest_link, latest_iparo = self.get_link_to_latest_node(url)
+        yield from self.iter_links_from(latest_link, latest_iparo)
+
+    def iter_iparos_from(self, link: IPAROLink, iparo: IPARO | None = None) -> Iterator[tuple[IPAROLink, IPARO]]:
+        """
+        Lazily yields the link and the IPARO of a node and all of its predecessors, from latest to earliest,
+        by following the links to the immediately previous nodes. Each IPARO is retrieved only when it is
+        about to be yielded. The iteration stops at the first node, or at a node with no link to its
+        predecessor.
+
+        :param link: The link to the node to start from.
+        :param iparo: The IPARO that the link points to, if it has already been retrieved.
+        """
+        curr_link, curr_iparo = link, iparo
+        while True:
+            if curr_iparo is None:
+                curr_iparo = self.retrieve(curr_link.cid)
+            yield curr_link, curr_iparo
+
+            prev_links = [prev_link for prev_link in curr_iparo.linked_iparos
+                          if prev_link.seq_num == curr_iparo.seq_num - 1]
+            if not prev_links:
+                return
+            curr_link, curr_iparo = prev_links[0], None
+
+    def iter_iparos(self, url: str) -> Iterator[tuple[IPAROLink, IPARO]]:
+        """
+        Lazily yields the links and the IPAROs corresponding to the given URL, from latest to earliest.
+        See ``iter_iparos_from`` for more details.
+        """
+        latest_link, latest_iparo = self.get_link_to_latest_node(url)
+        yield from self.iter_iparos_from(latest_link, latest_iparo)
+
+    def iter_links_forward(self, url: str, seq_num: int = 0) -> Iterator[IPAROLink]:
+        """
+        Lazily yields the links to the IPAROs of a URL from a given sequence number onwards, from earliest
+        to latest. Since the links in the IPAROs only point backwards, the forward order is read from the
+        auxiliary structures instead: the version tree if the IPNS points at one, or else the index objects,
+        which list their entries from earliest to latest. The versions that are not covered by any index
+        object are found by walking back from the latest node, so without index objects, all versions from
+        the given sequence number onwards are found before the first one is yielded.
+
+        :param url: The URL.
+        :param seq_num: The sequence number of the first version to yield.
+        """
+        latest_cid = ipns.get_latest_cid(url)
+        root = self.retrieve(latest_cid)
+        if isinstance(root, VersionTreeNode):
+            yield from self.iter_links_forward_from_tree(seq_num, root)
+            return
+
+        # The last version that the index objects cover, or the version before the first one to yield.
+        covered = seq_num - 1
+        if root.index is not None and seq_num <= root.index.seq_num:
+            yield from self.iter_links_forward_from_index(seq_num, root.index)
+            covered = root.index.seq_num
+        latest_link = IPAROLink(seq_num=root.seq_num, timestamp=root.timestamp, cid=latest_cid)
+        remaining_links = list(takewhile(lambda link: link.seq_num > covered,
+                                         self.iter_links_from(latest_link, root)))
+        yield from reversed(remaining_links)
+
+    def iter_links_forward_from_index(self, seq_num: int, index_link: IPAROLink) -> Iterator[IPAROLink]:
+        """
+        Lazily yields the links to the versions covered by the index objects from a given sequence number
+        onwards, from earliest to latest. Each index object is retrieved once, when its first entry is
+        about to be yielded.
+
+        :param seq_num: The sequence number of the first version to yield.
+        :param index_link: The link to the latest index object.
+        """
+        latest_index = self.retrieve_index(index_link.cid)
+        index_links = latest_index.prior_indexes + [index_link]
+        first = bisect_left(index_links, seq_num, key=lambda link: link.seq_num)
+        for link in index_links[first:]:
+            index = latest_index if link is index_link else self.retrieve_index(link.cid)
+            yield from (entry for entry in index.entries if entry.seq_num >= seq_num)
+
+    def iter_links_forward_from_tree(self, seq_num: int, node: VersionTreeNode) -> Iterator[IPAROLink]:
+        """
+        Lazily yields the links to the versions in the subtree of a version tree node from a given sequence
+        number onwards, from earliest to latest. Each child node is retrieved once, when its first entry is
+        about to be yielded.
+
+        :param seq_num: The sequence number of the first version to yield.
+        :param node: The version tree node.
+        """
+        first = bisect_left(node.entries, seq_num, key=lambda link: link.seq_num)
+        if node.leaf:
+            yield from node.entries[first:]
+            return
+        for link in node.entries[first:]:
+            yield from self.iter_links_forward_from_tree(seq_num, self.retrieve_tree_node(link.cid))
 
     def get_all_links(self, url: str) -> set[IPAROLink]:
         """
-         Retrieves the set of all links in the IPFS, corresponding to the given URL.
-         This will also include all the CIDs.
+        Retrieves the set of all links in the IPFS, corresponding to the given URL.
+        This will also include all the CIDs. To stop early, use ``iter_links``.
         """
-        links = {}
         try:
-            curr_link, latest_iparo = self.get_link_to_latest_node(url)
-            links = {curr_link.seq_num: curr_link}
-            links.update({link.seq_num: link for link in latest_iparo.linked_iparos})
-            for curr_seq_num in reversed(range(latest_iparo.seq_num + 1)):
-                if curr_seq_num not in links:
-                    try:
-                        # Retrieve the link after the current sequence number, without using an IPFS lookup.
-                        curr_link = links[curr_seq_num + 1]
-                        # Now try to retrieve the IPARO from the links.
-                        curr_iparo = self.retrieve(curr_link.cid)
-
-                        # Add all links, then rinse and repeat.
-                        links.update({link.seq_num: link for link in curr_iparo.linked_iparos})
-                    except KeyError:
-                        pass
-                    except IPARONotFoundException:
-                        pass
-        finally:
-            return set(links.values())
+            return set(self.iter_links(url))
+        except IPARONotFoundException:
+            return set()
 
     def get_all_iparos(self, url: str) -> list[IPARO]:
         """
         Retrieves the list of all IPAROs in the IPFS, corresponding to the given URL.
-        The nodes are sorted from latest to earliest. This will also include all the CIDs.
+        The nodes are sorted from latest to earliest. If a node is missing, only the nodes
+        after it are included. To stop early, use ``iter_iparos``, and to iterate from earliest to
+        latest, use ``iter_links_forward``.
         """
         iparos = []
         try:
-            cid = ipns.get_latest_cid(url)
-            while True:
-                iparo = self.retrieve(cid)
+            for _, iparo in self.iter_iparos(url):
                 iparos.append(iparo)
-
-                links = [link for link in iparo.linked_iparos if link.seq_num == iparo.seq_num - 1]
-                if len(links) == 0:
-                    raise IPARONotFoundException()
-                cid = links[0].cid
-        finally:
-            return iparos
+        except IPARONotFoundException:
+            pass
+        return iparos
 
 
 ipfs = IPFS()
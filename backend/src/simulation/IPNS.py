@@ -1,8 +1,10 @@
 import gc
 import time
+from bisect import bisect_left, bisect_right
 
 from simulation.TimeUnit import TimeUnit
 from simulation.IPAROException import IPARONotFoundException
+from simulation.Observer import Observer
 
 
 class IPNS:
@@ -13,29 +15,50 @@ class IPNS:
         and counters for tracking operations.
         """
         self.__store: dict[str, str] = {}
-        self.__versions: dict[tuple[str, int], str] = {}
+        # For each URL, the sorted timestamps of all versions and the corresponding CIDs.
+        self.__versions: dict[str, tuple[list[int], list[str]]] = {}
         self.update_count = 0
         self.get_count = 0
+        self.observers: list[Observer] = []
+
+    def add_observer(self, observer: Observer):
+        """
+        Attaches an observer that is notified of every update and get.
+        """
+        self.observers.append(observer)
+
+    def remove_observer(self, observer: Observer):
+        """
+        Detaches an observer.
+        """
+        self.observers.remove(observer)
 
     # Add parameter datetime - str
-    def update(self, url: str, cid: str, timestamp: str = 'latest'):
+    def update(self, url: str, cid: str, timestamp: int | str = 'latest', latest_cid: str | None = None):
         """
         Updates the latest CID for a given URL with a given timestamp.
 
         Args:
             url (str): The URL of the website.
             cid (str): The CID of the latest capture.
-            timestamp (str): The string containing the timestamp (YYYY-mm-dd hh:mm:ss).
-            Default is latest.
+            timestamp (int | str): The timestamp of the capture, in microseconds since 1970.
+            Default is latest (the current time).
+            latest_cid (str | None): The CID that the URL points at, if it is not the capture itself (such as
+            the root of a version tree). The version index still maps the timestamp to the capture.
         """
         self.update_count += 1
         curr_timestamp = int(time.time() * TimeUnit.SECONDS) if timestamp == 'latest' else int(timestamp)
 
         # /archive/latest/{url} -> value of URL, map it to the CID [default]
-        self.__store[url] = cid
+        self.__store[url] = latest_cid or cid
 
         # /archive/{datetime}/{url} -> convert datetime, map it to the CID
-        self.__versions[(url, curr_timestamp)] = cid
+        timestamps, cids = self.__versions.setdefault(url, ([], []))
+        pos = bisect_right(timestamps, curr_timestamp)
+        timestamps.insert(pos, curr_timestamp)
+        cids.insert(pos, cid)
+        for observer in self.observers:
+            observer.on_update(url, cid, curr_timestamp)
 
     # Optional parameter: datetime ([un]serialized), default value is latest.
     def get_latest_cid(self, url: str) -> str:
@@ -53,8 +76,8 @@ class IPNS:
         """
         self.get_count += 1
         if url not in self.__store:
-            raise IPARONotFoundException(url)
-        return self.__store[url]
+            raise self.__not_found(url)
+        return self.__found(url, self.__store[url])
 
     def get_cid(self, url: str, timestamp: int) -> str:
         """
@@ -62,13 +85,108 @@ class IPNS:
 
         Args:
             url (str): The URL of the website.
-            timestamp (str): The 14-character-long timestamp for the
+            timestamp (int): The timestamp of the capture, in microseconds since 1970.
 
         Returns:
-            str: The CID of the latest capture for the given URL if it exists, else None.
+            str: The CID of the capture with exactly the given timestamp.
+
+        Exceptions:
+            IPARONotFoundException: If there is no capture with the given timestamp.
+        """
+        timestamps, cids = self.__get_versions(url)
+        pos = bisect_left(timestamps, timestamp)
+        if pos == len(timestamps) or timestamps[pos] != timestamp:
+            raise self.__not_found(timestamp)
+        return self.__found(url, cids[pos])
+
+    def get_floor_cid(self, url: str, timestamp: int) -> str:
+        """
+        Retrieves the CID of the latest capture at or before a given timestamp in O(log n).
+
+        Args:
+            url (str): The URL of the website.
+            timestamp (int): The timestamp, in microseconds since 1970.
+
+        Exceptions:
+            IPARONotFoundException: If every capture comes after the timestamp.
+        """
+        timestamps, cids = self.__get_versions(url)
+        pos = bisect_right(timestamps, timestamp)
+        if pos == 0:
+            raise self.__not_found(timestamp)
+        return self.__found(url, cids[pos - 1])
+
+    def get_ceiling_cid(self, url: str, timestamp: int) -> str:
+        """
+        Retrieves the CID of the earliest capture at or after a given timestamp in O(log n).
+
+        Args:
+            url (str): The URL of the website.
+            timestamp (int): The timestamp, in microseconds since 1970.
+
+        Exceptions:
+            IPARONotFoundException: If every capture comes before the timestamp.
+        """
+        timestamps, cids = self.__get_versions(url)
+        pos = bisect_left(timestamps, timestamp)
+        if pos == len(timestamps):
+            raise self.__not_found(timestamp)
+        return self.__found(url, cids[pos])
+
+    def get_nearest_cid(self, url: str, timestamp: int) -> str:
+        """
+        Retrieves the CID of the capture closest to a given timestamp in O(log n). If the timestamp is
+        exactly halfway between two captures, then the earlier capture is chosen.
+
+        Args:
+            url (str): The URL of the website.
+            timestamp (int): The timestamp, in microseconds since 1970.
+        """
+        timestamps, cids = self.__get_versions(url)
+        pos = bisect_left(timestamps, timestamp)
+        if pos == len(timestamps):
+            return self.__found(url, cids[-1])
+        if pos > 0 and timestamp - timestamps[pos - 1] <= timestamps[pos] - timestamp:
+            return self.__found(url, cids[pos - 1])
+        return self.__found(url, cids[pos])
+
+    def get_nth_cid(self, url: str, number: int) -> str:
+        """
+        Retrieves the CID of the n-th capture in order of time (starting from 0).
+
+        Args:
+            url (str): The URL of the website.
+            number (int): The index of the capture.
+        """
+        _, cids = self.__get_versions(url)
+        if not 0 <= number < len(cids):
+            raise self.__not_found(number)
+        return self.__found(url, cids[number])
+
+    def __get_versions(self, url: str) -> tuple[list[int], list[str]]:
+        """
+        Counts a get and returns the sorted timestamps and CIDs of a URL.
         """
         self.get_count += 1
-        return self.__versions[(url, timestamp)]
+        if url not in self.__versions:
+            raise self.__not_found(url)
+        return self.__versions[url]
+
+    def __found(self, url: str, cid: str) -> str:
+        """
+        Notifies the observers that a CID was found, and returns it.
+        """
+        for observer in self.observers:
+            observer.on_get(url, cid)
+        return cid
+
+    def __not_found(self, key: str | int) -> IPARONotFoundException:
+        """
+        Notifies the observers that a key was not found, and returns the exception to raise.
+        """
+        for observer in self.observers:
+            observer.on_not_found(key)
+        return IPARONotFoundException(key)
 
     def get_counts(self):
         """
@@ -84,8 +202,10 @@ class IPNS:
         Resets the data.
         """
         del self.__store
+        del self.__versions
         gc.collect()
         self.__store: dict[str, str] = {}
+        self.__versions: dict[str, tuple[list[int], list[str]]] = {}
 
     def reset_counts(self):
         """
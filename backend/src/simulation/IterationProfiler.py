@@ -0,0 +1,57 @@
+import tracemalloc
+from time import perf_counter_ns
+
+
+class IterationProfiler:
+    """
+    Measures the wall-clock latency of each iteration of an operation and, optionally, the peak amount of
+    memory allocated during the iteration. Measuring the latency only costs two calls to ``perf_counter_ns``,
+    whereas tracing the memory slows down every allocation, so it is only done when asked for.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        """
+        :param trace_memory: Whether to measure the peak amount of memory allocated in each iteration.
+        """
+        self.trace_memory = trace_memory
+        self.__started_tracing = False
+        self.__start_time = 0
+        self.__start_memory = 0
+
+    def start(self):
+        """
+        Starts tracing the memory allocations, if needed. This should be called before the first iteration.
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.__started_tracing = True
+
+    def stop(self):
+        """
+        Stops tracing the memory allocations, if they were traced by this profiler.
+        """
+        if self.__started_tracing:
+            tracemalloc.stop()
+            self.__started_tracing = False
+
+    def begin_iteration(self):
+        """
+        Starts measuring an iteration.
+        """
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self.__start_memory = tracemalloc.get_traced_memory()[0]
+        self.__start_time = perf_counter_ns()
+
+    def end_iteration(self) -> tuple[int, int]:
+        """
+        Stops measuring an iteration.
+
+        :returns: The latency of the iteration in nanoseconds, and the peak amount of memory allocated
+            during the iteration in bytes (or 0 if the memory is not traced).
+        """
+        latency = perf_counter_ns() - self.__start_time
+        peak_memory = 0
+        if self.trace_memory:
+            peak_memory = max(tracemalloc.get_traced_memory()[1] - self.__start_memory, 0)
+        return latency, peak_memory
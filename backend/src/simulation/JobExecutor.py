@@ -0,0 +1,278 @@
+import os
+import shlex
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+
+from simulation.CommandLineParser import CommandLineParser
+from simulation.CommandLineValidator import validator, post_validate
+from simulation.IPAROSimulation import IPAROSimulation
+
+# The name of the job table in the results folder, which the results store leaves out.
+JOB_TABLE_NAME = "jobs.db"
+# The folder with the simulation package, from which the processes of the jobs are run.
+SOURCE_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The minimum time between two reports of the progress of a job, in seconds.
+PROGRESS_INTERVAL = 0.5
+
+
+class JobStatus(str, Enum):
+    QUEUED = "Queued"
+    RUNNING = "Running"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+    INTERRUPTED = "Interrupted"
+    """
+    The job was running when its executor stopped, such as when the server was restarted.
+    """
+
+
+FINISHED_STATUSES = {JobStatus.DONE, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.INTERRUPTED}
+
+
+@dataclass
+class Job:
+    id: int
+    name: str
+    args: list[str]
+    """
+    The command-line arguments of the simulation, as for ``SimulationWriter.py``.
+    """
+    status: JobStatus
+    progress: float
+    """
+    The fraction of the operations of the simulation that are done.
+    """
+    message: str
+    submitted: float
+    started: float | None
+    finished: float | None
+
+
+class JobTable:
+    """
+    The table of the simulation jobs, which is kept in a SQLite database, so that the jobs outlive the page
+    that submitted them and the processes of the jobs can report their progress.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with self.__transaction() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS jobs (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                               "name TEXT NOT NULL, args TEXT NOT NULL, status TEXT NOT NULL, "
+                               "progress REAL NOT NULL DEFAULT 0, message TEXT NOT NULL DEFAULT '', "
+                               "submitted REAL NOT NULL, started REAL, finished REAL)")
+
+    @contextmanager
+    def __transaction(self):
+        # The timeout lets the processes of the jobs wait for each other's writes.
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def add(self, name: str, args: list[str]) -> int:
+        """
+        Adds a queued job, and gets its ID.
+        """
+        with self.__transaction() as connection:
+            return connection.execute("INSERT INTO jobs (name, args, status, submitted) VALUES (?, ?, ?, ?)",
+                                      (name, shlex.join(args), JobStatus.QUEUED, time.time())).lastrowid
+
+    def get_jobs(self, status: JobStatus | None = None, limit: int = -1) -> list[Job]:
+        """
+        Gets the jobs (or those with a status) in the order they were submitted.
+        """
+        query = "SELECT * FROM jobs" + (" WHERE status = ?" if status else "") + " ORDER BY id LIMIT ?"
+        with self.__transaction() as connection:
+            rows = connection.execute(query, (status, limit) if status else (limit,)).fetchall()
+        return [Job(job_id, name, shlex.split(args), JobStatus(status), progress, message, submitted, started,
+                    finished)
+                for job_id, name, args, status, progress, message, submitted, started, finished in rows]
+
+    def get_job(self, job_id: int) -> Job | None:
+        return next((job for job in self.get_jobs() if job.id == job_id), None)
+
+    def set_status(self, job_id: int, status: JobStatus, message: str = "",
+                   expected: set[JobStatus] | None = None) -> bool:
+        """
+        Sets the status of a job (and the time at which it started or finished), if it has one of the expected
+        statuses, so that a job that was cancelled is not marked as done by its process, for instance.
+
+        :returns: Whether the status was set.
+        """
+        columns = {"status": status, "message": message}
+        if status == JobStatus.QUEUED:
+            columns.update(progress=0, started=None, finished=None)
+        elif status == JobStatus.RUNNING:
+            columns["started"] = time.time()
+        else:
+            columns["finished"] = time.time()
+        query = f"UPDATE jobs SET {', '.join(f'{column} = ?' for column in columns)} WHERE id = ?"
+        parameters = [*columns.values(), job_id]
+        if expected is not None:
+            query += f" AND status IN ({', '.join('?' * len(expected))})"
+            parameters.extend(expected)
+        with self.__transaction() as connection:
+            return connection.execute(query, parameters).rowcount > 0
+
+    def set_progress(self, job_id: int, progress: float):
+        with self.__transaction() as connection:
+            connection.execute("UPDATE jobs SET progress = ? WHERE id = ?", (progress, job_id))
+
+    def interrupt_running_jobs(self):
+        """
+        Marks the jobs that are still running as interrupted, since their processes are gone.
+        """
+        with self.__transaction() as connection:
+            connection.execute("UPDATE jobs SET status = ?, finished = ? WHERE status = ?",
+                               (JobStatus.INTERRUPTED, time.time(), JobStatus.RUNNING))
+
+    def remove_finished_jobs(self):
+        with self.__transaction() as connection:
+            connection.execute(f"DELETE FROM jobs WHERE status IN ({', '.join('?' * len(FINISHED_STATUSES))})",
+                               list(FINISHED_STATUSES))
+
+
+def run_job(table_path: str, job_id: int):
+    """
+    Runs the simulation of a job, in the process of the job, reporting its progress to the job table.
+    """
+    table = JobTable(table_path)
+    args = table.get_job(job_id).args
+    last_report = 0.0
+
+    def report_progress(progress: float):
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            table.set_progress(job_id, progress)
+
+    try:
+        parsed_args = validator.parse_args(args)
+        post_validate(parsed_args)
+        IPAROSimulation(CommandLineParser(parsed_args).parse_environment(), report_progress).run()
+    except SystemExit as e:
+        table.set_status(job_id, JobStatus.FAILED, f"Invalid arguments (exit code {e.code}).", {JobStatus.RUNNING})
+    except Exception as e:
+        table.set_status(job_id, JobStatus.FAILED, f"{type(e).__name__}: {e}", {JobStatus.RUNNING})
+    else:
+        table.set_progress(job_id, 1.0)
+        table.set_status(job_id, JobStatus.DONE, expected={JobStatus.RUNNING})
+
+
+class JobExecutor:
+    """
+    Runs the queued jobs of a job table in the background, each in its own process, with up to one job per
+    CPU core at once. The jobs keep running when the page that submitted them is closed. Only one executor
+    should run the jobs of a table, since the jobs that are running when an executor starts are marked as
+    interrupted.
+    """
+
+    def __init__(self, table: JobTable, max_workers: int | None = None, poll_interval: float = 0.2):
+        """
+        :param table: The job table.
+        :param max_workers: The maximum number of jobs that run at once. Default is the number of CPU cores.
+        :param poll_interval: The time between two checks for finished and queued jobs, in seconds.
+        """
+        self.table = table
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.poll_interval = poll_interval
+        self.__processes: dict[int, subprocess.Popen] = {}
+        self.__lock = threading.Lock()
+        self.__wake = threading.Event()
+        self.__stopped = False
+        table.interrupt_running_jobs()
+        self.__thread = threading.Thread(target=self.__run, name="JobExecutor", daemon=True)
+        self.__thread.start()
+
+    def submit(self, name: str, args: list[str]) -> int:
+        """
+        Queues a simulation, and gets the ID of its job.
+
+        :param name: The name of the job.
+        :param args: The command-line arguments of the simulation, as for ``SimulationWriter.py``.
+        """
+        job_id = self.table.add(name, args)
+        self.__wake.set()
+        return job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """
+        Cancels a job that is queued or running, stopping its process. The results of the operations that
+        were done are kept.
+
+        :returns: Whether the job was cancelled.
+        """
+        with self.__lock:
+            if not self.table.set_status(job_id, JobStatus.CANCELLED, expected={JobStatus.QUEUED, JobStatus.RUNNING}):
+                return False
+            process = self.__processes.pop(job_id, None)
+        if process:
+            process.terminate()
+            process.wait()
+        return True
+
+    def retry(self, job_id: int) -> bool:
+        """
+        Queues a job that failed, was cancelled or was interrupted again.
+
+        :returns: Whether the job was queued.
+        """
+        queued = self.table.set_status(job_id, JobStatus.QUEUED,
+                                       expected={JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.INTERRUPTED})
+        self.__wake.set()
+        return queued
+
+    def shutdown(self):
+        """
+        Stops the executor, and cancels the jobs that are running.
+        """
+        self.__stopped = True
+        self.__wake.set()
+        self.__thread.join()
+        for job_id in list(self.__processes):
+            self.cancel(job_id)
+
+    def __run(self):
+        while not self.__stopped:
+            self.__wake.wait(self.poll_interval)
+            self.__wake.clear()
+            with self.__lock:
+                if self.__stopped:
+                    break
+                self.__reap_processes()
+                self.__start_queued_jobs()
+
+    def __reap_processes(self):
+        for job_id, process in list(self.__processes.items()):
+            if process.poll() is not None:
+                del self.__processes[job_id]
+                # The job is still running if its process died without finishing it (such as when it ran out of
+                # memory).
+                self.table.set_status(job_id, JobStatus.FAILED, f"The process exited with code {process.returncode}.",
+                                      {JobStatus.RUNNING})
+
+    def __start_queued_jobs(self):
+        num_free_workers = self.max_workers - len(self.__processes)
+        if num_free_workers <= 0:
+            return
+        for job in self.table.get_jobs(JobStatus.QUEUED, num_free_workers):
+            if self.table.set_status(job.id, JobStatus.RUNNING, expected={JobStatus.QUEUED}):
+                # The job runs in a new interpreter, which does not depend on the main module of this process.
+                self.__processes[job.id] = subprocess.Popen(
+                    [sys.executable, "-m", "simulation.JobExecutor", os.path.abspath(self.table.path), str(job.id)],
+                    cwd=SOURCE_FOLDER)
+
+
+if __name__ == '__main__':
+    run_job(sys.argv[1], int(sys.argv[2]))
@@ -0,0 +1,78 @@
+from collections import deque
+from dataclasses import replace
+from itertools import chain
+
+from simulation.IPARO import IPARO
+from simulation.IPAROLink import IPAROLink
+
+
+class LinkDeltaEncoder:
+    """
+    Delta encodes the links of the IPAROs on the archiver's side. The links of an IPARO are stored as the
+    links added to and removed from the links of an ancestor, which is either its skip-delta ancestor (the
+    one whose sequence number is its own sequence number with the lowest set bit cleared), or any other
+    ancestor that the archiver keeps whose links resolve through at most as many ancestors. The ancestor with
+    the smallest delta is chosen, so the links of the n-th IPARO resolve through at most log2(n) ancestors.
+    If no delta is smaller than the links themselves, then the links are stored as they are.
+
+    The archiver keeps the links of the skip-delta ancestors of the next IPARO, as well as those of the
+    latest few IPAROs, so encoding costs no retrieves.
+    """
+
+    def __init__(self, window: int = 8):
+        """
+        :param window: The number of latest IPAROs that are kept as candidate ancestors.
+        """
+        # The links, the links of the IPARO, and the number of ancestors that its links resolve through.
+        self.ancestors: list[tuple[IPAROLink, frozenset[IPAROLink], int]] = []
+        self.recent: deque[tuple[IPAROLink, frozenset[IPAROLink], int]] = deque(maxlen=window)
+        self.__pending: tuple[frozenset[IPAROLink], int] | None = None
+
+    @staticmethod
+    def get_base_seq_num(seq_num: int) -> int:
+        """
+        Gets the sequence number of the skip-delta ancestor of an IPARO.
+        """
+        return seq_num & (seq_num - 1)
+
+    def encode(self, iparo: IPARO) -> IPARO:
+        """
+        Gets the delta encoded copy of an IPARO, which is the one to store. The IPARO itself is not modified.
+        The link to the stored copy must be added with ``add`` before the next IPARO is encoded.
+
+        :param iparo: The IPARO with all of its links.
+        """
+        base_seq_num = self.get_base_seq_num(iparo.seq_num)
+        while self.ancestors and self.ancestors[-1][0].seq_num > base_seq_num:
+            self.ancestors.pop()
+
+        links = frozenset(iparo.linked_iparos)
+        self.__pending = (links, 0)
+        if iparo.seq_num == 0 or not self.ancestors:
+            return iparo
+
+        max_depth = self.ancestors[-1][2]
+        # The base link counts towards the size of the delta.
+        best_size, best_base = len(links), None
+        for base in chain(self.ancestors, self.recent):
+            base_link, base_links, depth = base
+            if depth <= max_depth and (size := len(links ^ base_links) + 1) < best_size:
+                best_size, best_base = size, base
+        if best_base is None:
+            return iparo
+
+        base_link, base_links, depth = best_base
+        self.__pending = (links, depth + 1)
+        return replace(iparo, linked_iparos=set(links - base_links), link_delta_base=base_link,
+                       removed_links=set(base_links - links))
+
+    def add(self, link: IPAROLink):
+        """
+        Adds the most recently encoded IPARO as a candidate ancestor for the next IPAROs.
+
+        :param link: The link to the stored copy of the most recently encoded IPARO.
+        """
+        links, depth = self.__pending
+        self.ancestors.append((link, links, depth))
+        self.recent.append((link, links, depth))
+        self.__pending = None
@@ -1,12 +1,15 @@
 import random
 from abc import abstractmethod, ABC
+from datetime import datetime, timedelta, timezone
 from math import floor
 
 from simulation.IPARO import IPARO
 from simulation.IPAROLink import IPAROLink
 from simulation.IPAROLinkFactory import IPAROLinkFactory
 from simulation.IPFS import ipfs, Mode
+from simulation.IPNS import ipns
 from simulation.TimeUnit import TimeUnit
+from simulation.VersionTreeNode import VersionTreeNode
 
 
 class LinkingStrategy(ABC):
@@ -17,16 +20,29 @@ class LinkingStrategy(ABC):
     """
 
     @abstractmethod
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         """
         Gets the candidate nodes from the latest link, the latest IPARO, and the first link.
         :param latest_link: The link to the latest node.
         :param latest_iparo: The latest IPARO object.
         :param first_link: The link to the first node if it is directly linked to the latest node, None otherwise.
+        :param timestamp: The timestamp of the new IPARO, if it is known, for strategies that depend on it.
         :returns: The set of candidate links that will be stored in the newly created IPARO.
         """
         pass
 
+    def retrieve_iparo_by_url_and_timestamp(self, url: str, timestamp: int, mode: Mode = Mode.CLOSEST) -> IPAROLink:
+        """
+        Retrieves the IPARO given a URL and a timestamp, according to a given mode. Strategies whose links
+        can be searched by time more directly than with the greedy search method override this.
+
+        :param url: The URL.
+        :param timestamp: The timestamp.
+        :param mode: The mode by which we find the IPARO.
+        """
+        return ipfs.retrieve_iparo_by_url_and_timestamp(url, timestamp, mode)
+
     @abstractmethod
     def __str__(self):
         """
@@ -40,7 +56,8 @@ class SingleStrategy(LinkingStrategy):
     def __str__(self):
         return "Single"
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         return {latest_link}
 
 
@@ -49,7 +66,8 @@ class ComprehensiveStrategy(LinkingStrategy):
     def __str__(self):
         return "Comprehensive"
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         latest_node_links = latest_iparo.linked_iparos.copy()
         latest_node_links.add(latest_link)
 
@@ -63,7 +81,8 @@ class KPreviousStrategy(LinkingStrategy):
     def __str__(self):
         return f"{self.k}-Previous"
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         linked_iparos = latest_iparo.linked_iparos.copy()
         linked_iparos.add(latest_link)
         seq_num_to_drop = max(latest_link.seq_num - self.k, 0)
@@ -87,7 +106,8 @@ class KRandomStrategy(LinkingStrategy):
     def __init__(self, k: int):
         self.k = k
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         latest_node_links = latest_iparo.linked_iparos
         num_nodes = latest_link.seq_num
         if num_nodes <= self.k:
@@ -109,7 +129,8 @@ class SequentialExponentialStrategy(LinkingStrategy):
     def __init__(self, k: float):
         self.k = k
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         node_num = latest_link.seq_num
         indices: set[int] = {0, node_num}
         index = 1.0
@@ -123,12 +144,50 @@ class SequentialExponentialStrategy(LinkingStrategy):
         return f"Base-{self.k} Sequential Exponential"
 
 
+class SkewBinaryStrategy(LinkingStrategy):
+    """
+    Links to the previous node, the first node, and one jump node, where the jumps are laid out like
+    a skew-binary random-access list. Each node stores at most three links, finding the jump node
+    costs at most two IPFS retrieves, and the greedy search reaches any node in O(log n) hops.
+    """
+
+    @staticmethod
+    def get_jump_seq_num(seq_num: int) -> int:
+        """
+        Gets the sequence number of the node that the node with the given (positive) sequence number
+        jumps to. Writing the sequence number as a sum of the largest possible numbers of the form
+        2^k - 1 (its skew-binary decomposition), the jump skips over the smallest of them.
+        """
+        remainder = seq_num
+        smallest_term = seq_num
+        while remainder > 0:
+            term = (1 << remainder.bit_length()) - 1
+            if term > remainder:
+                term >>= 1
+            smallest_term = term
+            remainder -= term
+        return seq_num - smallest_term
+
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
+        jump_seq_num = self.get_jump_seq_num(latest_link.seq_num + 1)
+        links = {first_link, latest_link}
+        # The jump target is the jump of the latest node's jump, so it is at most two hops away.
+        if jump_seq_num != latest_link.seq_num:
+            links.add(ipfs.retrieve_nth_iparo(jump_seq_num, latest_link))
+        return links
+
+    def __str__(self):
+        return "Skew Binary"
+
+
 class SequentialUniformNPriorStrategy(LinkingStrategy):
 
     def __init__(self, n: int):
         self.n = n
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         indices: set[int] = {latest_iparo.seq_num * i // (self.n + 1) for i in range(self.n + 2)}
         return IPAROLinkFactory.from_indices(latest_link, indices)
 
@@ -142,7 +201,8 @@ class SequentialSMaxGapStrategy(LinkingStrategy):
     def __init__(self, s: int):
         self.s = s
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         # Sequentially add nodes with no more than S hops between them
         start_seq_num = latest_link.seq_num - self.s
 
@@ -167,7 +227,8 @@ class TemporalUniformStrategy(LinkingStrategy):
     def __init__(self, n: int):
         self.n = n  # Number of uniformly distributed links to create
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         time_window = latest_link.timestamp - first_link.timestamp
         # Adds nodes sequenced as 1, 2, ..., n-1
         timestamps = {int(first_link.timestamp + i * time_window / self.n) for i in range(1, self.n)}
@@ -192,7 +253,8 @@ class TemporalMinGapStrategy(LinkingStrategy):
         """
         self.min_gap = min_gap
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         curr_link = latest_link
         current_time = latest_link.timestamp
         known_links = {first_link, latest_link}
@@ -233,7 +295,8 @@ class TemporalExponentialStrategy(LinkingStrategy):
         self.base = base
         self.time_unit = time_unit
 
-    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink) -> set[IPAROLink]:
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
         # Exponential time gaps - assume number of nodes >= 1
         gap = self.time_unit * TimeUnit.SECONDS
         time_window = latest_iparo.timestamp - first_link.timestamp
@@ -252,3 +315,99 @@ class TemporalExponentialStrategy(LinkingStrategy):
 
     def __str__(self):
         return f"Temporal Exponential ({self.time_unit} Second(s), Base {self.base})"
+
+
+class TemporalCalendarStrategy(LinkingStrategy):
+    """
+    Links to the latest version before the start of the new version's year, month, day, hour, minute and second
+    (in UTC), and then before the start of each decimal fraction of a second down to the resolution. Every
+    such version is either linked from the latest node or is the latest node itself, so storing costs no
+    IPFS retrieves, and a time lookup descends the calendar hierarchy one bucket at a time.
+    """
+    EPOCH = datetime.fromtimestamp(0, tz=timezone.utc)
+
+    def __init__(self, resolution: float = 0.001):
+        """
+        :param resolution: the width of the finest bucket in seconds.
+        """
+        self.resolution = resolution
+
+    def get_bucket_starts(self, timestamp: int) -> list[int]:
+        """
+        Gets the timestamps at which the buckets containing the given timestamp start, from the year
+        down to the finest bucket.
+        """
+        date = self.EPOCH + timedelta(microseconds=int(timestamp))
+        year_start = datetime(date.year, 1, 1, tzinfo=timezone.utc)
+        month_start = datetime(date.year, date.month, 1, tzinfo=timezone.utc)
+        starts = [(start - self.EPOCH) // timedelta(microseconds=1) for start in (year_start, month_start)]
+
+        widths = [TimeUnit.DAYS, TimeUnit.HOURS, TimeUnit.MINUTES, TimeUnit.SECONDS]
+        width = TimeUnit.SECONDS // 10
+        while width >= 1:
+            widths.append(width)
+            width //= 10
+        finest_width = max(self.resolution * TimeUnit.SECONDS, 1)
+        starts += [timestamp - timestamp % width for width in widths if width >= finest_width]
+        return starts
+
+    def get_candidate_nodes(self, latest_link: IPAROLink, latest_iparo: IPARO, first_link: IPAROLink,
+                            timestamp: int | None = None) -> set[IPAROLink]:
+        # The buckets are those of the new version. If its timestamp is not given, then the buckets of the latest
+        # version are used instead, which are the same unless the new version starts a new bucket.
+        if timestamp is None:
+            timestamp = latest_link.timestamp
+        # If the previous node is in the same bucket, it links to the latest version before that bucket.
+        # Otherwise, the previous node is itself the latest version before the bucket.
+        known_links = latest_iparo.linked_iparos | {latest_link}
+        links = {first_link, latest_link}
+        for start in self.get_bucket_starts(timestamp):
+            links_before = [link for link in known_links if link.timestamp < start]
+            if links_before:
+                links.add(max(links_before, key=lambda link: link.seq_num))
+
+        return links
+
+    def retrieve_closest_iparo(self, latest_link: IPAROLink, latest_iparo: IPARO, timestamp: int,
+                               mode: Mode = Mode.CLOSEST) -> IPAROLink:
+        """
+        Retrieves the link to the IPARO closest to a given timestamp, according to a given mode, by descending
+        the calendar hierarchy from the latest node. Every node links to the latest version before the start
+        of each of its year, month, day, hour (and so on) buckets, so the earliest of its links after the
+        timestamp is the latest version before the coarsest bucket that starts after the timestamp. Each
+        retrieve either moves down to a finer bucket or back by one bucket at the same level, until a node
+        links to both of the versions around the timestamp.
+
+        :param latest_link: The link to the latest node.
+        :param latest_iparo: The latest IPARO.
+        :param timestamp: The timestamp.
+        :param mode: The mode by which we find the IPARO.
+        """
+        if latest_link.timestamp <= timestamp:
+            return latest_link
+        curr_link, iparo = latest_link, latest_iparo
+        while curr_link.seq_num != 0:
+            if iparo is None:
+                iparo = ipfs.retrieve(curr_link.cid)
+            if iparo.index is not None and timestamp <= iparo.index.timestamp:
+                return ipfs.retrieve_closest_iparo_from_index(iparo.index, timestamp, mode)
+            # The latest known version at or before the timestamp, and the earliest known one after it.
+            prev_link = max((link for link in iparo.linked_iparos if link.timestamp <= timestamp),
+                            key=lambda link: link.seq_num, default=None)
+            next_link = min((link for link in iparo.linked_iparos if link.timestamp > timestamp),
+                            key=lambda link: link.seq_num, default=curr_link)
+            if prev_link is not None and prev_link.seq_num + 1 == next_link.seq_num:
+                return ipfs.choose_link(prev_link, next_link, timestamp, mode)
+            curr_link, iparo = next_link, None
+        return curr_link
+
+    def retrieve_iparo_by_url_and_timestamp(self, url: str, timestamp: int, mode: Mode = Mode.CLOSEST) -> IPAROLink:
+        latest_cid = ipns.get_latest_cid(url)
+        root = ipfs.retrieve(latest_cid)
+        if isinstance(root, VersionTreeNode):
+            return ipfs.retrieve_closest_iparo_from_tree(timestamp, root, mode)
+        latest_link = IPAROLink(seq_num=root.seq_num, timestamp=root.timestamp, cid=latest_cid)
+        return self.retrieve_closest_iparo(latest_link, root, timestamp, mode)
+
+    def __str__(self):
+        return f"Temporal Calendar ({self.resolution} Seconds)"
@@ -0,0 +1,51 @@
+class Observer:
+    """
+    Observes the operations performed on the IPFS and the IPNS. An observer is attached with
+    ``add_observer`` on either of them, and is notified of every operation after it is performed, so that
+    metrics such as traces, byte counts, cache hits or latencies can be measured without modifying the
+    IPFS and the IPNS. When no observers are attached, notifying costs a single check per operation.
+
+    Every hook does nothing by default, so an observer only overrides the hooks it needs.
+    """
+
+    def on_store(self, cid: str, seq_num: int | None, size: int):
+        """
+        Called after an object is stored in the IPFS.
+
+        :param cid: The CID of the object.
+        :param seq_num: The sequence number of the object, or None if it is not an IPARO.
+        :param size: The encoded size of the object in bytes.
+        """
+
+    def on_retrieve(self, cid: str, seq_num: int | None, size: int):
+        """
+        Called after an object is retrieved from the IPFS.
+
+        :param cid: The CID of the object.
+        :param seq_num: The sequence number of the object, or None if it is not an IPARO.
+        :param size: The encoded size of the object in bytes.
+        """
+
+    def on_not_found(self, key: str | int):
+        """
+        Called when an object is not found in the IPFS, or a CID is not found in the IPNS.
+
+        :param key: The CID, URL, timestamp or number that was not found.
+        """
+
+    def on_update(self, url: str, cid: str, timestamp: int):
+        """
+        Called after the IPNS is updated.
+
+        :param url: The URL of the website.
+        :param cid: The CID that the URL is mapped to.
+        :param timestamp: The timestamp of the capture, in microseconds since 1970.
+        """
+
+    def on_get(self, url: str, cid: str):
+        """
+        Called after a CID is found in the IPNS.
+
+        :param url: The URL of the website.
+        :param cid: The CID that was found.
+        """
@@ -0,0 +1,215 @@
+import math
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+# The relative error of the quantiles estimated by the sketches.
+RELATIVE_ACCURACY = 0.01
+# The statistics of a summary, in the order of ``DataFrame.describe``.
+STATISTICS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+QUANTILES = [0.25, 0.5, 0.75]
+
+
+class DDSketch:
+    """
+    A quantile sketch (Masson et al., 2019) that counts the values in buckets whose bounds grow geometrically,
+    so that every quantile is estimated within a relative error, and the memory grows with the logarithm of
+    the range of the values instead of their number. Sketches with the same accuracy can be merged exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.__log_gamma = math.log(self.gamma)
+        # The counts of the positive and the negative values, by the indices of their buckets.
+        self.bins: dict[int, int] = {}
+        self.negative_bins: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+
+    def get_key(self, value: float) -> int:
+        """
+        Gets the index of the bucket of a positive value, which holds the values in (gamma^(i - 1), gamma^i].
+        """
+        return math.ceil(math.log(value) / self.__log_gamma)
+
+    def get_value(self, key: int) -> float:
+        """
+        Gets the estimate of the values in a bucket, whose relative error is at most the relative accuracy.
+        """
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def add(self, value: float, count: int = 1):
+        if value > 0:
+            key = self.get_key(value)
+            self.bins[key] = self.bins.get(key, 0) + count
+        elif value < 0:
+            key = self.get_key(-value)
+            self.negative_bins[key] = self.negative_bins.get(key, 0) + count
+        else:
+            self.zero_count += count
+        self.count += count
+
+    def merge(self, other: 'DDSketch'):
+        """
+        Adds the values of another sketch with the same accuracy to this sketch.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Only sketches with the same relative accuracy can be merged.")
+        for bins, other_bins in ((self.bins, other.bins), (self.negative_bins, other.negative_bins)):
+            for key, count in other_bins.items():
+                bins[key] = bins.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+
+    def get_quantile(self, q: float) -> float:
+        """
+        Estimates a quantile, as the value whose rank is ``q * (count - 1)`` like ``DataFrame.quantile``
+        (without the interpolation between two values), or NaN if the sketch is empty.
+        """
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+        # From the most negative values to the most positive ones.
+        for key in sorted(self.negative_bins, reverse=True):
+            seen += self.negative_bins[key]
+            if seen > rank:
+                return -self.get_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return self.get_value(key)
+        return self.get_value(max(self.bins))
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Gets the buckets as arrays, which can be saved with ``np.savez``.
+        """
+        return {"keys": np.fromiter(self.bins, np.int64, len(self.bins)),
+                "counts": np.fromiter(self.bins.values(), np.int64, len(self.bins)),
+                "negative_keys": np.fromiter(self.negative_bins, np.int64, len(self.negative_bins)),
+                "negative_counts": np.fromiter(self.negative_bins.values(), np.int64, len(self.negative_bins)),
+                "zero_count": np.int64(self.zero_count)}
+
+    @classmethod
+    def from_arrays(cls, arrays: dict[str, np.ndarray], relative_accuracy: float = RELATIVE_ACCURACY) -> 'DDSketch':
+        """
+        Makes a sketch from the arrays of ``to_arrays``.
+        """
+        sketch = cls(relative_accuracy)
+        sketch.bins = dict(zip(arrays["keys"].tolist(), arrays["counts"].tolist()))
+        sketch.negative_bins = dict(zip(arrays["negative_keys"].tolist(), arrays["negative_counts"].tolist()))
+        sketch.zero_count = int(arrays["zero_count"])
+        sketch.count = sketch.zero_count + sum(sketch.bins.values()) + sum(sketch.negative_bins.values())
+        return sketch
+
+
+class OnlineStatistics:
+    """
+    The summary of the rows of some columns, which is updated one row at a time in constant memory: the mean
+    and the variance of each column are updated with Welford's algorithm, and its quantiles are estimated
+    with a ``DDSketch``. The statistics of rows that were added separately (such as by parallel workers) can
+    be merged.
+    """
+
+    def __init__(self, columns: Sequence[str], relative_accuracy: float = RELATIVE_ACCURACY):
+        self.columns = list(columns)
+        self.relative_accuracy = relative_accuracy
+        self.count = 0
+        self.mean = np.zeros(len(self.columns))
+        # The sum of the squared deviations from the mean.
+        self.m2 = np.zeros(len(self.columns))
+        self.minimum = np.full(len(self.columns), np.inf)
+        self.maximum = np.full(len(self.columns), -np.inf)
+        self.sketches = [DDSketch(relative_accuracy) for _ in self.columns]
+
+    def add(self, row: Sequence[float]):
+        """
+        Adds a row, with a value for each column.
+        """
+        row = np.asarray(row, dtype=np.float64)
+        self.count += 1
+        delta = row - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (row - self.mean)
+        np.minimum(self.minimum, row, out=self.minimum)
+        np.maximum(self.maximum, row, out=self.maximum)
+        for sketch, value in zip(self.sketches, row.tolist()):
+            sketch.add(value)
+
+    def merge(self, other: 'OnlineStatistics'):
+        """
+        Adds the rows of other statistics of the same columns to these statistics (Chan et al., 1979).
+        """
+        if other.columns != self.columns:
+            raise ValueError("Only statistics of the same columns can be merged.")
+        count = self.count + other.count
+        if not count:
+            return
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        np.minimum(self.minimum, other.minimum, out=self.minimum)
+        np.maximum(self.maximum, other.maximum, out=self.maximum)
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+    @property
+    def std(self) -> np.ndarray:
+        """
+        The sample standard deviation of each column, like ``DataFrame.std`` (NaN for fewer than two rows).
+        """
+        if self.count < 2:
+            return np.full(len(self.columns), np.nan)
+        return np.sqrt(self.m2 / (self.count - 1))
+
+    def describe(self) -> pd.DataFrame:
+        """
+        Gets the summary of the columns in the same form as ``DataFrame.describe``. The quartiles are estimates,
+        which are within the relative accuracy of the sketches (and between the minimum and the maximum).
+        """
+        if not self.count:
+            summary = pd.DataFrame(np.nan, index=STATISTICS, columns=self.columns)
+            summary.loc["count"] = 0.0
+            return summary
+        quartiles = np.array([[sketch.get_quantile(q) for sketch in self.sketches] for q in QUANTILES])
+        quartiles = np.clip(quartiles, self.minimum, self.maximum)
+        values = np.vstack((np.full(len(self.columns), float(self.count)), self.mean, self.std, self.minimum,
+                            quartiles, self.maximum))
+        return pd.DataFrame(values, index=STATISTICS, columns=self.columns)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Gets the statistics as arrays, which can be saved with ``np.savez`` and merged after they are loaded.
+        """
+        arrays = {"statistics.columns": np.array(self.columns, dtype=str),
+                  "statistics.relative_accuracy": np.float64(self.relative_accuracy),
+                  "statistics.count": np.int64(self.count), "statistics.mean": self.mean,
+                  "statistics.m2": self.m2, "statistics.minimum": self.minimum, "statistics.maximum": self.maximum}
+        for i, sketch in enumerate(self.sketches):
+            arrays.update({f"sketch{i}.{name}": array for name, array in sketch.to_arrays().items()})
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays) -> 'OnlineStatistics':
+        """
+        Makes statistics from the arrays of ``to_arrays`` (or an ``NpzFile`` with them).
+        """
+        statistics = cls(arrays["statistics.columns"].tolist(), float(arrays["statistics.relative_accuracy"]))
+        statistics.count = int(arrays["statistics.count"])
+        statistics.mean = arrays["statistics.mean"].astype(np.float64)
+        statistics.m2 = arrays["statistics.m2"].astype(np.float64)
+        statistics.minimum = arrays["statistics.minimum"].astype(np.float64)
+        statistics.maximum = arrays["statistics.maximum"].astype(np.float64)
+        statistics.sketches = [
+            DDSketch.from_arrays({name: arrays[f"sketch{i}.{name}"]
+                                  for name in ("keys", "counts", "negative_keys", "negative_counts", "zero_count")},
+                                 statistics.relative_accuracy)
+            for i in range(len(statistics.columns))]
+        return statistics
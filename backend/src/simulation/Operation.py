@@ -1,17 +1,43 @@
+import cProfile
+import math
 import os.path
+import pstats
 import random
+from itertools import islice
+from time import perf_counter_ns
 from abc import abstractmethod
+from typing import Callable
 
 import numpy as np
 import pandas as pd
+from scipy.stats import t
 
 from simulation.IPAROException import IPARONotFoundException
+from simulation.IPAROIndexBuilder import IPAROIndexBuilder
+from simulation.IPAROLink import IPAROLink
 from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
 from simulation.IPFS import ipfs
 from simulation.IPNS import ipns
+from simulation.IterationProfiler import IterationProfiler
+from simulation.LinkDeltaEncoder import LinkDeltaEncoder
+from simulation.OnlineStatistics import OnlineStatistics
+from simulation.ResultsStore import write_partition, write_summary, PARTITION_SUFFIX, SUMMARY_SUFFIX
+from simulation.TraceRecorder import TraceRecorder, get_operation_id
 from simulation.VersionDensity import VersionGenerator
+from simulation.VersionTreeBuilder import VersionTreeBuilder
 
 URL = "example.com"
+# The columns that are recorded for every iteration of every operation.
+COLUMNS = ["IPNS Get", "IPNS Update", "IPFS Store", "IPFS Retrieve", "Bytes Stored", "Bytes Retrieved"]
+# The columns measured by the profiler, which are summarized with the op counts.
+LATENCY_COLUMN = "Latency (ns)"
+PEAK_MEMORY_COLUMN = "Peak Memory (Bytes)"
+# The time spent in the linking strategy by the store operations, which is part of the latency.
+POLICY_LATENCY_COLUMN = "Policy Latency (ns)"
+# The column whose mean decides when an operation with an adaptive number of iterations stops.
+ADAPTIVE_COLUMN = COLUMNS.index("IPFS Retrieve")
+# The confidence level of the confidence interval of the mean that decides when such an operation stops.
+CONFIDENCE_LEVEL = 0.95
 
 
 # Resets the data.
@@ -24,6 +50,25 @@ def reset(reset_data=False):
     ipns.reset_counts()
 
 
+def get_time_window(url: str) -> tuple[int, int]:
+    """
+    Gets the timestamps of the first and the latest versions of a URL. The lookups are counted
+    like any other operation, so the counts should be reset before the measurement starts.
+    """
+    latest_link, _ = ipfs.get_link_to_latest_node(url)
+    first_link = ipfs.retrieve_nth_iparo(0, latest_link)
+    return first_link.timestamp, latest_link.timestamp
+
+
+def get_iteration_counts() -> list[float]:
+    """Gets the counts of the current iteration, in the order of ``COLUMNS``."""
+    ipfs_counts = ipfs.get_counts()
+    ipns_counts = ipns.get_counts()
+    return [float(ipns_counts["get"]), float(ipns_counts["update"]),
+            float(ipfs_counts["store"]), float(ipfs_counts["retrieve"]),
+            float(ipfs_counts["bytes_stored"]), float(ipfs_counts["bytes_retrieved"])]
+
+
 class Operation:
     """
     The Operation class is designed to encapsulate each operation from the user input.
@@ -45,6 +90,13 @@ class Operation:
 
 
 class IterableOperation(Operation):
+    # Whether each iteration is traced as one traversal, or the operation traces its traversals itself.
+    traces_steps = True
+    # Whether the iterations are repetitions of the same measurement, so that their number can be adapted to
+    # the confidence interval of the mean (see ``IPAROSimulationEnvironment.ci_width``) and they can be
+    # summarized online instead of kept (see ``IPAROSimulationEnvironment.summary_only``). Operations with a set
+    # number of iterations never are.
+    repeats_iterations = True
 
     def __init__(self, env: IPAROSimulationEnvironment, save_to_file: bool = True, iterations: int = 0):
         """
@@ -54,10 +106,41 @@ class IterableOperation(Operation):
         """
         self.env = env
         self.iterations = iterations or env.iterations
+        repeated = self.repeats_iterations and not iterations
+        self.adaptive = repeated and env.ci_width > 0
+        self.summary_only = repeated and env.summary_only
+        if self.adaptive:
+            # There is room for the maximum number of iterations, and the rest is cut off when the operation stops.
+            self.iterations = env.max_iterations
         self.opcounts = None
-        self.data = np.zeros((self.iterations, 4), dtype=np.float64)
-        self.output_path = f"{str(self.env)}-{self.name()}.csv"
+        # The rows of the iterations, which are only kept if they are saved.
+        num_rows = 0 if self.summary_only else self.iterations
+        self.data = np.zeros((num_rows, len(COLUMNS)), dtype=np.float64)
+        self.output_path = f"{str(self.env)}-{self.name()}{SUMMARY_SUFFIX if self.summary_only else PARTITION_SUFFIX}"
         self.save_to_file = save_to_file
+        self.profiler = IterationProfiler(env.trace_memory) if env.timing or env.trace_memory else None
+        self.latencies = np.zeros(num_rows, dtype=np.int64)
+        self.peak_memory = np.zeros(num_rows, dtype=np.int64)
+        # The latency and the peak memory of the current iteration.
+        self.iteration_profile = (0, 0)
+        # The online statistics of the iterations, which decide when an adaptive operation stops, and are saved
+        # instead of the rows if only the summary is kept.
+        statistics_columns = COLUMNS.copy()
+        if env.timing:
+            statistics_columns.append(LATENCY_COLUMN)
+        if env.trace_memory:
+            statistics_columns.append(PEAK_MEMORY_COLUMN)
+        self.statistics = (OnlineStatistics(statistics_columns) if self.adaptive or self.summary_only
+                           else None)
+        # The summary of the iterations (like ``DataFrame.describe``) if only the summary is kept.
+        self.summary: pd.DataFrame | None = None
+        self.recorder = None
+        # The target of the current iteration, which is recorded in the trace.
+        self.target = -1
+        # Called with the index of each iteration after it is recorded, to report the progress.
+        self.on_iteration: Callable[[int], None] | None = None
+        # The timestamps of the first and the latest versions, which are looked up on the first use.
+        self._time_window: tuple[int, int] | None = None
 
     def execute(self):
         """
@@ -75,19 +158,136 @@ class IterableOperation(Operation):
         if not os.path.exists(self.output_path) or needs_setup:
             if self.env.verbose:
                 print(f"{str(self.env.linking_strategy)}-{str(self.env)}: Executing the {self.name()} operation.")
-            for i in range(self.iterations):
-                self.step(i)
-                self.record_iteration(i)
-            self.opcounts = pd.DataFrame(self.data, columns=["IPNS Get", "IPNS Update", "IPFS Store",
-                                                             "IPFS Retrieve"],
-                                         index=pd.RangeIndex(1, self.iterations + 1), dtype=np.uint64)
-            self.opcounts.rename_axis(index="Iteration", inplace=True)
-            self.postprocess_data()
-            if self.save_to_file:
-                self.record()
+            phase_profile = cProfile.Profile() if self.env.profile else None
+            if phase_profile:
+                phase_profile.enable()
+            try:
+                if self.profiler:
+                    self.profiler.start()
+                if self.env.trace:
+                    self.recorder = TraceRecorder(os.path.join(self.env.output_dir, self.trace_path))
+                    ipfs.add_observer(self.recorder)
+                try:
+                    for i in range(self.iterations):
+                        if self.recorder and self.traces_steps:
+                            self.recorder.begin_traversal()
+                        if self.profiler:
+                            self.profiler.begin_iteration()
+                        self.step(i)
+                        if self.profiler:
+                            self.iteration_profile = self.profiler.end_iteration()
+                        if self.recorder and self.traces_steps:
+                            self.end_traversal()
+                        self.record_iteration(i)
+                        if self.on_iteration:
+                            self.on_iteration(i)
+                        if self.adaptive and i + 1 >= self.env.min_iterations and self.is_precise():
+                            self.truncate(i + 1)
+                            break
+                finally:
+                    if self.profiler:
+                        self.profiler.stop()
+                    if self.recorder:
+                        ipfs.remove_observer(self.recorder)
+                        self.recorder.close()
+                        self.recorder = None
+                if self.summary_only:
+                    self.summary = self.statistics.describe()
+                    if self.save_to_file:
+                        self.record_summary()
+                else:
+                    self.opcounts = pd.DataFrame(self.data, columns=COLUMNS,
+                                                 index=pd.RangeIndex(1, self.iterations + 1), dtype=np.uint64)
+                    self.opcounts.rename_axis(index="Iteration", inplace=True)
+                    self.postprocess_data()
+                    for name, values in self.get_profile_columns().items():
+                        self.opcounts[name] = values
+                    if self.save_to_file:
+                        self.record()
+            finally:
+                # The profile is saved even if the operation fails, since that is when it is needed the most.
+                if phase_profile:
+                    phase_profile.disable()
+                    self.record_profile(phase_profile)
         else:
             print(f"{self.output_path}: Record exists: Skipping")
 
+    def get_time_window(self) -> tuple[int, int]:
+        """
+        Gets the timestamps of the first and the latest versions, which are only looked up once.
+        """
+        if self._time_window is None:
+            # Finding the time window is part of the setup, not the measurement.
+            self._time_window = get_time_window(URL)
+            reset()
+            self.discard_traversal()
+        return self._time_window
+
+    def get_random_timestamp(self, window: int = 0) -> int:
+        """
+        Gets a timestamp that is uniformly distributed between the first version and the latest version, less
+        the width of a window that starts at the timestamp, and makes it the target of the iteration.
+        """
+        first_timestamp, latest_timestamp = self.get_time_window()
+        self.target = random.randint(first_timestamp, latest_timestamp - window)
+        return self.target
+
+    def is_precise(self) -> bool:
+        """
+        Whether the confidence interval of the mean retrieve count of the iterations so far is narrow enough to
+        stop iterating.
+        """
+        num_iterations = self.statistics.count
+        if num_iterations < 2:
+            return False
+        half_width = (t.ppf((1 + CONFIDENCE_LEVEL) / 2, num_iterations - 1) * self.statistics.std[ADAPTIVE_COLUMN]
+                      / math.sqrt(num_iterations))
+        return 2 * half_width <= self.env.ci_width * abs(self.statistics.mean[ADAPTIVE_COLUMN])
+
+    def truncate(self, num_iterations: int):
+        """
+        Stops the operation after the first iterations, dropping the room left for the others.
+        """
+        if self.env.verbose:
+            print(f"{str(self.env.linking_strategy)}-{str(self.env)}: The {self.name()} operation stopped after "
+                  f"{num_iterations} iterations.")
+        self.iterations = num_iterations
+        self.data = self.data[:num_iterations]
+        self.latencies = self.latencies[:num_iterations]
+        self.peak_memory = self.peak_memory[:num_iterations]
+
+    @property
+    def trace_path(self) -> str:
+        return f"{str(self.env)}-{self.name()}.trace"
+
+    @property
+    def profile_path(self) -> str:
+        return f"{str(self.env.linking_strategy)}-{str(self.env)}-{self.name()}.prof"
+
+    def record_profile(self, phase_profile: cProfile.Profile):
+        """
+        Saves the profile of the operation (including the post-processing and the recording of its
+        results) to a pstats file, which can be read with ``python -m pstats`` or any pstats viewer.
+        """
+        phase_profile.dump_stats(os.path.join(self.env.output_dir, self.profile_path))
+        if self.env.verbose:
+            print(f"{str(self.env.linking_strategy)}-{str(self.env)}: Profile of the {self.name()} operation:")
+            pstats.Stats(phase_profile).sort_stats(pstats.SortKey.TIME).print_stats(10)
+
+    def end_traversal(self):
+        """
+        Records the current traversal in the trace, with the current target.
+        """
+        self.recorder.end_traversal(get_operation_id(self.name()), self.target)
+        self.target = -1
+
+    def discard_traversal(self):
+        """
+        Leaves the retrieves made so far in the current iteration (for setting up) out of the trace.
+        """
+        if self.recorder:
+            self.recorder.discard_traversal()
+
     @abstractmethod
     def step(self, i: int):
         """
@@ -96,11 +296,20 @@ class IterableOperation(Operation):
         pass
 
     def record_iteration(self, i: int):
-        ipfs_counts = ipfs.get_counts()
-        ipns_counts = ipns.get_counts()
-        self.data[i, :] = [ipns_counts["get"], ipns_counts["update"],
-                           ipfs_counts["store"], ipfs_counts["retrieve"]]
+        counts = get_iteration_counts()
         reset()
+        if not self.summary_only:
+            self.data[i, :] = counts
+            self.latencies[i], self.peak_memory[i] = self.iteration_profile
+        if self.statistics:
+            # The row has the same columns as the statistics, in the same order.
+            latency, peak_memory = self.iteration_profile
+            row = counts
+            if self.env.timing:
+                row.append(latency)
+            if self.env.trace_memory:
+                row.append(peak_memory)
+            self.statistics.add(row)
 
     def postprocess_data(self):
         """
@@ -108,15 +317,32 @@ class IterableOperation(Operation):
         """
         pass
 
+    def get_profile_columns(self) -> dict[str, np.ndarray]:
+        """
+        Gets the columns measured by the profiler, which are appended after all other columns.
+        """
+        columns = {}
+        if self.env.timing:
+            columns[LATENCY_COLUMN] = self.latencies
+        if self.env.trace_memory:
+            columns[PEAK_MEMORY_COLUMN] = self.peak_memory
+        return columns
+
+    def record_summary(self):
+        """
+        Saves the online statistics to a summary in the results store, instead of the rows of the iterations.
+        """
+        path = os.path.join(self.env.output_dir, self.output_path)
+        write_summary(path, self.statistics, self.env.version_volume, str(self.env.version_density), self.name())
+
     def record(self):
         """
-        Saves the output (and its summary) to a file.
+        Saves the output to a partition of the results store. The summary is computed when the results
+        are read.
         """
         self.opcounts.rename_axis(index="Iteration", inplace=True)
-        storage_summary = self.opcounts.describe()  # Transpose
         path = os.path.join(self.env.output_dir, self.output_path)
-        self.opcounts.to_csv(path)
-        storage_summary.to_csv(path, mode="a", header=False)
+        write_partition(path, self.opcounts, self.env.version_volume, str(self.env.version_density), self.name())
 
 
 class StoreOperation(IterableOperation):
@@ -128,6 +354,11 @@ class StoreOperation(IterableOperation):
         super().__init__(env, save_to_file, env.version_volume)
         self.__generator = VersionGenerator(env.version_density)
         self.__num_links = []
+        self.__index_bytes = []
+        self.__policy_latencies = []
+        self.__index_builder = IPAROIndexBuilder(URL, env.index_interval) if env.index_interval else None
+        self.__tree_builder = VersionTreeBuilder(URL, env.version_tree_fanout) if env.version_tree_fanout else None
+        self.__delta_encoder = LinkDeltaEncoder() if env.delta_links else None
         self.__nodes = self.__generator.generate(env.version_volume, URL)
 
     def get_start_time(self):
@@ -138,25 +369,55 @@ class StoreOperation(IterableOperation):
         Gets the first operation.
         """
         self.__nodes[i].seq_num = i
+        self.target = i
         if i % 100 == 99 and self.env.verbose:
             print(f"{str(self.env.linking_strategy)}-{str(self.env)}: Storing node {i + 1}.")
+        policy_latency = 0
         try:
             first_link, latest_link, latest_node = ipfs.get_links_to_first_and_latest_nodes(URL)
-            self.__nodes[i].linked_iparos = self.env.linking_strategy.get_candidate_nodes(latest_link, latest_node,
-                                                                                          first_link)
+            start_time = perf_counter_ns()
+            self.__nodes[i].linked_iparos = self.env.linking_strategy.get_candidate_nodes(
+                latest_link, latest_node, first_link, self.__nodes[i].timestamp)
+            policy_latency = perf_counter_ns() - start_time
         except IPARONotFoundException:
             self.__nodes[i].linked_iparos = set()
+        self.__policy_latencies.append(policy_latency)
 
         num_links = len(self.__nodes[i].linked_iparos)
         self.__num_links.append(num_links)
 
-        cid, _ = ipfs.store(self.__nodes[i])
-        ipns.update(URL, cid)
+        if self.__index_builder:
+            self.__nodes[i].index = self.__index_builder.get_latest_index_link()
+        if self.__delta_encoder:
+            cid, _ = ipfs.store(self.__delta_encoder.encode(self.__nodes[i]))
+        else:
+            cid, _ = ipfs.store(self.__nodes[i])
+        link = IPAROLink(seq_num=i, timestamp=self.__nodes[i].timestamp, cid=cid)
+        if self.__delta_encoder:
+            self.__delta_encoder.add(link)
+
+        index_bytes = 0
+        if self.__index_builder:
+            index_bytes += self.__index_builder.add(link)
+        root_cid = None
+        if self.__tree_builder:
+            # The IPNS points at the root of the version tree instead, but indexes the version itself.
+            root_cid, tree_bytes = self.__tree_builder.append(link)
+            index_bytes += tree_bytes
+        ipns.update(URL, cid, self.__nodes[i].timestamp, root_cid)
+        self.__index_bytes.append(index_bytes)
 
     def postprocess_data(self):
-        # Append Link counts to opcount data.
-        self.opcounts = pd.concat((self.opcounts, pd.Series(self.__num_links, name="Links",
-                                                            index=pd.RangeIndex(1, self.iterations + 1))), axis=1)
+        # Append Link counts and index sizes to opcount data.
+        index = pd.RangeIndex(1, self.iterations + 1)
+        self.opcounts = pd.concat((self.opcounts, pd.Series(self.__num_links, name="Links", index=index),
+                                   pd.Series(self.__index_bytes, name="Index Bytes", index=index)), axis=1)
+
+    def get_profile_columns(self) -> dict[str, np.ndarray]:
+        columns = super().get_profile_columns()
+        if self.env.timing:
+            columns[POLICY_LATENCY_COLUMN] = np.array(self.__policy_latencies)
+        return columns
 
 
 class FirstOperation(IterableOperation):
@@ -167,8 +428,8 @@ class FirstOperation(IterableOperation):
         return "First"
 
     def step(self, i):
-        latest_link, _ = ipfs.get_link_to_latest_node(URL)
-        ipfs.retrieve_nth_iparo(0, latest_link)
+        self.target = 0
+        ipfs.retrieve_iparo_by_url_and_number(URL, 0)
 
 
 class LatestOperation(IterableOperation):
@@ -195,8 +456,25 @@ class GetNthOperation(IterableOperation):
 
     def step(self, i):
         x = random.randint(0, self.env.version_volume - 1)
-        latest_link, _ = ipfs.get_link_to_latest_node(URL)
-        ipfs.retrieve_nth_iparo(x, latest_link)
+        self.target = x
+        ipfs.retrieve_iparo_by_url_and_number(URL, x)
+
+
+class GetNthIPNSOperation(IterableOperation):
+    """
+    Get Nth IPARO, using the IPNS version index instead of the links
+    """
+
+    def __init__(self, env: IPAROSimulationEnvironment, save_to_file: bool = True):
+        super().__init__(env, save_to_file)
+
+    def name(self) -> str:
+        return "Nth-IPNS"
+
+    def step(self, i):
+        x = random.randint(0, self.env.version_volume - 1)
+        self.target = x
+        ipns.get_nth_cid(URL, x)
 
 
 class GetAtTOperation(IterableOperation):
@@ -210,10 +488,62 @@ class GetAtTOperation(IterableOperation):
     def name(self) -> str:
         return "Time"
 
+    def step(self, i):
+        timestamp = self.get_random_timestamp()
+        self.env.linking_strategy.retrieve_iparo_by_url_and_timestamp(URL, timestamp)
+
+
+class GetAtTIPNSOperation(GetAtTOperation):
+    """
+    Get at Time T, using the IPNS version index instead of the links
+    """
+
+    def name(self) -> str:
+        return "Time-IPNS"
+
+    def step(self, i):
+        timestamp = self.get_random_timestamp()
+        ipns.get_nearest_cid(URL, timestamp)
+
+
+class GetRangeOperation(IterableOperation):
+    """
+    Get all versions between T1 and T2
+    """
+
+    def __init__(self, env: IPAROSimulationEnvironment, width: float, save_to_file: bool = True):
+        """
+        :param width: The width of the time window, as a fraction of the time between the first and the
+        latest versions.
+        """
+        self.width = width
+        super().__init__(env, save_to_file)
+
+    def name(self) -> str:
+        return f"Range-{self.width}"
+
+    def step(self, i):
+        first_timestamp, latest_timestamp = self.get_time_window()
+        window = int(self.width * (latest_timestamp - first_timestamp))
+        start = self.get_random_timestamp(window)
+        ipfs.retrieve_iparos_in_range(URL, start, start + window)
+
+
+class ForwardOperation(IterableOperation):
+    """
+    Get a page of versions from earliest to latest, starting at a random version
+    """
+
+    def __init__(self, env: IPAROSimulationEnvironment, save_to_file: bool = True):
+        super().__init__(env, save_to_file)
+
+    def name(self) -> str:
+        return f"Forward-{self.env.page_size}"
+
     def step(self, i):
         x = random.randint(0, self.env.version_volume - 1)
-        latest_link, _ = ipfs.get_link_to_latest_node(URL)
-        ipfs.retrieve_nth_iparo(x, latest_link)
+        self.target = x
+        list(islice(ipfs.iter_links_forward(URL, x), self.env.page_size))
 
 
 class ListAllOperation(IterableOperation):
@@ -247,6 +577,7 @@ class UnsafeListAllOperation(IterableOperation):
 
     def step(self, i):
         total_nodes_found = 0
+        self.target = i
         if self.env.verbose:
             print(f"{str(self.env)}: Unsafe List All: {i} Nodes Missing")
         for j in range(self.env.iterations):
@@ -274,14 +605,25 @@ class UnsafeListAllOperation(IterableOperation):
 
 
 class IteratedStoreOperation(IterableOperation):
+    # Each store is traced as one traversal.
+    traces_steps = False
+    # Each iteration stores a whole chain, which is recorded version by version.
+    repeats_iterations = False
 
     def name(self) -> str:
         return "Store"
 
     def __init__(self, env: IPAROSimulationEnvironment, save_to_file=True):
         super().__init__(env, save_to_file)
-        self.__num_links = []
-        self.df = np.zeros((self.iterations * self.env.version_volume, 4))
+        # The totals of each version over the iterations, which are averaged at the end, so that the memory
+        # does not grow with the number of iterations.
+        volume = self.env.version_volume
+        self.__counts = np.zeros((volume, len(COLUMNS)))
+        self.__num_links = np.zeros(volume)
+        self.__index_bytes = np.zeros(volume)
+        self.__store_latencies = np.zeros(volume)
+        self.__store_peak_memory = np.zeros(volume)
+        self.__policy_latencies = np.zeros(volume)
         self.__generator = VersionGenerator(self.env.version_density)
 
     def step(self, i: int):
@@ -293,42 +635,76 @@ class IteratedStoreOperation(IterableOperation):
 
         volume = self.env.version_volume
         nodes = self.__generator.generate(volume, URL)
+        index_builder = IPAROIndexBuilder(URL, self.env.index_interval) if self.env.index_interval else None
+        tree_builder = VersionTreeBuilder(URL, self.env.version_tree_fanout) if self.env.version_tree_fanout else None
+        delta_encoder = LinkDeltaEncoder() if self.env.delta_links else None
         reset()
         for j in range(volume):
             if j % 100 == 99:
                 print(f"{str(self.env.linking_strategy)}-{str(self.env)}: Storing {j + 1}th node.")
+            if self.recorder:
+                self.recorder.begin_traversal()
+            if self.profiler:
+                self.profiler.begin_iteration()
+            policy_latency = 0
             try:
+                self.target = j
                 nodes[j].seq_num = j
                 first_link, latest_link, latest_node = ipfs.get_links_to_first_and_latest_nodes(URL)
+                start_time = perf_counter_ns()
                 nodes[j].linked_iparos = self.env.linking_strategy.get_candidate_nodes(latest_link, latest_node,
-                                                                                       first_link)
+                                                                                       first_link, nodes[j].timestamp)
+                policy_latency = perf_counter_ns() - start_time
             except IPARONotFoundException:
                 nodes[j].linked_iparos = set()
-
-            num_links = len(nodes[j].linked_iparos)
-            self.__num_links.append(float(num_links))
-
-            cid, _ = ipfs.store(nodes[j])
-            ipns.update(URL, cid)
+            self.__policy_latencies[j] += policy_latency
+            self.__num_links[j] += len(nodes[j].linked_iparos)
+
+            if index_builder:
+                nodes[j].index = index_builder.get_latest_index_link()
+            if delta_encoder:
+                cid, _ = ipfs.store(delta_encoder.encode(nodes[j]))
+            else:
+                cid, _ = ipfs.store(nodes[j])
+            link = IPAROLink(seq_num=j, timestamp=nodes[j].timestamp, cid=cid)
+            if delta_encoder:
+                delta_encoder.add(link)
+
+            index_bytes = 0
+            if index_builder:
+                index_bytes += index_builder.add(link)
+            root_cid = None
+            if tree_builder:
+                root_cid, tree_bytes = tree_builder.append(link)
+                index_bytes += tree_bytes
+            ipns.update(URL, cid, nodes[j].timestamp, root_cid)
+            self.__index_bytes[j] += index_bytes
+            if self.profiler:
+                latency, peak_memory = self.profiler.end_iteration()
+                self.__store_latencies[j] += latency
+                self.__store_peak_memory[j] += peak_memory
+            if self.recorder:
+                self.end_traversal()
 
             # Record iteration here.
-            ipfs_counts = ipfs.get_counts()
-            ipns_counts = ipns.get_counts()
-            # First four elements
-            self.df[volume * i + j, :] = [float(ipns_counts["get"]), float(ipns_counts["update"]),
-                                          float(ipfs_counts["store"]), float(ipfs_counts["retrieve"])]
+            self.__counts[j] += get_iteration_counts()
             reset()
 
         if i != self.env.iterations - 1:
             reset(reset_data=True)
 
     def postprocess_data(self):
-        volume = self.env.version_volume
-        print("Data:")
-        print(self.df)
-        df = pd.DataFrame({"Iteration Number": [1 + i for _ in range(self.env.iterations) for i in range(volume)],
-                           "Links": self.__num_links})
-        self.opcounts = (pd.concat((pd.DataFrame(self.df, columns=["IPNS Get", "IPNS Update",
-                                                                   "IPFS Store", "IPFS Retrieve"]), df), axis=1)
-                         .groupby(by=["Iteration Number"]).mean())
-        self.opcounts.index = pd.RangeIndex(1, volume + 1)
+        self.opcounts = pd.DataFrame(self.__counts / self.env.iterations, columns=COLUMNS,
+                                     index=pd.RangeIndex(1, self.env.version_volume + 1))
+        self.opcounts["Links"] = self.__num_links / self.env.iterations
+        self.opcounts["Index Bytes"] = self.__index_bytes / self.env.iterations
+
+    def get_profile_columns(self) -> dict[str, np.ndarray]:
+        # Each store is measured separately, and averaged over the iterations like the op counts.
+        columns = {}
+        if self.env.timing:
+            columns[LATENCY_COLUMN] = self.__store_latencies
+            columns[POLICY_LATENCY_COLUMN] = self.__policy_latencies
+        if self.env.trace_memory:
+            columns[PEAK_MEMORY_COLUMN] = self.__store_peak_memory
+        return {name: totals / self.env.iterations for name, totals in columns.items()}
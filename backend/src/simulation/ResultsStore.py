@@ -0,0 +1,208 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from simulation.OnlineStatistics import OnlineStatistics
+
+# The columns that identify each row of the results, which are followed by the measured columns.
+KEY_COLUMNS = ["Group", "Param", "Density", "Volume", "Operation", "Iteration"]
+# The key columns that are stored as category codes.
+CATEGORY_COLUMNS = ["Group", "Param", "Density", "Operation"]
+PARTITION_SUFFIX = ".npz"
+SUMMARY_SUFFIX = ".summary.npz"
+# The columns that identify each row of the summaries, which are followed by the measured columns.
+SUMMARY_KEY_COLUMNS = ["Group", "Param", "Density", "Volume", "Operation", "Statistic"]
+CONSOLIDATED_NAME = "results.npz"
+
+
+def write_partition(path: str, opcounts: pd.DataFrame, volume: int, density: str, operation: str):
+    """
+    Writes the results of one run of an operation (one row per iteration) to a partition of the results
+    store. The partitions are named ``[Volume]-[Density]-[Operation].npz`` and kept in the
+    ``[Policy Group]/[Policy Param]`` directories of the results folder, which give the policy.
+
+    :param path: The path of the partition.
+    :param opcounts: The results, indexed by iteration.
+    :param volume: The version volume.
+    :param density: The key of the version density.
+    :param operation: The name of the operation.
+    """
+    # Written to a temporary file first, which replaces the partition, so that readers never see half of the
+    # partition and the directory is modified even if the partition existed already.
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        np.savez(file, columns=np.array(opcounts.columns, dtype=str), values=opcounts.to_numpy(dtype=np.float64),
+                 iterations=opcounts.index.to_numpy(dtype=np.int64), volume=volume, density=density,
+                 operation=operation)
+    os.replace(temporary_path, path)
+
+
+def write_summary(path: str, statistics: OnlineStatistics, volume: int, density: str, operation: str):
+    """
+    Writes the online statistics of a run of an operation whose iterations were not kept to a summary in the
+    results store, which is named ``[Volume]-[Density]-[Operation].summary.npz`` and kept next to the
+    partitions (see ``write_partition``). The statistics of summaries can be merged after they are read.
+    """
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        np.savez(file, **statistics.to_arrays(), volume=volume, density=density, operation=operation)
+    os.replace(temporary_path, path)
+
+
+def read_summary(path: Path) -> tuple[OnlineStatistics, int, str, str]:
+    """
+    Reads a summary.
+
+    :returns: The statistics, the volume, the density and the operation.
+    """
+    with np.load(path) as summary:
+        return (OnlineStatistics.from_arrays(summary), int(summary["volume"]), str(summary["density"]),
+                str(summary["operation"]))
+
+
+def read_partition(path: Path) -> pd.DataFrame:
+    """
+    Reads a partition as a DataFrame with the volume, density, operation and iteration columns.
+    """
+    with np.load(path) as partition:
+        df = pd.DataFrame(partition["values"], columns=partition["columns"])
+        return df.assign(Density=str(partition["density"]), Volume=int(partition["volume"]),
+                         Operation=str(partition["operation"]), Iteration=partition["iterations"])
+
+
+def read_legacy_csv(path: Path) -> pd.DataFrame:
+    """
+    Reads the results of a CSV file written before the results store, leaving out the summary that was
+    appended to it. The volume, density and operation are parsed from its name.
+    """
+    volume, density, operation = path.stem.split("-", 2)
+    df = pd.read_csv(path, index_col=0)
+    df = df[pd.to_numeric(df.index, errors="coerce").notna()].astype(np.float64)
+    return df.reset_index(drop=True).assign(Density=density, Volume=int(volume), Operation=operation,
+                                            Iteration=pd.to_numeric(df.index).astype(np.int64))
+
+
+def iter_policy_files(root: Path):
+    """
+    Iterates through the names of the files in each policy directory, with its policy group and parameter.
+    """
+    for group in sorted(os.scandir(root), key=lambda entry: entry.name):
+        if not group.is_dir():
+            continue
+        for param in sorted(os.scandir(group.path), key=lambda entry: entry.name):
+            if param.is_dir():
+                yield group.name, param.name, Path(param.path), {entry.name for entry in os.scandir(param.path)
+                                                                 if entry.is_file()}
+
+
+def iter_result_files(root: Path):
+    """
+    Iterates through the partitions, and the CSV files that have no partition, with their policy group and
+    parameter.
+    """
+    for group, param, directory, names in iter_policy_files(root):
+        for name in sorted(names):
+            stem, suffix = os.path.splitext(name)
+            if name.endswith(SUMMARY_SUFFIX):
+                continue
+            if suffix == PARTITION_SUFFIX or (suffix == ".csv" and stem + PARTITION_SUFFIX not in names):
+                yield group, param, directory / name
+
+
+def load_summaries(root: Path) -> pd.DataFrame:
+    """
+    Reads every summary in the results folder, with the columns ``SUMMARY_KEY_COLUMNS`` followed by the
+    measured columns, and a row for each statistic of ``DataFrame.describe`` of each run.
+    """
+    partial_dfs = []
+    for group, param, directory, names in iter_policy_files(root):
+        for name in sorted(names):
+            if name.endswith(SUMMARY_SUFFIX):
+                statistics, volume, density, operation = read_summary(directory / name)
+                partial_dfs.append(statistics.describe().rename_axis(index="Statistic").reset_index()
+                                   .assign(Group=group, Param=param, Density=density, Volume=volume,
+                                           Operation=operation))
+    if not partial_dfs:
+        return pd.DataFrame(columns=SUMMARY_KEY_COLUMNS)
+    df = pd.concat(partial_dfs, ignore_index=True)
+    measures = [column for column in df.columns if column not in SUMMARY_KEY_COLUMNS]
+    return df[SUMMARY_KEY_COLUMNS + measures]
+
+
+def build_results(root: Path) -> pd.DataFrame:
+    """
+    Reads every partition (and legacy CSV file) in the results folder into one DataFrame.
+    """
+    partial_dfs = [(read_partition(path) if path.suffix == PARTITION_SUFFIX else read_legacy_csv(path))
+                   .assign(Group=group, Param=param)
+                   for group, param, path in iter_result_files(root)]
+    if not partial_dfs:
+        return pd.DataFrame(columns=KEY_COLUMNS)
+    df = pd.concat(partial_dfs, ignore_index=True)
+    measures = [column for column in df.columns if column not in KEY_COLUMNS]
+    return df[KEY_COLUMNS + measures]
+
+
+def save_results(df: pd.DataFrame, path: Path):
+    """
+    Saves the consolidated results in a single NPZ file, with one array per column. The key columns
+    with strings are stored as category codes.
+    """
+    arrays = {}
+    for column in df.columns:
+        if column in CATEGORY_COLUMNS:
+            categorical = pd.Categorical(df[column].astype(str))
+            arrays[f"{column}.codes"] = categorical.codes
+            arrays[f"{column}.categories"] = np.array(categorical.categories, dtype=str)
+        else:
+            arrays[column] = df[column].to_numpy(dtype=np.int64 if column in KEY_COLUMNS else np.float64)
+    arrays["columns"] = np.array(df.columns, dtype=str)
+    # Written to a temporary file first, so that readers never see half of the file.
+    temporary_path = path.with_name(path.name + ".tmp.npz")
+    np.savez(temporary_path, **arrays)
+    os.replace(temporary_path, path)
+
+
+def load_consolidated_results(path: Path) -> pd.DataFrame:
+    """
+    Loads the results saved with ``save_results``.
+    """
+    with np.load(path) as arrays:
+        columns = {}
+        for column in arrays["columns"]:
+            if column in CATEGORY_COLUMNS:
+                columns[column] = pd.Categorical.from_codes(arrays[f"{column}.codes"], arrays[f"{column}.categories"])
+            else:
+                columns[column] = arrays[column]
+        return pd.DataFrame(columns)
+
+
+def get_results_mtime(root: Path) -> float:
+    """
+    Gets the latest modification time of the policy directories, which change whenever a partition is added,
+    replaced or removed, since partitions are always replaced as a whole. The files themselves are not
+    read, and the results folder is left out, since it holds the consolidated results.
+    """
+    mtime = 0.0
+    for group in os.scandir(root):
+        if group.is_dir():
+            mtime = max(mtime, group.stat().st_mtime)
+            for param in os.scandir(group.path):
+                if param.is_dir():
+                    mtime = max(mtime, param.stat().st_mtime)
+    return mtime
+
+
+def load_results(root: Path) -> pd.DataFrame:
+    """
+    Loads all results in the results folder, with the columns ``KEY_COLUMNS`` followed by the measured
+    columns (which are missing values where a run did not measure them). The results are consolidated into
+    ``results.npz`` in the results folder, which is rebuilt whenever a result file is added, replaced or
+    removed, so loading the results usually reads a single file.
+    """
+    consolidated_path = root / CONSOLIDATED_NAME
+    if not consolidated_path.exists() or os.stat(consolidated_path).st_mtime < get_results_mtime(root):
+        save_results(build_results(root), consolidated_path)
+    return load_consolidated_results(consolidated_path)
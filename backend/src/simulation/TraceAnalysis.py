@@ -0,0 +1,99 @@
+import mmap
+from collections import OrderedDict
+from typing import Iterator, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from simulation.TraceRecorder import TRACE_MAGIC, TRACE_HEADER, TRACE_HOP, OPERATION_NAMES
+
+
+class Traversal(NamedTuple):
+    op_id: int
+    target: int
+    hops: np.ndarray
+    """
+    The sequence numbers of the objects retrieved, in order.
+    """
+
+
+def read_trace(path: str) -> list[Traversal]:
+    """
+    Reads all traversals of a trace file written by a ``TraceRecorder``.
+
+    Exceptions:
+        ValueError: If the file is not a trace file.
+    """
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as trace:
+        return list(iter_traversals(trace))
+
+
+def iter_traversals(trace: bytes | mmap.mmap) -> Iterator[Traversal]:
+    """
+    Iterates through the traversals of a trace, without copying the trace.
+    """
+    if trace[:len(TRACE_MAGIC)] != TRACE_MAGIC:
+        raise ValueError("Not a trace file.")
+    offset = len(TRACE_MAGIC)
+    while offset < len(trace):
+        op_id, target, num_hops = TRACE_HEADER.unpack_from(trace, offset)
+        offset += TRACE_HEADER.size
+        hops = np.frombuffer(trace, dtype="<i4", count=num_hops, offset=offset).copy()
+        offset += num_hops * TRACE_HOP.size
+        yield Traversal(op_id, target, hops)
+
+
+def get_hop_histogram(traversals: list[Traversal]) -> pd.DataFrame:
+    """
+    Counts the traversals of each operation by their number of hops.
+
+    Returns:
+        The number of traversals, indexed by the number of hops, with one column per operation.
+    """
+    df = pd.DataFrame({"Operation": [OPERATION_NAMES[traversal.op_id] for traversal in traversals],
+                       "Hops": [len(traversal.hops) for traversal in traversals]})
+    return df.groupby(["Hops", "Operation"]).size().unstack(fill_value=0)
+
+
+def get_cost_by_target_position(traversals: list[Traversal], bins: int = 10) -> pd.DataFrame:
+    """
+    Gets the mean number of hops of each operation by the position of the target, which is the target
+    scaled to between 0 and 1 among the targets of the operation and divided into equally wide bins.
+    Traversals without a target are left out.
+
+    Returns:
+        The mean number of hops, indexed by the operation, with one column per bin (its lower bound).
+    """
+    df = pd.DataFrame({"Operation": [OPERATION_NAMES[traversal.op_id] for traversal in traversals],
+                       "Target": [traversal.target for traversal in traversals],
+                       "Hops": [len(traversal.hops) for traversal in traversals]})
+    df = df[df["Target"] >= 0]
+    targets = df.groupby("Operation")["Target"]
+    span = (targets.transform("max") - targets.transform("min")).replace(0, 1)
+    position = (df["Target"] - targets.transform("min")) / span
+    df["Position"] = np.minimum((position * bins).astype(int), bins - 1) / bins
+    return df.pivot_table(values="Hops", index="Operation", columns="Position", aggfunc="mean")
+
+
+def estimate_cache_hit_rate(traversals: list[Traversal], cache_size: int) -> float:
+    """
+    Estimates the fraction of the retrieves of IPAROs that would hit an LRU cache of IPAROs, kept
+    across all traversals in order.
+
+    :param cache_size: The maximum number of IPAROs in the cache.
+    """
+    cache = OrderedDict()
+    hits = total = 0
+    for traversal in traversals:
+        for seq_num in traversal.hops.tolist():
+            if seq_num < 0:
+                continue
+            total += 1
+            if seq_num in cache:
+                hits += 1
+                cache.move_to_end(seq_num)
+            else:
+                cache[seq_num] = None
+                if len(cache) > cache_size:
+                    cache.popitem(last=False)
+    return hits / total if total else 0.0
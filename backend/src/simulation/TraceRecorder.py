@@ -0,0 +1,123 @@
+import mmap
+import struct
+
+from simulation.Observer import Observer
+
+# The magic number at the start of every trace file.
+TRACE_MAGIC = b"IPTRACE1"
+# The header of each traversal: the operation ID, the target, and the number of hops.
+TRACE_HEADER = struct.Struct("<HqI")
+# Each hop is the sequence number of the retrieved object.
+TRACE_HOP = struct.Struct("<i")
+# The sequence number recorded for objects that are not IPAROs (index objects and version tree nodes).
+NOT_AN_IPARO = -1
+# The sequence number recorded for objects that are not found.
+NOT_FOUND = -2
+
+OPERATION_IDS = {"Store": 0, "First": 1, "Latest": 2, "Nth": 3, "Nth-IPNS": 4, "Time": 5, "Time-IPNS": 6,
+                 "Range": 7, "Forward": 8, "List": 9, "Unsafe-List": 10}
+OPERATION_NAMES = {op_id: name for name, op_id in OPERATION_IDS.items()}
+
+
+def get_operation_id(name: str) -> int:
+    """
+    Gets the ID of an operation from its name, ignoring the parameter that the name ends with, if any
+    (such as the width of the range operation).
+    """
+    if name in OPERATION_IDS:
+        return OPERATION_IDS[name]
+    return OPERATION_IDS[name.rsplit("-", 1)[0]]
+
+
+class TraceRecorder(Observer):
+    """
+    Records every traversal as the sequence of the sequence numbers of the objects retrieved from the
+    IPFS, in a compact binary trace. The trace is written to a memory-mapped file, so recording a hop only
+    costs packing four bytes into memory, and the file is grown by doubling.
+
+    The file starts with ``TRACE_MAGIC``, and each traversal is a ``TRACE_HEADER`` followed by its hops.
+    Traces are read with ``simulation.TraceAnalysis.read_trace``.
+    """
+
+    def __init__(self, path: str, capacity: int = 1 << 20):
+        """
+        :param path: The path of the trace file, which is overwritten.
+        :param capacity: The initial size of the file in bytes.
+        """
+        self.path = path
+        self.__file = open(path, "w+b")
+        self.__file.truncate(capacity)
+        self.__mmap = mmap.mmap(self.__file.fileno(), capacity)
+        self.__mmap[:len(TRACE_MAGIC)] = TRACE_MAGIC
+        self.__offset = len(TRACE_MAGIC)
+        self.__traversal_offset = None
+        self.__hops = 0
+
+    def begin_traversal(self):
+        """
+        Starts recording a traversal. The space for its header is reserved until the traversal ends.
+        """
+        self.__reserve(TRACE_HEADER.size)
+        self.__traversal_offset = self.__offset
+        self.__offset += TRACE_HEADER.size
+        self.__hops = 0
+
+    def end_traversal(self, op_id: int, target: int):
+        """
+        Stops recording a traversal.
+
+        :param op_id: The ID of the operation, from ``OPERATION_IDS``.
+        :param target: The target of the traversal, such as the sequence number or the timestamp that was
+            looked up, or -1 if there is none.
+        """
+        TRACE_HEADER.pack_into(self.__mmap, self.__traversal_offset, op_id, target, self.__hops)
+        self.__traversal_offset = None
+
+    def discard_traversal(self):
+        """
+        Discards the hops recorded so far in the current traversal.
+        """
+        self.__offset = self.__traversal_offset + TRACE_HEADER.size
+        self.__hops = 0
+
+    def on_retrieve(self, cid: str, seq_num: int | None, size: int):
+        self.__record(NOT_AN_IPARO if seq_num is None else seq_num)
+
+    def on_not_found(self, key: str | int):
+        self.__record(NOT_FOUND)
+
+    def __record(self, seq_num: int):
+        if self.__traversal_offset is None:
+            return
+        if self.__offset + TRACE_HOP.size > len(self.__mmap):
+            self.__reserve(TRACE_HOP.size)
+        TRACE_HOP.pack_into(self.__mmap, self.__offset, seq_num)
+        self.__offset += TRACE_HOP.size
+        self.__hops += 1
+
+    def __reserve(self, size: int):
+        """
+        Grows the file if there are fewer than the given number of bytes left.
+        """
+        capacity = len(self.__mmap)
+        if self.__offset + size <= capacity:
+            return
+        while self.__offset + size > capacity:
+            capacity *= 2
+        self.__mmap.flush()
+        self.__mmap.close()
+        self.__file.truncate(capacity)
+        self.__mmap = mmap.mmap(self.__file.fileno(), capacity)
+
+    def close(self):
+        """
+        Writes the trace to the file, and truncates the file to the size of the trace. A traversal that has not
+        ended, such as one aborted by an exception, is left out, since its header was never written.
+        """
+        if self.__traversal_offset is not None:
+            self.__offset = self.__traversal_offset
+            self.__traversal_offset = None
+        self.__mmap.flush()
+        self.__mmap.close()
+        self.__file.truncate(self.__offset)
+        self.__file.close()
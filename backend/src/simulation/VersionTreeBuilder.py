@@ -0,0 +1,64 @@
+from simulation.IPAROLink import IPAROLink
+from simulation.IPFS import ipfs
+from simulation.VersionTreeNode import VersionTreeNode
+
+
+class VersionTreeBuilder:
+    """
+    Builds the version tree on the archiver's side. Since versions are only ever appended, only the
+    rightmost path of the tree changes, so an append rewrites at most one node per level (plus one
+    node per split). The archiver keeps the rightmost path that it stored last, so appending costs
+    no IPFS retrieves.
+    """
+
+    def __init__(self, url: str, fanout: int):
+        """
+        :param url: The URL of the versions.
+        :param fanout: The maximum number of entries (B) in each node, which must be at least 2.
+        """
+        self.url = url
+        self.fanout = fanout
+        # The nodes on the rightmost path and the links to them, from the root to the leaf.
+        self.rightmost_path: list[tuple[VersionTreeNode, IPAROLink]] = []
+
+    def append(self, link: IPAROLink) -> tuple[str, int]:
+        """
+        Appends the link to a newly stored version, storing the rewritten nodes.
+
+        :param link: The link to the newly stored version.
+        :returns: The CID of the new root, and the total size of the stored nodes in bytes.
+        """
+        total_bytes = 0
+        # The links that replace the last entry of the current level (or that are added, for the leaves).
+        new_links = [link]
+        for level in reversed(range(len(self.rightmost_path))):
+            node, node_link = self.rightmost_path[level]
+            entries = node.entries + new_links if node.leaf else node.entries[:-1] + new_links
+            if len(entries) <= self.fanout:
+                new_node, new_link, num_bytes = self.__store(node.leaf, entries)
+                new_links = [new_link]
+            elif node.leaf:
+                # The full leaf stays as it is, and the new version starts a new leaf.
+                new_node, new_link, num_bytes = self.__store(True, entries[self.fanout:])
+                new_links = [node_link, new_link]
+            else:
+                _, left_link, left_bytes = self.__store(False, entries[:self.fanout])
+                new_node, new_link, num_bytes = self.__store(False, entries[self.fanout:])
+                num_bytes += left_bytes
+                new_links = [left_link, new_link]
+            self.rightmost_path[level] = (new_node, new_link)
+            total_bytes += num_bytes
+
+        # The tree is empty, or the root was split.
+        if len(new_links) > 1 or not self.rightmost_path:
+            root, root_link, num_bytes = self.__store(not self.rightmost_path, new_links)
+            self.rightmost_path.insert(0, (root, root_link))
+            total_bytes += num_bytes
+
+        return self.rightmost_path[0][1].cid, total_bytes
+
+    def __store(self, leaf: bool, entries: list[IPAROLink]) -> tuple[VersionTreeNode, IPAROLink, int]:
+        node = VersionTreeNode(url=self.url, leaf=leaf, entries=entries)
+        cid, node_bytes = ipfs.store(node)
+        link = IPAROLink(seq_num=entries[-1].seq_num, timestamp=entries[-1].timestamp, cid=cid)
+        return node, link, len(node_bytes)
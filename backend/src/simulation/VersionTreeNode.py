@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+from simulation.IPAROLink import IPAROLink
+
+
+@dataclass
+class VersionTreeNode:
+    """
+    A node of the persistent version tree, which is a copy-on-write B+ tree of all versions of a URL,
+    stored in the IPFS and keyed by both sequence number and timestamp. When the version tree is used,
+    the IPNS points at its root instead of the latest IPARO.
+
+    A link to a node is an ``IPAROLink`` whose sequence number and timestamp are those of the last version
+    in its subtree, and whose CID is the CID of the node.
+    """
+    url: str
+    leaf: bool
+    """
+    Whether the entries are links to IPAROs (instead of links to child nodes).
+    """
+
+    entries: list[IPAROLink]
+    """
+    The links to the IPAROs (or to the child nodes), sorted by sequence number.
+    """
@@ -6,8 +6,9 @@ from system.IPARO import IPARO
 
 class IPAROFactory:
     @classmethod
-    def create_and_store_iparos(cls, ipfs, ipns, iparo_link_factory, filename=None):
-        """Processes one or more WARC files, creates and stores IPARO objects."""
+    def create_and_store_iparos(cls, ipfs, ipns, iparo_link_factory, filename=None, version_tree_fanout=0):
+        """Processes one or more WARC files, creates and stores IPARO objects. If the version tree fanout is
+        set, then the IPNS name of each URL points at the root of a version tree instead of the latest IPARO."""
         # Resolve samples/warcs folder relative to project root
         project_root = os.path.abspath(
             os.path.join(os.path.dirname(__file__), '..', '..')
@@ -49,17 +50,17 @@ class IPAROFactory:
 
                         seq_num = 0
                         linked_iparos = set()
+                        root_cid = None
 
                         try:
-                            resolved_cid = ipns.resolve_cid(peer_id)
-                            latest_node = ipfs.retrieve(resolved_cid.split('/', 2)[-1])
+                            resolved_cid = ipns.resolve_cid(peer_id).split('/', 2)[-1]
+                            link, latest_node = ipfs.resolve_latest(resolved_cid)
 
                             if latest_node and latest_node.url == url:
                                 seq_num = latest_node.seq_num + 1
-                                link = iparo_link_factory.from_cid_iparo(
-                                    resolved_cid.split('/', 2)[-1], latest_node
-                                )
                                 linked_iparos.add(link)
+                                if link.cid != resolved_cid:
+                                    root_cid = resolved_cid
                                 print(f"Found previous IPARO for {url}")
                             else:
                                 print("Resolved node mismatch; creating new head")
@@ -77,6 +78,9 @@ class IPAROFactory:
                             nonce=0
                         )
                         cid = ipfs.store(iparo)
+                        if version_tree_fanout:
+                            link = iparo_link_factory.from_cid_iparo(cid, iparo)
+                            cid = ipfs.append_to_version_tree(url, root_cid, link, version_tree_fanout)
                         ipns.update(peer_id, cid)
                         print(f"Published version {seq_num} for {url} → {cid}\n")
                 except ArchiveLoadFailed as e:
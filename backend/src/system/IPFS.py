@@ -1,6 +1,8 @@
 import pickle
+from bisect import bisect_left
 from datetime import datetime
 from enum import Enum
+from typing import Iterator
 
 import requests
 
@@ -9,6 +11,7 @@ from system.IPAROException import IPARONotFoundException
 from system.IPAROLink import IPAROLink
 from system.IPAROLinkFactory import IPAROLinkFactory
 from system.Utils import Utils
+from system.VersionTreeNode import VersionTreeNode
 
 
 class Mode(Enum):
@@ -18,7 +21,7 @@ class Mode(Enum):
 
 
 class IPFS:
-    def store(self, iparo_obj: IPARO):
+    def store(self, iparo_obj: IPARO | VersionTreeNode):
         pickled_data = pickle.dumps(iparo_obj)
         response = requests.post(
             f"{Utils.IPFS_API_URL}/add",
@@ -35,6 +38,110 @@ class IPFS:
         iparo = pickle.loads(response.content)
         return iparo
 
+    def resolve_latest(self, cid: str, iparo: IPARO | VersionTreeNode | None = None) -> tuple[IPAROLink, IPARO]:
+        """Fetch the link to the latest IPARO and the IPARO itself from the CID that an IPNS name resolves to,
+        following the rightmost path of the version tree if the CID is the root of one. If the object that the
+        CID points at was already fetched, it can be passed as `iparo` so that it is not fetched again."""
+        if iparo is None:
+            iparo = self.retrieve(cid)
+        if not isinstance(iparo, VersionTreeNode):
+            return IPAROLinkFactory.from_cid_iparo(cid, iparo), iparo
+
+        node = iparo
+        while not node.leaf:
+            node = self.retrieve(node.entries[-1].cid)
+        latest_link = node.entries[-1]
+        return latest_link, self.retrieve(latest_link.cid)
+
+    def append_to_version_tree(self, url: str, root_cid: str | None, link: IPAROLink, fanout: int) -> str:
+        """Append the link to a newly stored IPARO to a version tree with at most `fanout` entries per node,
+        rewriting only the nodes on the rightmost path. Returns the CID of the new root, which the IPNS name
+        of the URL should be updated to. If `root_cid` is None, then a new version tree is created."""
+        # The CIDs and the nodes on the rightmost path, from the root to the leaf.
+        path = []
+        if root_cid is not None:
+            path.append((root_cid, self.retrieve(root_cid)))
+            while not path[-1][1].leaf:
+                child_cid = path[-1][1].entries[-1].cid
+                path.append((child_cid, self.retrieve(child_cid)))
+
+        def store_node(leaf: bool, entries: tuple[IPAROLink, ...]) -> IPAROLink:
+            cid = self.store(VersionTreeNode(url=url, leaf=leaf, entries=entries))
+            return IPAROLink(seq_num=entries[-1].seq_num, timestamp=entries[-1].timestamp, cid=cid)
+
+        # The links that replace the last entry of the current level (or that are added, for the leaves).
+        new_links = (link,)
+        for cid, node in reversed(path):
+            entries = node.entries + new_links if node.leaf else node.entries[:-1] + new_links
+            if len(entries) <= fanout:
+                new_links = (store_node(node.leaf, entries),)
+            elif node.leaf:
+                # The full leaf stays as it is, and the new version starts a new leaf.
+                last_link = node.entries[-1]
+                new_links = (IPAROLink(seq_num=last_link.seq_num, timestamp=last_link.timestamp, cid=cid),
+                             store_node(True, entries[fanout:]))
+            else:
+                new_links = (store_node(False, entries[:fanout]), store_node(False, entries[fanout:]))
+
+        # The tree is empty, or the root was split.
+        if len(new_links) > 1 or not path:
+            return store_node(not path, new_links).cid
+        return new_links[0].cid
+
+    def retrieve_by_number_from_tree(self, root: VersionTreeNode, num: int) -> tuple[IPAROLink, IPARO]:
+        """Fetch an IPARO with the desired sequence number by descending the version tree."""
+        node = root
+        while True:
+            pos = bisect_left(node.entries, num, key=lambda link: link.seq_num)
+            if pos == len(node.entries) or (node.leaf and node.entries[pos].seq_num != num):
+                raise IPARONotFoundException("Invalid sequence number: " + str(num))
+            if node.leaf:
+                link = node.entries[pos]
+                return link, self.retrieve(link.cid)
+            node = self.retrieve(node.entries[pos].cid)
+
+    def iter_links_forward_from_tree(self, node: VersionTreeNode, num: int = 0) -> Iterator[IPAROLink]:
+        """Lazily yield the links to the versions in the subtree of a version tree node, from the version with
+        the given sequence number onwards, from earliest to latest. Each child node is fetched once, when its
+        first entry is about to be yielded."""
+        first = bisect_left(node.entries, num, key=lambda link: link.seq_num)
+        if node.leaf:
+            yield from node.entries[first:]
+            return
+        for link in node.entries[first:]:
+            yield from self.iter_links_forward_from_tree(self.retrieve(link.cid), num)
+
+    def retrieve_by_date_from_tree(self, root: VersionTreeNode, target_timestamp: str, mode: Mode) -> \
+            tuple[IPARO, IPAROLink]:
+        """Fetch an IPARO with the closest timestamp by descending the version tree (and descending it once
+        more if the previous version is in another leaf). Ties are broken like in `retrieve_by_date`."""
+        node = root
+        while True:
+            # The first entry at or after the target timestamp, or the last entry if there is none.
+            pos = min(bisect_left(node.entries, target_timestamp, key=lambda link: link.timestamp),
+                      len(node.entries) - 1)
+            if node.leaf:
+                break
+            node = self.retrieve(node.entries[pos].cid)
+
+        link = node.entries[pos]
+        if link.timestamp > target_timestamp and link.seq_num > 0:
+            if pos > 0:
+                prev_link = node.entries[pos - 1]
+            else:
+                prev_link, _ = self.retrieve_by_number_from_tree(root, link.seq_num - 1)
+            prev_ts = datetime.fromisoformat(prev_link.timestamp)
+            curr_ts = datetime.fromisoformat(link.timestamp)
+            r = (datetime.fromisoformat(target_timestamp) - prev_ts) / (curr_ts - prev_ts)
+            if mode == Mode.CLOSEST:
+                link = prev_link if r < 0.5 else link
+            elif mode == Mode.LATEST_BEFORE:
+                link = prev_link if r < 1 else link
+            else:
+                link = prev_link if r == 0 else link
+
+        return self.retrieve(link.cid), link
+
     def retrieve_by_number(self, latest_link: IPAROLink, num: int) -> tuple[IPAROLink, IPARO]:
         """Fetch an IPARO with the desired sequence number, using a link to the latest node."""
         curr_link = latest_link
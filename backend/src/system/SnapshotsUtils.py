@@ -1,8 +1,10 @@
 from datetime import datetime
+from itertools import islice
 
 from system.IPARO import IPARO
 from system.IPFS import IPFS, Mode
 from system.IPNS import IPNS
+from system.VersionTreeNode import VersionTreeNode
 
 
 def get_all_snapshots_for_url(url: str, ipns: IPNS, ipfs: IPFS, ipns_records: dict) -> dict[str, IPARO]:
@@ -10,7 +12,13 @@ def get_all_snapshots_for_url(url: str, ipns: IPNS, ipfs: IPFS, ipns_records: di
     if not peer_id:
         raise ValueError("This website has not been archived")
 
-    start_cid = ipns.resolve_cid(peer_id)
+    root_cid = ipns.resolve_cid(peer_id)
+    root = ipfs.retrieve(root_cid)
+    if isinstance(root, VersionTreeNode):
+        # The leaves of the version tree already list the versions from earliest to latest.
+        return {link.cid: ipfs.retrieve(link.cid) for link in ipfs.iter_links_forward_from_tree(root)}
+
+    start_cid = root_cid
     visited = set()
     snapshots = {}
 
@@ -30,6 +38,26 @@ def get_all_snapshots_for_url(url: str, ipns: IPNS, ipfs: IPFS, ipns_records: di
     return dict(sorted(snapshots.items(), key=lambda item: item[1].seq_num))
 
 
+def get_snapshots_page(url: str, ipns: IPNS, ipfs: IPFS, ipns_records: dict, start: int, limit: int) -> \
+        dict[str, IPARO]:
+    """
+    Returns up to limit snapshots of a URL from earliest to latest, starting at the snapshot with sequence
+    number start. If the IPNS name points at a version tree, then only the tree nodes on the way to the
+    page and the snapshots in the page are fetched; otherwise, all snapshots are fetched first.
+    """
+    peer_id = ipns_records.get(url)
+    if not peer_id:
+        raise ValueError("This website has not been archived")
+
+    root = ipfs.retrieve(ipns.resolve_cid(peer_id))
+    if isinstance(root, VersionTreeNode):
+        links = islice(ipfs.iter_links_forward_from_tree(root, start), limit)
+        return {link.cid: ipfs.retrieve(link.cid) for link in links}
+
+    snapshots = get_all_snapshots_for_url(url, ipns, ipfs, ipns_records)
+    return dict(islice(((cid, iparo) for cid, iparo in snapshots.items() if iparo.seq_num >= start), limit))
+
+
 def get_latest_cid(url: str, ipns: IPNS, ipns_records: dict[str, str]):
     """Gets the latest CID of a URL"""
     peer_id = ipns_records.get(url)
@@ -42,8 +70,13 @@ def retrieve_by_number(url: str, ipns: IPNS, ipfs: IPFS, num: int, ipns_records:
     Returns a JSON object that retrieves an IPARO by sequence number.
     """
 
-    latest_cid = get_latest_cid(url, ipns, ipns_records)
-    link, iparo = ipfs.retrieve_by_number(latest_cid, num)
+    root_cid = get_latest_cid(url, ipns, ipns_records)
+    root = ipfs.retrieve(root_cid)
+    if isinstance(root, VersionTreeNode):
+        link, iparo = ipfs.retrieve_by_number_from_tree(root, num)
+    else:
+        latest_link, _ = ipfs.resolve_latest(root_cid, root)
+        link, iparo = ipfs.retrieve_by_number(latest_link, num)
     return {link.cid: iparo}
 
 
@@ -55,7 +88,9 @@ def retrieve_closest_iparos(url: str, ipns: IPNS, ipfs: IPFS, date: str, ipns_re
     contains the specific date in YYYY-mm-dd format.
     """
     peer_id = ipns_records.get(url)
-    latest_cid = ipns.resolve_cid(peer_id)
+    root_cid = ipns.resolve_cid(peer_id)
+    root = ipfs.retrieve(root_cid)
+    latest_link, _ = ipfs.resolve_latest(root_cid, root)
 
     # Need to convert the YYYY-mm-dd into timestamp
     timestamp = datetime.strptime(date, "%Y-%m-%d").isoformat()
@@ -65,8 +100,12 @@ def retrieve_closest_iparos(url: str, ipns: IPNS, ipfs: IPFS, date: str, ipns_re
 
     # We want all the known links for the closest timestamp,
     # so we don't have to travel all the way back.
-    iparo, known_links = ipfs.retrieve_by_date(latest_cid, time_string, Mode.CLOSEST)
+    if isinstance(root, VersionTreeNode):
+        iparo, link = ipfs.retrieve_by_date_from_tree(root, time_string, Mode.CLOSEST)
+        known_links = {link, latest_link}
+    else:
+        iparo, known_links = ipfs.retrieve_by_date(latest_link.cid, time_string, Mode.CLOSEST)
 
-    iparos = ipfs.retrieve_closest_iparos(iparo, latest_cid, known_links, limit)
+    iparos = ipfs.retrieve_closest_iparos(iparo, latest_link, known_links, limit)
 
     return iparos
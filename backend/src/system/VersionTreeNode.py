@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from system.IPAROLink import IPAROLink
+
+
+@dataclass(frozen=True)
+class VersionTreeNode:
+    """
+    A node of the persistent version tree, which is a copy-on-write B+ tree of all versions of a URL,
+    keyed by both sequence number and timestamp. When the version tree is used, the IPNS name of the URL
+    points at its root instead of the latest IPARO. A link to a node has the sequence number and the
+    timestamp of the last version in its subtree.
+    """
+    url: str
+    leaf: bool
+    entries: tuple[IPAROLink, ...]
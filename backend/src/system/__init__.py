@@ -1,4 +1,6 @@
-__all__ = ["IPAROLink", "IPAROFactory", "IPARO", "IPFS", "IPNS", "Utils", "SnapshotsUtils", "IPAROLinkFactory", "IPAROException"]
+__all__ = ["IPAROLink", "IPAROFactory", "IPARO", "IPFS", "IPNS", "Utils", "SnapshotsUtils", "IPAROLinkFactory", "IPAROException",
+           "VersionTreeNode"]
 
 # Import the submodules
-from . import (IPAROLink, IPARO, IPAROFactory, IPFS, IPNS, Utils, IPAROLinkFactory, IPAROException, SnapshotsUtils)
\ No newline at end of file
+from . import (IPAROLink, IPARO, IPAROFactory, IPFS, IPNS, Utils, IPAROLinkFactory, IPAROException, SnapshotsUtils,
+               VersionTreeNode)
\ No newline at end of file
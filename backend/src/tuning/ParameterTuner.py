@@ -0,0 +1,216 @@
+import math
+import random
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from simulation.CommandLineParser import CommandLineParser
+from simulation.CommandLineValidator import validator
+from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
+from simulation.Operation import IterableOperation, StoreOperation, FirstOperation, LatestOperation, \
+    GetNthOperation, GetAtTOperation, GetNthIPNSOperation, GetAtTIPNSOperation, ForwardOperation, \
+    ListAllOperation, reset
+
+# The read operations whose costs can be weighted, by their names on the command line.
+OPERATIONS: dict[str, type[IterableOperation]] = {
+    "first": FirstOperation,
+    "latest": LatestOperation,
+    "time": GetAtTOperation,
+    "nth": GetNthOperation,
+    "time-ipns": GetAtTIPNSOperation,
+    "nth-ipns": GetNthIPNSOperation,
+    "forward": ForwardOperation,
+    "list": ListAllOperation,
+}
+DEFAULT_WEIGHTS = {"time": 1.0, "nth": 1.0}
+SEED = 0
+
+
+@dataclass(frozen=True)
+class ParameterSpace:
+    """
+    The range of the parameter of a policy that is searched.
+    """
+    args: str
+    """
+    The command-line arguments of the policy, with {} in place of the parameter.
+    """
+    low: float
+    high: float
+    integer: bool = True
+
+    def get_values(self, num_values: int) -> list[int | float]:
+        """
+        Gets up to ``num_values`` values of the parameter, spaced evenly on a log scale, since the costs
+        change the most between small values.
+        """
+        values = np.geomspace(self.low, self.high, num_values)
+        if self.integer:
+            return list(dict.fromkeys(int(value) for value in np.round(values)))
+        return list(dict.fromkeys(float(value) for value in np.round(values, 3)))
+
+
+# The policies with a parameter, by the names of their groups in the results folder.
+PARAMETER_SPACES = {
+    "Previous": ParameterSpace("-p {}", 1, 64),
+    "Random": ParameterSpace("-r {}", 1, 64),
+    "Sequential-Uniform": ParameterSpace("-u {}", 1, 64),
+    "Sequential-Max-Gap": ParameterSpace("-g {}", 1, 256),
+    "Sequential-Exponential": ParameterSpace("-e {}", 1.1, 8, integer=False),
+    "Temporal-Uniform": ParameterSpace("-U {}", 1, 64),
+    "Temporal-Min-Gap": ParameterSpace("-G {}", 1, 1000, integer=False),
+    "Temporal-Exponential": ParameterSpace("-E {} 10", 1.1, 8, integer=False),
+}
+
+
+@dataclass
+class Evaluation:
+    policy: str
+    value: int | float
+    args: str
+    iterations: int
+    """
+    The number of iterations of each read operation.
+    """
+    links: float
+    """
+    The mean number of links per version.
+    """
+    bytes: float
+    """
+    The mean number of bytes stored per version, which counts every object stored on IPFS.
+    """
+    costs: dict[str, float]
+    """
+    The mean number of IPFS retrieves of each read operation, by the names of the operations.
+    """
+    retrieval_cost: float
+    feasible: bool
+
+
+@dataclass
+class Objective:
+    """
+    The weighted retrieval cost of a policy at a version volume and density, which is minimized subject
+    to a budget of links or bytes per version.
+    """
+    volume: int
+    density_args: str = ""
+    weights: dict[str, float] = field(default_factory=lambda: DEFAULT_WEIGHTS.copy())
+    """
+    The weight of the mean cost of each read operation, by the names in ``OPERATIONS``.
+    """
+    max_links: float | None = None
+    """
+    The maximum mean number of links per version.
+    """
+    max_bytes: float | None = None
+    """
+    The maximum mean number of bytes stored per version.
+    """
+
+    def is_feasible(self, links: float, num_bytes: float) -> bool:
+        return ((self.max_links is None or links <= self.max_links)
+                and (self.max_bytes is None or num_bytes <= self.max_bytes))
+
+    def evaluate(self, policy: str, value: int | float, iterations: int, seed: int = SEED) -> Evaluation:
+        """
+        Simulates a policy in memory, without saving the results. Every evaluation with the same seed stores
+        the same versions and runs the read operations on the same targets, so that the policies are
+        compared on the same samples.
+
+        :param policy: The name of the policy, in ``PARAMETER_SPACES``.
+        :param value: The value of the parameter of the policy.
+        :param iterations: The number of iterations of each read operation.
+        """
+        args = PARAMETER_SPACES[policy].args.format(value)
+        parser = CommandLineParser(validator.parse_args(f"{args} {self.density_args}".split()))
+        env = IPAROSimulationEnvironment(parser.parse_policy(), self.volume, parser.parse_density(),
+                                         list(self.weights), iterations=iterations)
+        reset(reset_data=True)
+        try:
+            random.seed(seed)
+            np.random.seed(seed)
+            store_op = StoreOperation(env, save_to_file=False)
+            store_op.execute()
+            links = float(store_op.opcounts["Links"].mean())
+            num_bytes = float(store_op.opcounts["Bytes Stored"].mean())
+            costs = {}
+            for name in self.weights:
+                random.seed(seed)
+                np.random.seed(seed)
+                op = OPERATIONS[name](env, save_to_file=False)
+                op.execute()
+                costs[op.name()] = float(op.opcounts["IPFS Retrieve"].mean())
+        finally:
+            reset(reset_data=True)
+        retrieval_cost = sum(weight * cost for weight, cost in zip(self.weights.values(), costs.values()))
+        return Evaluation(policy, value, args, iterations, links, num_bytes, costs, retrieval_cost,
+                          self.is_feasible(links, num_bytes))
+
+
+def successive_halving(objective: Objective, policy: str, num_candidates: int = 16, min_iterations: int = 10,
+                       max_iterations: int = 270, reduction_factor: int = 3, seed: int = SEED,
+                       verbose: bool = False) -> list[Evaluation]:
+    """
+    Searches the parameter space of a policy with successive halving. Every candidate is evaluated with a few
+    iterations, and the best fraction (``1 / reduction_factor``) of them is evaluated again with
+    ``reduction_factor`` times as many iterations, until one candidate is left or the maximum number of
+    iterations is reached. Candidates that exceed the budget are ranked last, from the least storage to the
+    most.
+
+    :returns: Every evaluation, in the order they were made.
+    """
+    candidates = PARAMETER_SPACES[policy].get_values(num_candidates)
+    iterations = min_iterations
+    evaluations = []
+    while True:
+        rung = [objective.evaluate(policy, value, iterations, seed) for value in candidates]
+        evaluations.extend(rung)
+        if verbose:
+            print(f"{policy}: Evaluated {len(rung)} candidates with {iterations} iterations.", flush=True)
+        if len(candidates) == 1 or iterations >= max_iterations:
+            return evaluations
+        rung.sort(key=lambda evaluation: (evaluation.retrieval_cost if evaluation.feasible else math.inf,
+                                          evaluation.links, evaluation.bytes))
+        candidates = [evaluation.value for evaluation in rung[:math.ceil(len(rung) / reduction_factor)]]
+        iterations = min(iterations * reduction_factor, max_iterations)
+
+
+def to_dataframe(evaluations: list[Evaluation]) -> pd.DataFrame:
+    return pd.DataFrame([{"Policy": evaluation.policy, "Value": evaluation.value, "Args": evaluation.args,
+                          "Iterations": evaluation.iterations, "Links": evaluation.links, "Bytes": evaluation.bytes,
+                          **evaluation.costs, "Retrieval Cost": evaluation.retrieval_cost,
+                          "Feasible": evaluation.feasible} for evaluation in evaluations])
+
+
+def get_final_evaluations(evaluations: pd.DataFrame) -> pd.DataFrame:
+    """
+    Gets the evaluation of each candidate with the most iterations, which is the most accurate one.
+    """
+    return (evaluations.sort_values("Iterations", kind="stable").groupby("Args", sort=False).tail(1)
+            .reset_index(drop=True))
+
+
+def get_pareto_front(evaluations: pd.DataFrame, storage: str = "Links") -> pd.DataFrame:
+    """
+    Gets the candidates that no other candidate beats on both the storage and the retrieval cost, from the
+    least storage to the most, using the final evaluation of each candidate.
+
+    :param storage: The storage column, which is 'Links' or 'Bytes'.
+    """
+    candidates = get_final_evaluations(evaluations).sort_values([storage, "Retrieval Cost"])
+    previous_best = candidates["Retrieval Cost"].astype(float).cummin().shift(fill_value=math.inf)
+    return candidates[candidates["Retrieval Cost"] < previous_best].reset_index(drop=True)
+
+
+def get_best_candidate(evaluations: pd.DataFrame) -> pd.Series | None:
+    """
+    Gets the final evaluation of the candidate with the lowest retrieval cost within the budget, if any,
+    among the candidates that survived the successive halving of each policy.
+    """
+    candidates = get_final_evaluations(evaluations)
+    survived = candidates["Iterations"] == candidates.groupby("Policy")["Iterations"].transform("max")
+    candidates = candidates[survived & candidates["Feasible"]]
+    return candidates.loc[candidates["Retrieval Cost"].idxmin()] if len(candidates) else None
@@ -0,0 +1,4 @@
+__all__ = ["ParameterTuner"]
+
+# Import the submodules
+from . import ParameterTuner
@@ -0,0 +1,77 @@
+import argparse
+import sys
+
+import pandas as pd
+
+from simulation.CommandLineValidator import check_positive_int, check_greater_than_zero
+from tuning.ParameterTuner import Objective, PARAMETER_SPACES, OPERATIONS, DEFAULT_WEIGHTS, SEED, \
+    successive_halving, to_dataframe, get_pareto_front, get_best_candidate
+
+
+def check_weight(val: str) -> tuple[str, float]:
+    """
+    Parses the weight of an operation, written as operation=weight.
+    """
+    name, _, weight = val.partition("=")
+    if name not in OPERATIONS:
+        raise argparse.ArgumentTypeError(f"{name} is not one of {', '.join(OPERATIONS)}")
+    return name, check_greater_than_zero(weight or "1")
+
+
+tuning_parser = argparse.ArgumentParser(prog="python -m tuning",
+                                        description="Searches the parameters of the policies for the lowest "
+                                                    "weighted retrieval cost within a storage budget, and prints "
+                                                    "the Pareto front of the storage and the retrieval cost.")
+tuning_parser.add_argument("-V", "--volume", help="The version volume. Default is 1000.", type=check_positive_int,
+                           default=1000)
+tuning_parser.add_argument("-d", "--density", help="The command-line arguments of the version density, such as "
+                                                   "-d='-l 2'. Default is uniform.", default="")
+tuning_parser.add_argument("-p", "--policies", help="The policies to tune. Default is every policy with a "
+                                                    "parameter.", nargs="+", choices=list(PARAMETER_SPACES),
+                           default=list(PARAMETER_SPACES))
+tuning_parser.add_argument("-w", "--weights", help="The weights of the read operations, such as time=2 nth=1. "
+                                                   "Default is time=1 nth=1.", nargs="+", type=check_weight,
+                           metavar="operation=weight")
+tuning_parser.add_argument("-L", "--max-links", help="The maximum mean number of links per version.",
+                           type=check_greater_than_zero, dest="max_links")
+tuning_parser.add_argument("-B", "--max-bytes", help="The maximum mean number of bytes stored per version.",
+                           type=check_greater_than_zero, dest="max_bytes")
+tuning_parser.add_argument("-n", "--candidates", help="The number of values of each parameter to start with. "
+                                                      "Default is 16.", type=check_positive_int, default=16)
+tuning_parser.add_argument("-i", "--min-iterations", help="The number of iterations of the first round. Default "
+                                                          "is 10.", type=check_positive_int, default=10,
+                           dest="min_iterations")
+tuning_parser.add_argument("-I", "--max-iterations", help="The maximum number of iterations of a round. Default "
+                                                          "is 270.", type=check_positive_int, default=270,
+                           dest="max_iterations")
+tuning_parser.add_argument("-f", "--factor", help="The factor by which the candidates are reduced and the "
+                                                  "iterations are increased after each round. Default is 3.",
+                           type=check_positive_int, default=3)
+tuning_parser.add_argument("-s", "--seed", help="The seed of the versions and the targets.", type=int,
+                           default=SEED)
+tuning_parser.add_argument("-o", "--output", help="The CSV file to save every evaluation to.")
+tuning_parser.add_argument("-v", "--verbose", help="Prints the progress of the search.", action="store_true")
+
+if __name__ == '__main__':
+    args = tuning_parser.parse_args()
+    if args.factor < 2:
+        tuning_parser.error("The factor must be at least 2.")
+    objective = Objective(args.volume, args.density, dict(args.weights) if args.weights else DEFAULT_WEIGHTS.copy(),
+                          args.max_links, args.max_bytes)
+    evaluations = []
+    for policy in args.policies:
+        evaluations.extend(successive_halving(objective, policy, args.candidates, args.min_iterations,
+                                              args.max_iterations, args.factor, args.seed, args.verbose))
+    df = to_dataframe(evaluations)
+    if args.output:
+        df.to_csv(args.output, index=False)
+
+    with pd.option_context("display.max_rows", None, "display.width", None):
+        print("Pareto front:")
+        print(get_pareto_front(df, "Bytes" if args.max_bytes and not args.max_links else "Links").to_string())
+    best = get_best_candidate(df)
+    if best is None:
+        print("No candidate is within the budget.", file=sys.stderr)
+        sys.exit(1)
+    print(f"Best within the budget: {best['Args']} ({best['Policy']}), with a retrieval cost of "
+          f"{best['Retrieval Cost']:.3f}, {best['Links']:.3f} links and {best['Bytes']:.1f} bytes per version.")
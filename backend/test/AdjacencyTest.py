@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+
+from components.Adjacency import get_links, get_all_pairs, get_linked_pairs, get_binned_adjacency
+from simulation.IPARO import IPARO
+from simulation.IPAROLink import IPAROLink
+from simulation.TimeUnit import TimeUnit
+
+URL = "example.com"
+
+
+def get_chain(destinations: list[list[int]]) -> list[IPARO]:
+    """
+    Makes a chain where the IPARO with each sequence number links to the given sequence numbers, one
+    second apart, from the latest to the earliest like ``IPFS.get_all_iparos``.
+    """
+    links = [IPAROLink(seq_num, seq_num * TimeUnit.SECONDS, str(seq_num)) for seq_num in range(len(destinations))]
+    return [IPARO(URL, seq_num * TimeUnit.SECONDS, seq_num, {links[i] for i in linked}, b"")
+            for seq_num, linked in reversed(list(enumerate(destinations)))]
+
+
+class AdjacencyTest(unittest.TestCase):
+    def setUp(self):
+        self.matrix, self.timestamps = get_links(get_chain([[], [0], [1, 0], [2]]), 0)
+
+    def test_links_and_timestamps(self):
+        self.assertEqual(self.matrix.shape, (4, 4))
+        self.assertListEqual(sorted(zip(*self.matrix.nonzero())), [(1, 0), (2, 0), (2, 1), (3, 2)])
+        np.testing.assert_array_equal(self.timestamps, [0, 1, 2, 3])
+
+    def test_all_pairs(self):
+        pairs = get_all_pairs(self.matrix, self.timestamps)
+        self.assertEqual(len(pairs), 16)
+        pairs = pairs.set_index(["Source", "Destination"])
+        self.assertEqual(pairs.loc[(2, 1), "Linked"], "Yes")
+        self.assertEqual(pairs.loc[(2, 1), "Relationship"], "Linked")
+        self.assertEqual(pairs.loc[(3, 0), "Linked"], "No")
+        self.assertEqual(pairs.loc[(3, 0), "Relationship"], "None")
+        self.assertEqual(pairs.loc[(0, 3), "Linked"], "N/A")
+        self.assertEqual(pairs.loc[(1, 1), "Relationship"], "Self")
+        self.assertEqual(pairs.loc[(3, 0), "Source Timestamp"], 3)
+        self.assertEqual(pairs.loc[(3, 0), "Destination Timestamp"], 0)
+
+    def test_linked_pairs(self):
+        pairs = get_linked_pairs(self.matrix, self.timestamps)
+        self.assertListEqual(list(zip(pairs["Source"], pairs["Destination"])),
+                             [(0, 0), (1, 1), (1, 0), (2, 2), (2, 1), (2, 0), (3, 3), (3, 2)])
+
+    def test_binned_adjacency(self):
+        binned = get_binned_adjacency(self.matrix, 2).set_index(["Source Start", "Destination Start"])
+        self.assertEqual(binned["Links"].sum(), 4)
+        self.assertEqual(binned["Pairs"].sum(), 6)
+        self.assertListEqual(binned.loc[(2, 0), ["Source End", "Destination End", "Links", "Pairs"]].tolist(),
+                             [3, 1, 2, 4])
+        self.assertEqual(binned.loc[(2, 0), "Linked Fraction"], 0.5)
+        self.assertTrue(np.isnan(binned.loc[(0, 2), "Linked Fraction"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from benchmark.BenchmarkRunner import Benchmark, BenchmarkResult, run_benchmark, save_results, load_results, \
+    compare_results
+from benchmark.Benchmarks import iter_benchmarks
+from simulation.IPFS import ipfs
+from simulation.IPNS import ipns
+
+
+def get_result(name: str, median_ns: float) -> BenchmarkResult:
+    return BenchmarkResult(name, median_ns, median_ns, median_ns, 1, 1)
+
+
+class BenchmarkTest(unittest.TestCase):
+
+    def tearDown(self):
+        ipns.reset_data()
+        ipns.reset_counts()
+        ipfs.reset_data()
+        ipfs.reset_counts()
+
+    def test_runs_the_setup_before_every_repeat(self):
+        calls = []
+        benchmark = Benchmark("Test", lambda: calls.append("func"), lambda: calls.append("setup"))
+        result = run_benchmark(benchmark, repeat=3)
+        self.assertListEqual(calls, ["setup", "func"] * 3)
+        self.assertEqual(result.number, 1)
+
+    def test_times_fast_benchmarks_over_many_calls(self):
+        result = run_benchmark(Benchmark("Test", lambda: None), repeat=2, min_time_ns=1_000_000)
+        self.assertGreater(result.number, 1)
+        self.assertLessEqual(result.min_ns, result.median_ns)
+
+    def test_can_save_and_load_results(self):
+        results = [get_result("A", 100), get_result("B", 200)]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            save_results(results, path)
+            self.assertDictEqual(load_results(path), {"A": results[0], "B": results[1]})
+
+    def test_detects_regressions_against_the_baseline(self):
+        baseline = {"A": get_result("A", 100), "B": get_result("B", 100)}
+        results = [get_result("A", 110), get_result("B", 150), get_result("C", 1000)]
+        comparison = compare_results(results, baseline, threshold=0.2)
+        self.assertListEqual([(name, regressed) for name, _, regressed in comparison], [("A", False), ("B", True)])
+        self.assertAlmostEqual(comparison[1][1], 1.5)
+
+    def test_benchmarks_every_primitive_policy_and_store_operation(self):
+        names = []
+        for benchmark in iter_benchmarks([10], ["-s", "-g 2"], [""]):
+            run_benchmark(benchmark, repeat=1, min_time_ns=0)
+            names.append(benchmark.name.split("/")[0])
+        self.assertListEqual(names, ["IPFS.store", "IPFS.retrieve", "IPFS.retrieve_nth_iparo",
+                                     "IPFS.retrieve_closest_iparo", "StoreOperation",
+                                     "SingleStrategy.get_candidate_nodes", "StoreOperation",
+                                     "SequentialSMaxGapStrategy.get_candidate_nodes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
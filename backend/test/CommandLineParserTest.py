@@ -42,6 +42,38 @@ def get_iterations(parser):
     return parser.parse_iterations()
 
 
+def get_range_widths(parser):
+    return parser.parse_range_widths()
+
+
+def get_index_interval(parser):
+    return parser.parse_index_interval()
+
+
+def get_version_tree_fanout(parser):
+    return parser.parse_version_tree_fanout()
+
+
+def get_page_size(parser):
+    return parser.parse_page_size()
+
+
+def get_delta_links(parser):
+    return parser.parse_delta_links()
+
+
+def get_timing(parser):
+    return parser.parse_timing(), parser.parse_trace_memory()
+
+
+def get_trace(parser):
+    return parser.parse_trace()
+
+
+def get_profile(parser):
+    return parser.parse_profile()
+
+
 def get_verbosity(parser):
     return parser.parse_verbosity()
 
@@ -84,6 +116,10 @@ class CommandLineParserTest(unittest.TestCase):
         self.assertIsInstance(strategy, SequentialExponentialStrategy)
         self.assertEqual(strategy.k, 5)
 
+    def test_can_parse_skew_binary(self):
+        strategy = get_relevant_output(["-j"], action=get_policy)
+        self.assertIsInstance(strategy, SkewBinaryStrategy)
+
     def test_can_parse_temp_uniform(self):
         strategy = get_relevant_output(["-U", "5"], action=get_policy)
         self.assertIsInstance(strategy, TemporalUniformStrategy)
@@ -100,6 +136,16 @@ class CommandLineParserTest(unittest.TestCase):
         self.assertEqual(strategy.base, 2.2)
         self.assertEqual(strategy.time_unit, 5.3)
 
+    def test_can_parse_temp_calendar(self):
+        strategy = get_relevant_output(["-C", "0.5"], action=get_policy)
+        self.assertIsInstance(strategy, TemporalCalendarStrategy)
+        self.assertEqual(strategy.resolution, 0.5)
+
+    def test_temp_calendar_resolution_defaults_to_one_millisecond(self):
+        strategy = get_relevant_output(["-C"], action=get_policy)
+        self.assertIsInstance(strategy, TemporalCalendarStrategy)
+        self.assertEqual(strategy.resolution, 0.001)
+
     def test_volume_defaults_to_medium(self):
         volume = get_relevant_output(["-s"], action=get_volume)
         self.assertEqual(volume, VersionVolume.MEDIUM)
@@ -136,7 +182,8 @@ class CommandLineParserTest(unittest.TestCase):
         operations = get_relevant_output(["-s"], action=get_operation)
 
         # Misleading naming by unittest (should be something like "assertEqualsUnordered")
-        self.assertCountEqual(operations, ["first", "latest", "nth", "time", "list", "unsafe-list"])
+        self.assertCountEqual(operations, ["first", "latest", "nth", "time", "list", "unsafe-list", "range",
+                                           "time-ipns", "nth-ipns", "forward"])
 
     def test_can_parse_one_operation(self):
         operations = get_relevant_output(["-s", "-O", "latest"], action=get_operation)
@@ -150,6 +197,86 @@ class CommandLineParserTest(unittest.TestCase):
         # Misleading naming by unittest (should be something like "assertEqualsUnordered")
         self.assertCountEqual(operations, ["time", "nth"])
 
+    def test_can_parse_default_range_widths(self):
+        widths = get_relevant_output(["-s"], action=get_range_widths)
+
+        self.assertListEqual(widths, [0.01, 0.1])
+
+    def test_can_parse_multiple_range_widths(self):
+        widths = get_relevant_output(["-s", "-w", "0.5", "1"], action=get_range_widths)
+
+        self.assertListEqual(widths, [0.5, 1])
+
+    def test_index_interval_defaults_to_zero(self):
+        interval = get_relevant_output(["-s"], action=get_index_interval)
+
+        self.assertEqual(interval, 0)
+
+    def test_can_parse_index_interval(self):
+        interval = get_relevant_output(["-s", "-K", "10"], action=get_index_interval)
+
+        self.assertEqual(interval, 10)
+
+    def test_version_tree_is_not_used_by_default(self):
+        fanout = get_relevant_output(["-s"], action=get_version_tree_fanout)
+
+        self.assertEqual(fanout, 0)
+
+    def test_can_parse_version_tree_fanout(self):
+        fanout = get_relevant_output(["-s", "-B", "16"], action=get_version_tree_fanout)
+
+        self.assertEqual(fanout, 16)
+
+    def test_page_size_is_10_by_default(self):
+        page_size = get_relevant_output(["-s"], action=get_page_size)
+
+        self.assertEqual(page_size, 10)
+
+    def test_can_parse_page_size(self):
+        page_size = get_relevant_output(["-s", "-P", "25"], action=get_page_size)
+
+        self.assertEqual(page_size, 25)
+
+    def test_links_are_not_delta_encoded_by_default(self):
+        delta_links = get_relevant_output(["-s"], action=get_delta_links)
+
+        self.assertFalse(delta_links)
+
+    def test_can_parse_delta_links(self):
+        delta_links = get_relevant_output(["-c", "-D"], action=get_delta_links)
+
+        self.assertTrue(delta_links)
+
+    def test_latency_and_memory_are_not_recorded_by_default(self):
+        timing = get_relevant_output(["-s"], action=get_timing)
+
+        self.assertTupleEqual(timing, (False, False))
+
+    def test_can_parse_timing_and_memory_tracing(self):
+        timing = get_relevant_output(["-s", "-T", "-M"], action=get_timing)
+
+        self.assertTupleEqual(timing, (True, True))
+
+    def test_traversals_are_not_traced_by_default(self):
+        trace = get_relevant_output(["-s"], action=get_trace)
+
+        self.assertFalse(trace)
+
+    def test_can_parse_trace(self):
+        trace = get_relevant_output(["-s", "-R"], action=get_trace)
+
+        self.assertTrue(trace)
+
+    def test_operations_are_not_profiled_by_default(self):
+        profile = get_relevant_output(["-s"], action=get_profile)
+
+        self.assertFalse(profile)
+
+    def test_can_parse_profile(self):
+        profile = get_relevant_output(["-s", "--profile"], action=get_profile)
+
+        self.assertTrue(profile)
+
     def test_can_parse_verbosity(self):
         verbose = get_relevant_output(["-s", "-v"], action=get_verbosity)
 
@@ -164,3 +291,31 @@ class CommandLineParserTest(unittest.TestCase):
         iterations = get_relevant_output(["-s", "-n", "10"], action=get_iterations)
 
         self.assertEqual(iterations, 10)
+
+    def test_can_parse_environment(self):
+        env = get_relevant_output(["-p", "3", "-V", "20", "-l", "2", "-n", "5", "-O", "nth", "-S", "-f"],
+                                  action=lambda parser: parser.parse_environment())
+
+        self.assertEqual(str(env.linking_strategy), "3-Previous")
+        self.assertEqual(env.version_volume, 20)
+        self.assertIsInstance(env.version_density, LinearVersionDensity)
+        self.assertListEqual(env.operations, ["nth"])
+        self.assertEqual(env.iterations, 5)
+        self.assertTrue(env.recompute_storage)
+        self.assertTrue(env.profile)
+        self.assertEqual(env.output_dir, ".")
+        self.assertEqual(env.ci_width, 0)
+        self.assertFalse(env.summary_only)
+
+    def test_can_parse_adaptive_iterations(self):
+        env = get_relevant_output(["-s", "-a", "0.1", "-I", "2", "-N", "50"],
+                                  action=lambda parser: parser.parse_environment())
+
+        self.assertEqual(env.ci_width, 0.1)
+        self.assertEqual(env.min_iterations, 2)
+        self.assertEqual(env.max_iterations, 50)
+
+    def test_can_parse_summary_only(self):
+        env = get_relevant_output(["-s", "-Z"], action=lambda parser: parser.parse_environment())
+
+        self.assertTrue(env.summary_only)
@@ -143,6 +143,14 @@ class CommandLineValidatorTest(unittest.TestCase):
         is_valid_zero = validate(["-e", "0"])
         self.assertFalse(is_valid_negative or is_valid_zero)
 
+    def test_command_line_accepts_skew_binary(self):
+        is_valid = validate(["--skewbinary"])
+        self.assertTrue(is_valid)
+
+    def test_skew_binary_requires_no_arguments(self):
+        is_valid = validate(["-j", "2"])
+        self.assertFalse(is_valid)
+
     def test_temporal_uniform_requires_one_argument(self):
         is_valid = validate(["-U"])
         self.assertFalse(is_valid)
@@ -186,6 +194,29 @@ class CommandLineValidatorTest(unittest.TestCase):
         is_valid_alphabetic = validate(["-G", "x"])
         self.assertFalse(is_valid_alphabetic)
 
+    def test_command_line_accepts_temporal_calendar(self):
+        is_valid = validate(["-C", "0.01"])
+        self.assertTrue(is_valid)
+
+    def test_temporal_calendar_argument_is_optional(self):
+        is_valid = validate(["--tempcalendar"])
+        self.assertTrue(is_valid)
+
+    def test_temporal_calendar_requires_that_the_argument_be_positive(self):
+        is_valid_zero = validate(["-C", "0"])
+        is_valid_negative = validate(["-C", "-1"])
+        self.assertFalse(is_valid_zero or is_valid_negative)
+
+    def test_index_interval_must_be_a_positive_integer(self):
+        self.assertTrue(validate(["-s", "-K", "10"]))
+        self.assertFalse(validate(["-s", "-K", "0"]))
+        self.assertFalse(validate(["-s", "-K", "2.5"]))
+
+    def test_version_tree_fanout_must_be_at_least_two(self):
+        self.assertTrue(validate(["-s", "-B", "2"]))
+        self.assertFalse(validate(["-s", "-B", "1"]))
+        self.assertFalse(validate(["-s", "-B", "x"]))
+
     def test_temporal_exponential_requires_two_arguments(self):
         is_valid = validate(["-E", "5"])
         self.assertFalse(is_valid)
@@ -318,6 +349,22 @@ class CommandLineValidatorTest(unittest.TestCase):
         is_valid = validate("-s -O list".split())
         self.assertTrue(is_valid)
 
+    def test_command_line_accepts_range_operation(self):
+        is_valid = validate("-s -O range".split())
+        self.assertTrue(is_valid)
+
+    def test_command_line_accepts_range_widths(self):
+        is_valid = validate("-s -O range -w 0.05 0.5 1".split())
+        self.assertTrue(is_valid)
+
+    def test_command_line_does_not_accept_zero_range_width(self):
+        is_valid = validate("-s -w 0".split())
+        self.assertFalse(is_valid)
+
+    def test_command_line_does_not_accept_range_width_greater_than_one(self):
+        is_valid = validate("-s -w 1.5".split())
+        self.assertFalse(is_valid)
+
     def test_command_line_accepts_multiple_operations(self):
         is_valid = validate("-s -O list unsafe-list".split())
         self.assertTrue(is_valid)
@@ -350,6 +397,26 @@ class CommandLineValidatorTest(unittest.TestCase):
         is_valid = validate("-s -n hotdog".split())
         self.assertFalse(is_valid)
 
+    def test_command_line_accepts_adaptive_iterations(self):
+        is_valid = validate("-s -n 5 -a 0.05 -N 500".split())
+        self.assertTrue(is_valid)
+
+    def test_command_line_does_not_accept_zero_confidence_interval_width(self):
+        is_valid = validate("-s -a 0".split())
+        self.assertFalse(is_valid)
+
+    def test_command_line_does_not_accept_fewer_maximum_iterations_than_minimum_iterations(self):
+        is_valid = validate("-s -I 20 -a 0.05 -N 10".split())
+        self.assertFalse(is_valid)
+
+    def test_command_line_does_not_accept_zero_minimum_iterations(self):
+        is_valid = validate("-s -I 0 -a 0.05".split())
+        self.assertFalse(is_valid)
+
+    def test_command_line_accepts_summary_only(self):
+        is_valid = validate("-s -n 100 -Z".split())
+        self.assertTrue(is_valid)
+
     def test_command_line_accepts_verbosity(self):
         is_valid = validate("-s -n 3 -v".split())
         self.assertTrue(is_valid)
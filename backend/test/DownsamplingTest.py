@@ -0,0 +1,61 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from components.Downsampling import get_lttb_indices, get_min_max_indices, downsample
+
+
+class DownsamplingTest(unittest.TestCase):
+    def test_lttb_keeps_the_ends_and_the_peaks(self):
+        x = np.arange(1000, dtype=np.float64)
+        y = np.zeros(1000)
+        y[250] = 100
+        y[700] = -50
+        indices = get_lttb_indices(x, y, 50)
+        self.assertEqual(len(indices), 50)
+        self.assertEqual(indices[0], 0)
+        self.assertEqual(indices[-1], 999)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+        self.assertIn(250, indices)
+        self.assertIn(700, indices)
+
+    def test_lttb_keeps_short_lines(self):
+        x = np.arange(10, dtype=np.float64)
+        np.testing.assert_array_equal(get_lttb_indices(x, x, 10), np.arange(10))
+        np.testing.assert_array_equal(get_lttb_indices(x, x, 20), np.arange(10))
+
+    def test_min_max_keeps_the_range_of_each_bucket(self):
+        rng = np.random.default_rng(0)
+        y = rng.normal(size=10000)
+        indices = get_min_max_indices(y, 100)
+        self.assertLessEqual(len(indices), 100)
+        self.assertIn(np.argmin(y), indices)
+        self.assertIn(np.argmax(y), indices)
+        self.assertTrue(np.all(np.diff(indices) > 0))
+
+    def test_downsample_each_series(self):
+        df = pd.DataFrame({"Policy": np.repeat(["Single", "Previous"], 500),
+                           "Iteration": np.tile(np.arange(500), 2),
+                           "Action Count": np.tile(np.arange(500) % 7, 2).astype(np.float64)})
+        df.loc[3, "Action Count"] = np.nan
+        result = downsample(df, "Iteration", "Action Count", 40, by=["Policy"])
+        self.assertListEqual(result.groupby("Policy").size().tolist(), [40, 40])
+        self.assertFalse(result["Action Count"].isna().any())
+        self.assertListEqual(list(result.columns), list(df.columns))
+        result = downsample(df, "Iteration", "Action Count", 40, by=["Policy"], method='min-max')
+        self.assertTrue((result.groupby("Policy").size() <= 40).all())
+        self.assertEqual(result["Action Count"].max(), 6)
+
+    def test_downsample_columns_that_are_also_in_the_index(self):
+        df = pd.DataFrame({"Policy": np.repeat(["Single", "Previous"], 500),
+                           "Iteration": np.tile(np.arange(500)[::-1], 2), "Links": np.ones(1000)})
+        df = df.set_index(["Policy", "Iteration"], drop=False)
+        result = downsample(df, "Iteration", "Links", 10, by=["Policy"])
+        self.assertEqual(len(result), 20)
+        self.assertTrue((result["Iteration"].iloc[:10].diff().dropna() > 0).all())
+        self.assertListEqual(result["Iteration"].iloc[[0, 9]].tolist(), [0, 499])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import json
+import os
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+
+from simulation.CommandLineParser import CommandLineParser
+from simulation.CommandLineValidator import validator
+from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
+from simulation.Operation import StoreOperation, FirstOperation, LatestOperation, GetNthOperation, \
+    GetAtTOperation, GetNthIPNSOperation, GetAtTIPNSOperation, GetRangeOperation, ForwardOperation, \
+    ListAllOperation, IterableOperation, reset
+
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "golden", "op-counts.json")
+# Set this environment variable to 1 to rewrite the golden file after an intended change of the op counts.
+UPDATE_VARIABLE = "UPDATE_GOLDEN_OP_COUNTS"
+# The same version densities as in run.sh, and one policy of each kind.
+DENSITY_ARGS = ["", "-l 2", "-b 20", "-m 0.5 0 300 -m 0.5 1000 400"]
+POLICY_ARGS = ["-s", "-p 4", "-c", "-r 4", "-u 4", "-g 4", "-e 2", "-j", "-U 4", "-G 20", "-E 2 10", "-C 0.001"]
+VOLUMES = [10, 100]
+ITERATIONS = 10
+SEED = 0
+# The time at which the versions start, in seconds since 1970, since calendar policies depend on it.
+START_TIME = 1_700_000_000
+# The sizes of the pickled IPAROs depend on the Python version and the pickle protocol, so only the counts of
+# operations and links are pinned.
+BYTE_COLUMNS = {"Bytes Stored", "Bytes Retrieved", "Index Bytes"}
+
+
+def get_operations(env: IPAROSimulationEnvironment) -> list[IterableOperation]:
+    """
+    Gets every read operation besides the unsafe list all operation, which would take most of the time.
+    """
+    return [FirstOperation(env, False), LatestOperation(env, False), GetNthOperation(env, False),
+            GetAtTOperation(env, False), GetNthIPNSOperation(env, False), GetAtTIPNSOperation(env, False),
+            GetRangeOperation(env, 0.1, False), ForwardOperation(env, False), ListAllOperation(env, False)]
+
+
+def get_op_counts(policy_args: str, density_args: str, volume: int) -> tuple[str, dict[str, dict[str, int]]]:
+    """
+    Stores a seeded chain of versions and runs every operation on it.
+
+    :returns: The key of the chain, and the total of each column of each operation besides the byte columns.
+    """
+    parser = CommandLineParser(validator.parse_args(f"{policy_args} {density_args}".split()))
+    env = IPAROSimulationEnvironment(parser.parse_policy(), volume, parser.parse_density(), [],
+                                     iterations=ITERATIONS)
+    reset(reset_data=True)
+    random.seed(SEED)
+    np.random.seed(SEED)
+    op_counts = {}
+    with patch("simulation.VersionDensity.time.time", return_value=START_TIME):
+        store_op = StoreOperation(env, False)
+    for op in [store_op] + get_operations(env):
+        if op is not store_op:
+            random.seed(SEED)
+            np.random.seed(SEED)
+        op.execute()
+        op_counts[op.name()] = {column: int(total) for column, total in op.opcounts.sum().items()
+                                if column not in BYTE_COLUMNS}
+    reset(reset_data=True)
+    return f"{env.linking_strategy}/{env.version_density}/{volume}", op_counts
+
+
+def compute_golden_op_counts() -> dict[str, dict[str, dict[str, int]]]:
+    """
+    Gets the op counts of every policy, density and volume, in parallel.
+    """
+    matrix = [(policy_args, density_args, volume) for volume in VOLUMES for density_args in DENSITY_ARGS
+              for policy_args in POLICY_ARGS]
+    with ProcessPoolExecutor() as executor:
+        return dict(executor.map(get_op_counts, *zip(*matrix)))
+
+
+def diff_op_counts(expected: dict, actual: dict) -> list[str]:
+    """
+    Lists every op count that differs, as '<chain> <operation> <column>: <expected> -> <actual>'.
+    """
+    lines = []
+    for key in sorted(expected.keys() | actual.keys()):
+        if key not in actual or key not in expected:
+            lines.append(f"{key}: {'missing' if key not in actual else 'not in the golden file'}")
+            continue
+        for op in sorted(expected[key].keys() | actual[key].keys()):
+            expected_counts, actual_counts = expected[key].get(op, {}), actual[key].get(op, {})
+            for column in sorted(expected_counts.keys() | actual_counts.keys()):
+                if expected_counts.get(column) != actual_counts.get(column):
+                    lines.append(f"{key} {op} {column}: {expected_counts.get(column)} -> "
+                                 f"{actual_counts.get(column)}")
+    return lines
+
+
+class GoldenOpCountTest(unittest.TestCase):
+    """
+    Checks that the op counts of a fixed, seeded set of simulations are exactly the same as the ones in the
+    golden file, so that optimizations cannot change the published results by accident. The byte columns are
+    left out, since they depend on the interpreter rather than on the policy. After an intended change, the golden
+    file is rewritten by running this test with UPDATE_GOLDEN_OP_COUNTS=1.
+    """
+
+    def test_op_counts_match_the_golden_file(self):
+        actual = compute_golden_op_counts()
+        if os.environ.get(UPDATE_VARIABLE) == "1":
+            os.makedirs(os.path.dirname(GOLDEN_PATH), exist_ok=True)
+            with open(GOLDEN_PATH, "w") as file:
+                json.dump(actual, file, indent=1, sort_keys=True)
+            self.skipTest(f"Rewrote {GOLDEN_PATH}.")
+        with open(GOLDEN_PATH) as file:
+            expected = json.load(file)
+        differences = diff_op_counts(expected, actual)
+        if differences:
+            self.fail(f"{len(differences)} op counts changed (expected -> actual):\n" + "\n".join(differences[:50]))
+
+    def test_diff_lists_the_changed_counts(self):
+        expected = {"Single/Uniform/10": {"Nth": {"IPFS Retrieve": 10, "IPNS Get": 10}}, "Gone/Uniform/10": {}}
+        actual = {"Single/Uniform/10": {"Nth": {"IPFS Retrieve": 12, "IPNS Get": 10}}}
+        self.assertListEqual(diff_op_counts(expected, actual), ["Gone/Uniform/10: missing",
+                                                                "Single/Uniform/10 Nth IPFS Retrieve: 10 -> 12"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from components.GrowthModels import GROWTH_LAWS, get_design_matrix, fit_growth_law, fit_growth_laws, predict_costs
+
+VOLUMES = np.array([10, 100, 1000, 10000])
+NUM_ITERATIONS = 200
+
+
+def get_summary(volumes: np.ndarray, costs: list[np.ndarray]) -> tuple[np.ndarray, ...]:
+    return (volumes, np.array([c.mean() for c in costs]), np.array([c.std(ddof=1) for c in costs]),
+            np.array([len(c) for c in costs]))
+
+
+class GrowthModelsTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+
+    def get_costs(self, law: str, coefficients: list[float]) -> list[np.ndarray]:
+        means = get_design_matrix(law, VOLUMES) @ coefficients
+        return [mean + self.rng.normal(0, 1, NUM_ITERATIONS) for mean in means]
+
+    def test_fit_matches_the_fit_of_the_iterations(self):
+        costs = self.get_costs("Logarithmic", [3, 2])
+        for law in GROWTH_LAWS:
+            fit = fit_growth_law(law, *get_summary(VOLUMES, costs))
+            design_matrix = get_design_matrix(law, np.repeat(VOLUMES, NUM_ITERATIONS))
+            coefficients, rss, *_ = np.linalg.lstsq(design_matrix, np.concatenate(costs), rcond=None)
+            np.testing.assert_allclose(fit.coefficients, coefficients)
+            self.assertEqual(fit.degrees_of_freedom, len(VOLUMES) * NUM_ITERATIONS - len(coefficients))
+
+    def test_best_fit_is_the_true_law(self):
+        for law, coefficients in [("Constant", [5]), ("Logarithmic", [3, 2]), ("Square Root", [0, 2]),
+                                  ("Linear", [1, 0.5]), ("Linearithmic", [1, 0.1])]:
+            fits = fit_growth_laws(*get_summary(VOLUMES, self.get_costs(law, coefficients)))
+            self.assertEqual(fits[0].law, law)
+
+    def test_confidence_intervals_contain_the_true_mean(self):
+        fit = fit_growth_law("Linear", *get_summary(VOLUMES, self.get_costs("Linear", [1, 0.5])))
+        means, lower, upper = fit.predict(np.array([10 ** 5, 10 ** 7]))
+        np.testing.assert_allclose(means, [50_001, 5_000_001], rtol=1e-3)
+        self.assertTrue(np.all(lower < upper))
+        self.assertTrue(np.all((lower <= [50_001, 5_000_001]) & ([50_001, 5_000_001] <= upper)))
+        # The intervals widen away from the measured volumes.
+        self.assertLess(upper[0] - lower[0], upper[1] - lower[1])
+
+    def test_exact_costs_prefer_the_simplest_law(self):
+        fits = fit_growth_laws(VOLUMES, np.ones(4), np.zeros(4), np.full(4, 10))
+        self.assertEqual(fits[0].law, "Constant")
+        np.testing.assert_allclose(fits[0].predict(np.array([10 ** 6]))[1:], [[1], [1]])
+
+    def test_predict_costs(self):
+        summary = pd.DataFrame({"Policy": ["Single"] * 4 + ["Sparse"], "Scale": [*VOLUMES, 10],
+                                "count": 10, "mean": [1, 2, 3, 4, 1], "std": 0.1})
+        predictions = predict_costs(summary, [10 ** 5, 10 ** 6])
+        # The second policy has a single volume, which only fits the constant law.
+        self.assertListEqual(predictions["Law"].tolist(), ["Logarithmic"] * 2 + ["Constant"] * 2)
+        np.testing.assert_allclose(predictions["Mean"], [5, 6, 1, 1])
+        self.assertTrue(predict_costs(summary, [10 ** 5], "Linear")["Policy"].eq("Single").all())
+
+
+if __name__ == '__main__':
+    unittest.main()
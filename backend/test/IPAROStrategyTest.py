@@ -158,6 +158,40 @@ class IPAROStrategyTest(unittest.TestCase):
         # Iterate over BFS values
         self.assertLessEqual(max(bfs_values.values()), 5)
 
+    def test_skew_binary_strategy_should_link_to_at_most_three_nodes(self):
+        """Skew Binary + Previous + First"""
+        lengths, cids, iparos = test_strategy_verbose(SkewBinaryStrategy())
+
+        self.assertLessEqual(max(lengths), 3)
+        for i in range(1, 100):
+            linked_seq_nums = {link.seq_num for link in iparos[i].linked_iparos}
+            self.assertIn(0, linked_seq_nums)
+            self.assertIn(i - 1, linked_seq_nums)
+
+    def test_skew_binary_strategy_should_jump_over_complete_trees(self):
+        """Skew Binary + Previous + First"""
+        jumps = [SkewBinaryStrategy.get_jump_seq_num(i) for i in range(1, 16)]
+
+        self.assertListEqual(jumps, [0, 1, 0, 3, 4, 3, 0, 7, 8, 7, 10, 11, 10, 7, 0])
+
+    def test_skew_binary_strategy_should_have_logarithmic_lookups(self):
+        """Skew Binary + Previous + First"""
+        test_strategy(SkewBinaryStrategy())
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        for i in range(100):
+            ipfs.reset_counts()
+            link = ipfs.retrieve_nth_iparo(i, latest_link)
+            self.assertEqual(link.seq_num, i)
+            self.assertLessEqual(ipfs.get_counts()["retrieve"], 3 * ceil(log2(100)))
+
+    def test_skew_binary_strategy_should_need_at_most_two_retrieves_to_link(self):
+        """Skew Binary + Previous + First"""
+        test_strategy(SkewBinaryStrategy())
+        first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+        ipfs.reset_counts()
+        SkewBinaryStrategy().get_candidate_nodes(latest_link, latest_iparo, first_link)
+        self.assertLessEqual(ipfs.get_counts()["retrieve"], 2)
+
     def test_temporal_uniform_strategy_should_split_into_roughly_equal_time_intervals(self):
         """T3.2.4.8 - Temporal Uniform N-prior + Previous + First"""
         # 0, 10, 11, ..., 44, 50
@@ -193,6 +227,59 @@ class IPAROStrategyTest(unittest.TestCase):
 
         self.assertListEqual(timestamps, expected_timestamps)
 
+    def test_temporal_calendar_strategy_should_get_bucket_starts(self):
+        """Temporal Calendar + Previous + First"""
+        to_timestamp = lambda *args: (datetime(*args, tzinfo=timezone.utc)
+                                      - TemporalCalendarStrategy.EPOCH) // timedelta(microseconds=1)
+        starts = TemporalCalendarStrategy(0.01).get_bucket_starts(to_timestamp(2024, 3, 15, 10, 30, 45, 123456))
+        expected_starts = [to_timestamp(2024, 1, 1), to_timestamp(2024, 3, 1), to_timestamp(2024, 3, 15),
+                           to_timestamp(2024, 3, 15, 10), to_timestamp(2024, 3, 15, 10, 30),
+                           to_timestamp(2024, 3, 15, 10, 30, 45), to_timestamp(2024, 3, 15, 10, 30, 45, 100000),
+                           to_timestamp(2024, 3, 15, 10, 30, 45, 120000)]
+
+        self.assertListEqual(starts, expected_starts)
+
+    def test_temporal_calendar_strategy_should_link_to_latest_node_before_each_bucket(self):
+        """Temporal Calendar + Previous + First"""
+        strategy = TemporalCalendarStrategy(1)
+        _, _, iparos = test_strategy_verbose(strategy)
+
+        for i in range(1, 100):
+            expected_seq_nums = {0, i - 1}
+            for start in strategy.get_bucket_starts(iparos[i].timestamp):
+                seq_nums_before = [j for j in range(i) if iparos[j].timestamp < start]
+                if seq_nums_before:
+                    expected_seq_nums.add(max(seq_nums_before))
+            linked_seq_nums = {link.seq_num for link in iparos[i].linked_iparos}
+            self.assertSetEqual(linked_seq_nums, expected_seq_nums)
+
+    def test_temporal_calendar_strategy_should_not_retrieve_to_link(self):
+        """Temporal Calendar + Previous + First"""
+        test_strategy(TemporalCalendarStrategy())
+        first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+        ipfs.reset_counts()
+        TemporalCalendarStrategy().get_candidate_nodes(latest_link, latest_iparo, first_link)
+        self.assertEqual(ipfs.get_counts()["retrieve"], 0)
+
+    def test_temporal_calendar_strategy_should_find_the_same_node_by_time_with_fewer_retrieves(self):
+        """Temporal Calendar + Previous + First"""
+        strategy = TemporalCalendarStrategy(1)
+        _, _, iparos = test_strategy_verbose(strategy)
+        offsets = [-TimeUnit.SECONDS, 0, 1, TimeUnit.SECONDS // 2, TimeUnit.SECONDS - 1]
+        timestamps = [iparos[i].timestamp + offset for i in range(0, 100, 7) for offset in offsets]
+        timestamps.append(iparos[-1].timestamp + TimeUnit.SECONDS)
+
+        for mode in Mode:
+            ipfs.reset_counts()
+            expected_seq_nums = [ipfs.retrieve_iparo_by_url_and_timestamp(URL, timestamp, mode).seq_num
+                                 for timestamp in timestamps]
+            greedy_retrieves = ipfs.get_counts()["retrieve"]
+            ipfs.reset_counts()
+            seq_nums = [strategy.retrieve_iparo_by_url_and_timestamp(URL, timestamp, mode).seq_num
+                        for timestamp in timestamps]
+            self.assertListEqual(seq_nums, expected_seq_nums)
+            self.assertLess(ipfs.get_counts()["retrieve"], greedy_retrieves)
+
 
 if __name__ == '__main__':
     unittest.main()
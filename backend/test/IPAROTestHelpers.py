@@ -1,4 +1,8 @@
 from simulation import IPARO
+from simulation.IPAROIndexBuilder import IPAROIndexBuilder
+from simulation.LinkDeltaEncoder import LinkDeltaEncoder
+from simulation.Observer import Observer
+from simulation.VersionTreeBuilder import VersionTreeBuilder
 from test.IPAROTestConstants import *
 from simulation.IPFS import *
 from simulation.LinkingStrategy import *
@@ -26,6 +30,97 @@ def add_nodes(num_nodes: int):
     return iparos
 
 
+def add_indexed_nodes(num_nodes: int, interval: int):
+    """
+    Adds nodes linked to the previous node only, with an index object every ``interval`` nodes.
+    The nodes are 10 seconds apart.
+    """
+    index_builder = IPAROIndexBuilder(URL, interval)
+    for i in range(num_nodes):
+        try:
+            first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+            linked_iparos = SingleStrategy().get_candidate_nodes(latest_link, latest_iparo, first_link)
+        except IPARONotFoundException:
+            linked_iparos = set()
+        timestamp = time1 + 10 * i * TimeUnit.SECONDS
+        iparo = IPARO(content=generate_random_content_string(), timestamp=timestamp, url=URL,
+                      linked_iparos=linked_iparos, seq_num=i, index=index_builder.get_latest_index_link())
+        cid, _ = ipfs.store(iparo)
+        ipns.update(URL, cid)
+        index_builder.add(IPAROLink(seq_num=i, timestamp=timestamp, cid=cid))
+
+
+def add_nodes_with_version_tree(num_nodes: int, fanout: int) -> list[IPAROLink]:
+    """
+    Adds nodes linked to the previous node only, where the IPNS points at the root of a version tree
+    with the given fanout. The nodes are 10 seconds apart.
+    """
+    tree_builder = VersionTreeBuilder(URL, fanout)
+    links = []
+    for i in range(num_nodes):
+        try:
+            first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+            linked_iparos = SingleStrategy().get_candidate_nodes(latest_link, latest_iparo, first_link)
+        except IPARONotFoundException:
+            linked_iparos = set()
+        timestamp = time1 + 10 * i * TimeUnit.SECONDS
+        iparo = IPARO(content=generate_random_content_string(), timestamp=timestamp, url=URL,
+                      linked_iparos=linked_iparos, seq_num=i)
+        cid, _ = ipfs.store(iparo)
+        links.append(IPAROLink(seq_num=i, timestamp=timestamp, cid=cid))
+        root_cid, _ = tree_builder.append(links[-1])
+        ipns.update(URL, root_cid)
+    return links
+
+
+def add_delta_encoded_nodes(strategy: LinkingStrategy, num_nodes: int) -> list[set[IPAROLink]]:
+    """
+    Adds nodes linked by the given strategy, whose links are delta encoded. The nodes are 10 seconds apart.
+
+    :returns: All the links of each node.
+    """
+    delta_encoder = LinkDeltaEncoder()
+    all_links = []
+    for i in range(num_nodes):
+        try:
+            first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
+            linked_iparos = strategy.get_candidate_nodes(latest_link, latest_iparo, first_link)
+        except IPARONotFoundException:
+            linked_iparos = set()
+        timestamp = time1 + 10 * i * TimeUnit.SECONDS
+        iparo = IPARO(content=generate_random_content_string(), timestamp=timestamp, url=URL,
+                      linked_iparos=linked_iparos, seq_num=i)
+        cid, _ = ipfs.store(delta_encoder.encode(iparo))
+        ipns.update(URL, cid)
+        delta_encoder.add(IPAROLink(seq_num=i, timestamp=timestamp, cid=cid))
+        all_links.append(linked_iparos)
+    return all_links
+
+
+class RecordingObserver(Observer):
+    """
+    Records every event that it is notified of, in order.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def on_store(self, cid, seq_num, size):
+        self.events.append(("store", cid, seq_num, size))
+
+    def on_retrieve(self, cid, seq_num, size):
+        self.events.append(("retrieve", cid, seq_num, size))
+
+    def on_not_found(self, key):
+        self.events.append(("not found", key))
+
+    def on_update(self, url, cid, timestamp):
+        self.events.append(("update", url, cid, timestamp))
+
+    def on_get(self, url, cid):
+        self.events.append(("get", url, cid))
+
+
 def generate_random_content_string() -> bytes:
     # Contains all printable characters in the original ASCII format, which are represented by codes from 32 to 126.
     contents = bytes([random.randint(32, 126) for _ in range(100)])
@@ -56,12 +151,12 @@ def test_strategy_verbose(strategy: LinkingStrategy) -> tuple[list[int], list[st
     iparos = []
     for i in range(100):
         content = generate_random_content_string()
+        timestamp = time1 + i * TimeUnit.SECONDS
         try:
             first_link, latest_link, latest_iparo = ipfs.get_links_to_first_and_latest_nodes(URL)
-            linked_iparos = strategy.get_candidate_nodes(latest_link, latest_iparo, first_link)
+            linked_iparos = strategy.get_candidate_nodes(latest_link, latest_iparo, first_link, timestamp)
         except IPARONotFoundException:
             linked_iparos = set()
-        timestamp = time1 + i * TimeUnit.SECONDS
         iparo = IPARO(content=content, timestamp=timestamp, url=URL, linked_iparos=linked_iparos, seq_num=i)
         cid, _ = ipfs.store(iparo)
         ipns.update(URL, cid)
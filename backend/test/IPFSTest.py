@@ -1,13 +1,22 @@
+import os
+import pickle
+import tempfile
 import unittest
+from itertools import islice
 
 from test.IPAROTestConstants import *
-from test.IPAROTestHelpers import add_nodes, test_strategy, test_closest_iparo, generate_random_content_string
+from test.IPAROTestHelpers import add_nodes, add_indexed_nodes, add_nodes_with_version_tree, test_strategy, \
+    test_closest_iparo, generate_random_content_string, add_delta_encoded_nodes, RecordingObserver
 from simulation.IPAROException import IPARONotFoundException
+from simulation.IPAROLink import IPAROLink
 from simulation.IPAROLinkFactory import IPAROLinkFactory
 from simulation.IPFS import ipfs, Mode
 from simulation.IPNS import ipns
-from simulation.LinkingStrategy import SingleStrategy
+from simulation.LinkingStrategy import SingleStrategy, ComprehensiveStrategy, SequentialSMaxGapStrategy
 from simulation.TimeUnit import TimeUnit
+from simulation.TraceAnalysis import read_trace, get_hop_histogram, estimate_cache_hit_rate
+from simulation.TraceRecorder import TraceRecorder, OPERATION_IDS, NOT_FOUND
+from simulation.VersionTreeBuilder import VersionTreeBuilder
 
 timestamp = int(1000000 * time.time())
 
@@ -181,6 +190,320 @@ class IPFSTest(unittest.TestCase):
         iparo = ipfs.retrieve(link.cid)
         self.assertEqual(iparo, iparos[5])
 
+    def test_ipfs_should_retrieve_all_iparos_in_time_range(self):
+        iparos = add_nodes(100)
+        links = ipfs.retrieve_iparos_in_range(URL, time1 + 200 * TimeUnit.SECONDS, time1 + 255 * TimeUnit.SECONDS)
+        self.assertListEqual([link.seq_num for link in links], [25, 24, 23, 22, 21, 20])
+        self.assertEqual(ipfs.retrieve(links[0].cid), iparos[25])
+
+    def test_ipfs_should_retrieve_no_iparos_in_time_range_before_first_node(self):
+        add_nodes(10)
+        links = ipfs.retrieve_iparos_in_range(URL, time1 - 20 * TimeUnit.SECONDS, time1 - TimeUnit.SECONDS)
+        self.assertListEqual(links, [])
+
+    def test_ipfs_should_retrieve_latest_iparos_in_time_range_after_latest_node(self):
+        add_nodes(10)
+        links = ipfs.retrieve_iparos_in_range(URL, time1 + 75 * TimeUnit.SECONDS, time1 + 1000 * TimeUnit.SECONDS)
+        self.assertListEqual([link.seq_num for link in links], [9, 8])
+
+    def test_ipfs_range_retrieval_should_stop_at_start_of_window(self):
+        add_nodes(100)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        ipfs.reset_counts()
+        ipfs.retrieve_links_in_range(latest_link, time1 + 980 * TimeUnit.SECONDS, time1 + 990 * TimeUnit.SECONDS)
+        # Only nodes 99 and 98 need to be retrieved to find their previous nodes.
+        self.assertEqual(ipfs.get_counts()["retrieve"], 2)
+
+    def test_ipfs_should_iterate_links_from_latest_to_earliest(self):
+        add_nodes(10)
+        seq_nums = [link.seq_num for link in ipfs.iter_links(URL)]
+        self.assertListEqual(seq_nums, list(reversed(range(10))))
+
+    def test_ipfs_should_only_retrieve_links_that_are_read(self):
+        add_nodes(100)
+        ipfs.reset_counts()
+        links = list(islice(ipfs.iter_links(URL), 3))
+        self.assertListEqual([link.seq_num for link in links], [99, 98, 97])
+        # The latest node (which links to node 98), then node 98 to find node 97.
+        self.assertEqual(ipfs.get_counts()["retrieve"], 2)
+
+    def test_ipfs_should_iterate_iparos_from_latest_to_earliest(self):
+        iparos = add_nodes(10)
+        observed = [iparo for _, iparo in ipfs.iter_iparos(URL)]
+        self.assertListEqual(observed, list(reversed(iparos)))
+
+    def test_ipfs_should_only_retrieve_iparos_that_are_read(self):
+        add_nodes(100)
+        ipfs.reset_counts()
+        pairs = list(islice(ipfs.iter_iparos(URL), 5))
+        self.assertListEqual([link.seq_num for link, _ in pairs], [99, 98, 97, 96, 95])
+        self.assertEqual(ipfs.get_counts()["retrieve"], 5)
+
+    def test_ipfs_iteration_should_raise_error_if_no_iparo_is_inserted_into_ipfs(self):
+        self.assertRaises(IPARONotFoundException, lambda: next(ipfs.iter_links(URL)))
+        self.assertRaises(IPARONotFoundException, lambda: next(ipfs.iter_iparos(URL)))
+
+    def test_index_objects_are_stored_every_k_versions(self):
+        add_indexed_nodes(100, 10)
+        self.assertEqual(ipfs.get_counts()["store"], 110)
+
+    def test_retrieve_nth_iparo_goes_through_at_most_two_index_objects(self):
+        add_indexed_nodes(100, 10)
+        latest_link, latest_iparo = ipfs.get_link_to_latest_node(URL)
+        # The latest 10 versions are not covered by an index object yet.
+        for i in range(90):
+            ipfs.reset_counts()
+            link = ipfs.retrieve_nth_iparo(i, latest_link, latest_iparo)
+            self.assertEqual(link.seq_num, i)
+            self.assertEqual(link.timestamp, time1 + 10 * i * TimeUnit.SECONDS)
+            self.assertLessEqual(ipfs.get_counts()["retrieve"], 2)
+
+    def test_retrieve_nth_iparo_follows_links_after_the_latest_index_object(self):
+        add_indexed_nodes(100, 10)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        ipfs.reset_counts()
+        link = ipfs.retrieve_nth_iparo(90, latest_link)
+        self.assertEqual(link.seq_num, 90)
+        self.assertEqual(ipfs.get_counts()["retrieve"], 9)
+
+    def test_retrieve_closest_iparo_goes_through_index_objects(self):
+        add_indexed_nodes(100, 10)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        for i in range(99):
+            # 3 seconds after the i-th version, which is 10 seconds before the next version.
+            timestamp = time1 + (10 * i + 3) * TimeUnit.SECONDS
+            for mode, expected_seq_num in [(Mode.CLOSEST, i), (Mode.LATEST_BEFORE, i), (Mode.EARLIEST_AFTER, i + 1)]:
+                ipfs.reset_counts()
+                link, _ = ipfs.retrieve_closest_iparo(latest_link, {latest_link}, timestamp, mode)
+                self.assertEqual(link.seq_num, expected_seq_num)
+                if i < 89:
+                    self.assertLessEqual(ipfs.get_counts()["retrieve"], 4)
+
+    def test_version_tree_resolves_the_latest_node(self):
+        links = add_nodes_with_version_tree(100, 4)
+        latest_link, latest_iparo = ipfs.get_link_to_latest_node(URL)
+        self.assertEqual(latest_link, links[-1])
+        self.assertEqual(latest_iparo.seq_num, 99)
+        self.assertSetEqual(ipfs.get_all_links(URL), set(links))
+
+    def test_version_tree_append_rewrites_a_logarithmic_number_of_nodes(self):
+        tree_builder = VersionTreeBuilder(URL, 4)
+        for i in range(100):
+            ipfs.reset_counts()
+            tree_builder.append(IPAROLink(seq_num=i, timestamp=timestamp + i, cid=str(i)))
+            counts = ipfs.get_counts()
+            self.assertEqual(counts["retrieve"], 0)
+            # At most one node per level (four levels for 100 versions), plus one per split and a new root.
+            self.assertLessEqual(counts["store"], 2 * 4 + 1)
+
+    def test_version_tree_lookup_by_number_descends_the_tree(self):
+        links = add_nodes_with_version_tree(100, 4)
+        for i in range(100):
+            ipfs.reset_counts()
+            self.assertEqual(ipfs.retrieve_iparo_by_url_and_number(URL, i), links[i])
+            # The root and one node per level below it.
+            self.assertLessEqual(ipfs.get_counts()["retrieve"], 4)
+
+    def test_version_tree_lookup_by_timestamp_descends_the_tree(self):
+        links = add_nodes_with_version_tree(100, 4)
+        for i in range(99):
+            # 3 seconds after the i-th version, which is 10 seconds before the next version.
+            ts = time1 + (10 * i + 3) * TimeUnit.SECONDS
+            for mode, expected_seq_num in [(Mode.CLOSEST, i), (Mode.LATEST_BEFORE, i), (Mode.EARLIEST_AFTER, i + 1)]:
+                ipfs.reset_counts()
+                self.assertEqual(ipfs.retrieve_iparo_by_url_and_timestamp(URL, ts, mode), links[expected_seq_num])
+                self.assertLessEqual(ipfs.get_counts()["retrieve"], 8)
+
+    def test_version_tree_range_only_visits_overlapping_nodes(self):
+        links = add_nodes_with_version_tree(100, 4)
+        start, end = links[37].timestamp, links[62].timestamp
+        ipfs.reset_counts()
+        self.assertListEqual(ipfs.retrieve_iparos_in_range(URL, start, end), list(reversed(links[37:63])))
+        self.assertLess(ipfs.get_counts()["retrieve"], 26)
+
+    def test_ipfs_counts_the_bytes_stored_and_retrieved(self):
+        add_nodes(10)
+        bytes_stored = sum(len(iparo_bytes) for iparo_bytes in ipfs.data.values())
+        self.assertEqual(ipfs.get_counts()["bytes_stored"], bytes_stored)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        ipfs.reset_counts()
+        ipfs.retrieve(latest_link.cid)
+        self.assertEqual(ipfs.get_counts()["bytes_retrieved"], len(ipfs.data[latest_link.cid]))
+        ipfs.reset_counts()
+        self.assertEqual(ipfs.get_counts()["bytes_stored"], 0)
+        self.assertEqual(ipfs.get_counts()["bytes_retrieved"], 0)
+
+    def test_forward_iteration_without_an_index_walks_back_once(self):
+        add_nodes(100)
+        ipfs.reset_counts()
+        links = list(islice(ipfs.iter_links_forward(URL, 40), 10))
+        self.assertListEqual([link.seq_num for link in links], list(range(40, 50)))
+        # The latest node, then one node per version back to version 40.
+        self.assertEqual(ipfs.get_counts()["retrieve"], 60)
+
+    def test_forward_iteration_reads_the_index_objects(self):
+        add_indexed_nodes(100, 10)
+        ipfs.reset_counts()
+        links = list(islice(ipfs.iter_links_forward(URL, 35), 20))
+        self.assertListEqual([link.seq_num for link in links], list(range(35, 55)))
+        # The latest node, the latest index object, and the three index objects covering versions 30 to 59.
+        self.assertEqual(ipfs.get_counts()["retrieve"], 5)
+
+    def test_forward_iteration_continues_after_the_latest_index_object(self):
+        add_indexed_nodes(100, 10)
+        seq_nums = [link.seq_num for link in ipfs.iter_links_forward(URL, 0)]
+        self.assertListEqual(seq_nums, list(range(100)))
+
+    def test_forward_iteration_reads_the_version_tree(self):
+        links = add_nodes_with_version_tree(100, 4)
+        self.assertListEqual(list(ipfs.iter_links_forward(URL)), links)
+        ipfs.reset_counts()
+        self.assertListEqual(list(islice(ipfs.iter_links_forward(URL, 50), 8)), links[50:58])
+        # The root, one node per level down to the first leaf, and the next leaf.
+        self.assertLessEqual(ipfs.get_counts()["retrieve"], 6)
+
+    def test_delta_encoded_links_resolve_to_all_links(self):
+        all_links = add_delta_encoded_nodes(ComprehensiveStrategy(), 100)
+        for link in ipfs.iter_links(URL):
+            self.assertSetEqual(ipfs.retrieve(link.cid).linked_iparos, all_links[link.seq_num])
+
+    def test_delta_encoding_stores_fewer_links(self):
+        add_delta_encoded_nodes(ComprehensiveStrategy(), 100)
+        stored_links = 0
+        for iparo_bytes in ipfs.data.values():
+            iparo = pickle.loads(iparo_bytes)
+            stored_links += len(iparo.linked_iparos) + len(iparo.removed_links)
+        # Instead of 0 + 1 + ... + 99 links.
+        self.assertLess(stored_links, 4950 // 10)
+
+    def test_delta_encoded_links_resolve_through_at_most_log_n_ancestors(self):
+        add_delta_encoded_nodes(SequentialSMaxGapStrategy(2), 128)
+        for link in ipfs.get_all_links(URL):
+            ipfs.reset_counts()
+            ipfs.retrieve(link.cid)
+            self.assertLessEqual(ipfs.get_counts()["retrieve"], 1 + 7)
+
+    def test_delta_encoding_keeps_links_that_do_not_overlap(self):
+        add_delta_encoded_nodes(SingleStrategy(), 10)
+        for iparo_bytes in ipfs.data.values():
+            self.assertIsNone(pickle.loads(iparo_bytes).link_delta_base)
+
+    def test_delta_encoded_links_cannot_be_resolved_without_their_ancestor(self):
+        add_delta_encoded_nodes(ComprehensiveStrategy(), 4)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        stored_iparo = pickle.loads(ipfs.data[latest_link.cid])
+        del ipfs.data[stored_iparo.link_delta_base.cid]
+        # Clears the cache of resolved links.
+        ipfs.reset_counts()
+        self.assertRaises(IPARONotFoundException, lambda: ipfs.retrieve(latest_link.cid))
+
+    def test_observers_are_notified_of_stores_and_retrieves(self):
+        observer = RecordingObserver()
+        ipfs.add_observer(observer)
+        try:
+            cid, iparo_bytes = ipfs.store(iparo1)
+            ipfs.retrieve(cid)
+            self.assertRaises(IPARONotFoundException, lambda: ipfs.retrieve(CID1))
+        finally:
+            ipfs.remove_observer(observer)
+        self.assertListEqual(observer.events, [("store", cid, iparo1.seq_num, len(iparo_bytes)),
+                                               ("retrieve", cid, iparo1.seq_num, len(iparo_bytes)),
+                                               ("not found", CID1)])
+
+    def test_observers_are_notified_of_the_retrieves_that_resolve_links(self):
+        add_delta_encoded_nodes(ComprehensiveStrategy(), 4)
+        latest_link, _ = ipfs.get_link_to_latest_node(URL)
+        ipfs.reset_counts()
+        observer = RecordingObserver()
+        ipfs.add_observer(observer)
+        try:
+            ipfs.retrieve(latest_link.cid)
+        finally:
+            ipfs.remove_observer(observer)
+        self.assertEqual(len(observer.events), ipfs.get_counts()["retrieve"])
+        self.assertEqual(sum(event[3] for event in observer.events), ipfs.get_counts()["bytes_retrieved"])
+
+    def test_removed_observers_are_not_notified(self):
+        observer = RecordingObserver()
+        ipfs.add_observer(observer)
+        ipfs.remove_observer(observer)
+        ipfs.store(iparo1)
+        self.assertListEqual(observer.events, [])
+
+    def test_trace_recorder_records_the_sequence_numbers_of_each_traversal(self):
+        add_nodes(10)
+        retrieve_counts = []
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.trace")
+            recorder = TraceRecorder(path)
+            ipfs.add_observer(recorder)
+            try:
+                for number in [3, 8]:
+                    ipfs.reset_counts()
+                    recorder.begin_traversal()
+                    ipfs.retrieve_iparo_by_url_and_number(URL, number)
+                    recorder.end_traversal(OPERATION_IDS["Nth"], number)
+                    retrieve_counts.append(ipfs.get_counts()["retrieve"])
+                recorder.begin_traversal()
+                self.assertRaises(IPARONotFoundException, lambda: ipfs.retrieve(CID1))
+                recorder.end_traversal(OPERATION_IDS["Latest"], -1)
+            finally:
+                ipfs.remove_observer(recorder)
+                recorder.close()
+            traversals = read_trace(path)
+        self.assertEqual(len(traversals), 3)
+        self.assertListEqual([traversal.target for traversal in traversals], [3, 8, -1])
+        self.assertListEqual([len(traversal.hops) for traversal in traversals[:2]], retrieve_counts)
+        # The Nth version is reached by walking back from the latest version.
+        self.assertEqual(traversals[0].hops[0], 9)
+        self.assertTrue(all(number in range(4, 10) for number in traversals[0].hops))
+        self.assertListEqual(traversals[2].hops.tolist(), [NOT_FOUND])
+        self.assertDictEqual(get_hop_histogram(traversals)["Nth"].to_dict(),
+                             {1: 0, retrieve_counts[1]: 1, retrieve_counts[0]: 1})
+        # The second traversal only retrieves versions retrieved by the first.
+        self.assertAlmostEqual(estimate_cache_hit_rate(traversals, 10),
+                               (retrieve_counts[0] - 6 + retrieve_counts[1]) / sum(retrieve_counts))
+
+    def test_trace_recorder_grows_the_trace_file(self):
+        add_nodes(100)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.trace")
+            recorder = TraceRecorder(path, capacity=16)
+            ipfs.add_observer(recorder)
+            try:
+                ipfs.reset_counts()
+                recorder.begin_traversal()
+                ipfs.get_all_links(URL)
+                recorder.end_traversal(OPERATION_IDS["List"], -1)
+            finally:
+                ipfs.remove_observer(recorder)
+                recorder.close()
+            traversals = read_trace(path)
+        self.assertEqual(len(traversals[0].hops), ipfs.get_counts()["retrieve"])
+        self.assertSetEqual(set(traversals[0].hops.tolist()), set(range(1, 100)))
+
+    def test_trace_recorder_leaves_out_an_aborted_traversal(self):
+        add_nodes(10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.trace")
+            recorder = TraceRecorder(path)
+            ipfs.add_observer(recorder)
+            try:
+                recorder.begin_traversal()
+                ipfs.retrieve_iparo_by_url_and_number(URL, 3)
+                recorder.end_traversal(OPERATION_IDS["Nth"], 3)
+                with self.assertRaises(IPARONotFoundException):
+                    recorder.begin_traversal()
+                    ipfs.retrieve_iparo_by_url_and_number(URL, 5)
+                    ipfs.retrieve(CID1)
+            finally:
+                ipfs.remove_observer(recorder)
+                recorder.close()
+            traversals = read_trace(path)
+        self.assertEqual(len(traversals), 1)
+        self.assertEqual(traversals[0].target, 3)
+        self.assertTrue(all(number in range(3, 10) for number in traversals[0].hops))
+
 
 class IPAROLinkFactoryTest(unittest.TestCase):
 
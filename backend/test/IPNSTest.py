@@ -3,6 +3,7 @@ import unittest
 from test.IPAROTestConstants import *
 from simulation.IPAROException import IPARONotFoundException
 from simulation.IPNS import ipns
+from test.IPAROTestHelpers import RecordingObserver
 
 
 class IPNSTest(unittest.TestCase):
@@ -55,6 +56,54 @@ class IPNSTest(unittest.TestCase):
         self.assertEqual(cid2, CID1)
         self.assertEqual(ipns.get_count, 2)
 
+    def test_can_retrieve_cid_by_exact_timestamp(self):
+        ipns.update(URL, CID1, 100)
+        ipns.update(URL, CID2, 200)
+        self.assertEqual(ipns.get_cid(URL, 200), CID2)
+        self.assertRaises(IPARONotFoundException, lambda: ipns.get_cid(URL, 150))
+
+    def test_can_retrieve_floor_ceiling_and_nearest_cids(self):
+        ipns.update(URL, CID1, 100)
+        ipns.update(URL, CID2, 200)
+        ipns.reset_counts()
+        self.assertEqual(ipns.get_floor_cid(URL, 199), CID1)
+        self.assertEqual(ipns.get_ceiling_cid(URL, 101), CID2)
+        self.assertEqual(ipns.get_nearest_cid(URL, 149), CID1)
+        self.assertEqual(ipns.get_nearest_cid(URL, 151), CID2)
+        self.assertEqual(ipns.get_nearest_cid(URL, 1000), CID2)
+        self.assertEqual(ipns.get_count, 5)
+
+    def test_floor_and_ceiling_raise_outside_of_the_versions(self):
+        ipns.update(URL, CID1, 100)
+        self.assertRaises(IPARONotFoundException, lambda: ipns.get_floor_cid(URL, 99))
+        self.assertRaises(IPARONotFoundException, lambda: ipns.get_ceiling_cid(URL, 101))
+
+    def test_can_retrieve_nth_cid_in_order_of_time(self):
+        ipns.update(URL, CID2, 200)
+        ipns.update(URL, CID1, 100)
+        self.assertEqual(ipns.get_nth_cid(URL, 0), CID1)
+        self.assertEqual(ipns.get_nth_cid(URL, 1), CID2)
+        self.assertRaises(IPARONotFoundException, lambda: ipns.get_nth_cid(URL, 2))
+
+    def test_reset_data_clears_the_versions(self):
+        ipns.update(URL, CID1, 100)
+        ipns.reset_data()
+        self.assertRaises(IPARONotFoundException, lambda: ipns.get_nearest_cid(URL, 100))
+
+    def test_observers_are_notified_of_updates_and_gets(self):
+        observer = RecordingObserver()
+        ipns.add_observer(observer)
+        try:
+            ipns.update(URL, CID1, 100)
+            ipns.get_latest_cid(URL)
+            ipns.get_floor_cid(URL, 150)
+            self.assertRaises(IPARONotFoundException, lambda: ipns.get_ceiling_cid(URL, 150))
+            self.assertRaises(IPARONotFoundException, lambda: ipns.get_latest_cid(URL1))
+        finally:
+            ipns.remove_observer(observer)
+        self.assertListEqual(observer.events, [("update", URL, CID1, 100), ("get", URL, CID1), ("get", URL, CID1),
+                                               ("not found", 150), ("not found", URL1)])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import time
+import unittest
+
+from simulation.JobExecutor import JobTable, JobExecutor, JobStatus, JOB_TABLE_NAME
+
+# The longest time to wait for a job, in seconds, which includes spawning its process.
+TIMEOUT = 60
+
+
+class JobExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.table = JobTable(os.path.join(self.directory.name, JOB_TABLE_NAME))
+        self.executor = None
+
+    def tearDown(self):
+        if self.executor:
+            self.executor.shutdown()
+        self.directory.cleanup()
+
+    def wait_for(self, job_id: int, statuses: set[JobStatus]) -> JobStatus:
+        deadline = time.monotonic() + TIMEOUT
+        while time.monotonic() < deadline:
+            status = self.table.get_job(job_id).status
+            if status in statuses:
+                return status
+            time.sleep(0.1)
+        self.fail(f"Job {job_id} is still {status}.")
+
+    def get_args(self, volume: int) -> list[str]:
+        return ["-p", "2", "-V", str(volume), "-k", "Uniform", "-n", "2", "-O", "nth", "latest",
+                "-o", os.path.join(self.directory.name, "Previous", "2")]
+
+    def test_status_is_only_set_from_the_expected_statuses(self):
+        job_id = self.table.add("Job", ["-s", "-V", "10"])
+        self.assertFalse(self.table.set_status(job_id, JobStatus.DONE, expected={JobStatus.RUNNING}))
+        self.assertTrue(self.table.set_status(job_id, JobStatus.RUNNING, expected={JobStatus.QUEUED}))
+        job = self.table.get_job(job_id)
+        self.assertEqual(job.status, JobStatus.RUNNING)
+        self.assertListEqual(job.args, ["-s", "-V", "10"])
+        self.assertIsNotNone(job.started)
+        self.table.interrupt_running_jobs()
+        self.assertEqual(self.table.get_job(job_id).status, JobStatus.INTERRUPTED)
+        self.table.remove_finished_jobs()
+        self.assertListEqual(self.table.get_jobs(), [])
+
+    def test_jobs_run_in_the_background(self):
+        self.executor = JobExecutor(self.table, max_workers=2)
+        job_id = self.executor.submit("Previous", self.get_args(20))
+        failed_job_id = self.executor.submit("Invalid", ["-V", "-1"])
+        self.assertEqual(self.wait_for(job_id, {JobStatus.DONE, JobStatus.FAILED}), JobStatus.DONE)
+        self.assertEqual(self.table.get_job(job_id).progress, 1.0)
+        self.assertSetEqual(set(os.listdir(os.path.join(self.directory.name, "Previous", "2"))),
+                            {"20-Uniform-Store.npz", "20-Uniform-Nth.npz", "20-Uniform-Latest.npz"})
+        self.assertEqual(self.wait_for(failed_job_id, {JobStatus.DONE, JobStatus.FAILED}), JobStatus.FAILED)
+
+    def test_cancel_jobs(self):
+        self.executor = JobExecutor(self.table, max_workers=1)
+        running_job_id = self.executor.submit("Running", self.get_args(1_000_000))
+        queued_job_id = self.executor.submit("Queued", self.get_args(10))
+        self.wait_for(running_job_id, {JobStatus.RUNNING})
+        self.assertTrue(self.executor.cancel(queued_job_id))
+        self.assertTrue(self.executor.cancel(running_job_id))
+        self.assertFalse(self.executor.cancel(running_job_id))
+        self.assertEqual(self.table.get_job(running_job_id).status, JobStatus.CANCELLED)
+        self.assertEqual(self.table.get_job(queued_job_id).status, JobStatus.CANCELLED)
+        self.assertTrue(self.executor.retry(queued_job_id))
+        self.assertEqual(self.wait_for(queued_job_id, {JobStatus.DONE, JobStatus.FAILED}), JobStatus.DONE)
+
+
+if __name__ == '__main__':
+    unittest.main()
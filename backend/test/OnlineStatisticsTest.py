@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from simulation.OnlineStatistics import OnlineStatistics, DDSketch, RELATIVE_ACCURACY, STATISTICS
+
+COLUMNS = ["IPFS Retrieve", "Latency (ns)"]
+
+
+def get_rows(num_rows: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return np.column_stack((rng.integers(0, 50, num_rows), rng.lognormal(10, 1, num_rows)))
+
+
+def get_statistics(rows: np.ndarray) -> OnlineStatistics:
+    statistics = OnlineStatistics(COLUMNS)
+    for row in rows:
+        statistics.add(row)
+    return statistics
+
+
+class OnlineStatisticsTest(unittest.TestCase):
+
+    def assert_summaries_equal(self, summary: pd.DataFrame, expected: pd.DataFrame):
+        self.assertListEqual(summary.index.tolist(), STATISTICS)
+        exact = ["count", "mean", "std", "min", "max"]
+        np.testing.assert_allclose(summary.loc[exact], expected.loc[exact], rtol=1e-9)
+        quartiles = ["25%", "50%", "75%"]
+        # The quartiles of DataFrame.describe interpolate between two values, which the sketch does not.
+        np.testing.assert_allclose(summary.loc[quartiles], expected.loc[quartiles], rtol=2 * RELATIVE_ACCURACY,
+                                   atol=1)
+
+    def test_describe_matches_dataframe_describe(self):
+        rows = get_rows(1000)
+        self.assert_summaries_equal(get_statistics(rows).describe(), pd.DataFrame(rows, columns=COLUMNS).describe())
+
+    def test_merging_matches_adding_every_row(self):
+        rows = get_rows(500)
+        statistics = get_statistics(rows[:200])
+        statistics.merge(get_statistics(rows[200:]))
+        expected = get_statistics(rows)
+        self.assertEqual(statistics.count, 500)
+        pd.testing.assert_frame_equal(statistics.describe(), expected.describe())
+
+    def test_round_trip_through_arrays(self):
+        statistics = get_statistics(get_rows(100))
+        read_statistics = OnlineStatistics.from_arrays(statistics.to_arrays())
+        pd.testing.assert_frame_equal(read_statistics.describe(), statistics.describe())
+
+    def test_describe_without_rows(self):
+        summary = OnlineStatistics(COLUMNS).describe()
+        self.assertListEqual(summary.columns.tolist(), COLUMNS)
+        self.assertListEqual(summary.loc["count"].tolist(), [0, 0])
+        self.assertTrue(summary.drop("count").isna().all().all())
+
+    def test_sketch_of_negative_and_zero_values(self):
+        sketch = DDSketch()
+        for value in [-100, -10, 0, 0, 10, 100, 1000]:
+            sketch.add(value)
+        self.assertAlmostEqual(sketch.get_quantile(0), -100, delta=100 * RELATIVE_ACCURACY)
+        self.assertEqual(sketch.get_quantile(0.5), 0)
+        self.assertAlmostEqual(sketch.get_quantile(1), 1000, delta=1000 * RELATIVE_ACCURACY)
+        read_sketch = DDSketch.from_arrays(sketch.to_arrays())
+        self.assertEqual(read_sketch.count, 7)
+        self.assertEqual(read_sketch.get_quantile(0.25), sketch.get_quantile(0.25))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from simulation.IPARO import IPARO
+from simulation.IPAROSimulationEnvironment import IPAROSimulationEnvironment
+from simulation.IPFS import ipfs
+from simulation.IPNS import ipns
+from simulation.IterationProfiler import IterationProfiler
+from simulation.LinkingStrategy import SingleStrategy, KRandomStrategy
+from simulation.Operation import StoreOperation, IteratedStoreOperation, LatestOperation, GetNthOperation, \
+    UnsafeListAllOperation, reset, URL
+from simulation.VersionTreeNode import VersionTreeNode
+from simulation.VersionDensity import UniformVersionDensity
+
+VOLUME = 200
+PROFILE_COLUMNS = ["Latency (ns)", "Policy Latency (ns)", "Peak Memory (Bytes)"]
+
+
+def get_profile_columns(opcounts) -> list[str]:
+    return [column for column in opcounts.columns if column in PROFILE_COLUMNS]
+
+
+class OperationTest(unittest.TestCase):
+
+    def setUp(self):
+        random.seed(0)
+        np.random.seed(0)
+
+    def tearDown(self):
+        reset(reset_data=True)
+
+    def get_env(self, policy=None, **kwargs) -> IPAROSimulationEnvironment:
+        env = IPAROSimulationEnvironment(policy or SingleStrategy(), VOLUME, UniformVersionDensity(), [], **kwargs)
+        StoreOperation(env, save_to_file=False).execute()
+        return env
+
+    def test_fixed_iterations_by_default(self):
+        op = GetNthOperation(self.get_env(iterations=7), save_to_file=False)
+        op.execute()
+        self.assertEqual(len(op.opcounts), 7)
+
+    def test_deterministic_operations_stop_after_the_minimum(self):
+        env = self.get_env(iterations=10, ci_width=0.01, timing=True, min_iterations=3)
+        op = LatestOperation(env, save_to_file=False)
+        op.execute()
+        self.assertEqual(len(op.opcounts), 3)
+        self.assertEqual(len(op.opcounts["Latency (ns)"]), 3)
+        self.assertListEqual(op.opcounts.index.tolist(), [1, 2, 3])
+
+    def test_noisy_operations_iterate_until_the_interval_is_narrow_enough(self):
+        env = self.get_env(KRandomStrategy(4), iterations=5, ci_width=0.2, max_iterations=10_000)
+        op = GetNthOperation(env, save_to_file=False)
+        op.execute()
+        num_iterations = len(op.opcounts)
+        self.assertGreater(num_iterations, 5)
+        self.assertLess(num_iterations, 10_000)
+        self.assertEqual(op.statistics.count, num_iterations)
+        self.assertTrue(op.is_precise())
+
+    def test_noisy_operations_stop_at_the_maximum(self):
+        op = GetNthOperation(self.get_env(ci_width=1e-6, min_iterations=2, max_iterations=20), save_to_file=False)
+        op.execute()
+        self.assertEqual(len(op.opcounts), 20)
+
+    def test_operations_with_set_iterations_do_not_adapt(self):
+        env = self.get_env(iterations=1, ci_width=0.5, max_iterations=1000)
+        op = UnsafeListAllOperation(env, save_to_file=False)
+        self.assertFalse(op.adaptive)
+        self.assertEqual(op.iterations, VOLUME - 1)
+
+    def test_summary_only_keeps_the_statistics_instead_of_the_rows(self):
+        op = GetNthOperation(self.get_env(KRandomStrategy(4), iterations=50, timing=True), save_to_file=False)
+        op.execute()
+        reset(reset_data=True)
+        random.seed(0)
+        np.random.seed(0)
+        env = self.get_env(KRandomStrategy(4), iterations=50, timing=True, summary_only=True)
+        summary_op = GetNthOperation(env, save_to_file=False)
+        summary_op.execute()
+        self.assertIsNone(summary_op.opcounts)
+        self.assertEqual(len(summary_op.data), 0)
+        self.assertListEqual(summary_op.summary.columns.tolist(), op.opcounts.columns.tolist())
+        self.assertEqual(summary_op.summary.loc["count", "IPFS Retrieve"], 50)
+        self.assertAlmostEqual(summary_op.summary.loc["mean", "IPFS Retrieve"], op.opcounts["IPFS Retrieve"].mean())
+        self.assertAlmostEqual(summary_op.summary.loc["std", "IPFS Retrieve"], op.opcounts["IPFS Retrieve"].std())
+
+    def test_version_index_points_at_the_versions_with_a_version_tree(self):
+        for operation in (StoreOperation, IteratedStoreOperation):
+            with self.subTest(operation=operation.__name__):
+                reset(reset_data=True)
+                env = IPAROSimulationEnvironment(SingleStrategy(), VOLUME, UniformVersionDensity(), [],
+                                                 iterations=1, version_tree_fanout=4)
+                operation(env, save_to_file=False).execute()
+                self.assertIsInstance(ipfs.retrieve(ipns.get_latest_cid(URL)), VersionTreeNode)
+                for number in (0, 3, VOLUME - 1):
+                    iparo = ipfs.retrieve(ipns.get_nth_cid(URL, number))
+                    self.assertIsInstance(iparo, IPARO)
+                    self.assertEqual(iparo.seq_num, number)
+
+    def test_profile_columns_only_with_the_profiling_flags(self):
+        for timing, trace_memory in ((False, False), (True, False), (False, True), (True, True)):
+            with self.subTest(timing=timing, trace_memory=trace_memory):
+                reset(reset_data=True)
+                env = IPAROSimulationEnvironment(SingleStrategy(), VOLUME, UniformVersionDensity(), [], iterations=3,
+                                                 timing=timing, trace_memory=trace_memory)
+                store_op = StoreOperation(env, save_to_file=False)
+                store_op.execute()
+                op = GetNthOperation(env, save_to_file=False)
+                op.execute()
+                latency_columns = ["Latency (ns)"] * timing
+                memory_columns = ["Peak Memory (Bytes)"] * trace_memory
+                self.assertListEqual(get_profile_columns(op.opcounts), latency_columns + memory_columns)
+                self.assertCountEqual(get_profile_columns(store_op.opcounts),
+                                      latency_columns + ["Policy Latency (ns)"] * timing + memory_columns)
+                for opcounts in (store_op.opcounts, op.opcounts):
+                    self.assertTrue((opcounts[get_profile_columns(opcounts)] >= 0).all().all())
+
+    def test_iterated_store_averages_the_profile_columns_per_version(self):
+        volume, iterations = 20, 3
+        env = IPAROSimulationEnvironment(SingleStrategy(), volume, UniformVersionDensity(), [], iterations=iterations,
+                                         timing=True, trace_memory=True)
+        measurements = []
+
+        def end_iteration(_):
+            measurements.append(len(measurements) + 1)
+            return measurements[-1], 2 * measurements[-1]
+
+        op = IteratedStoreOperation(env, save_to_file=False)
+        with patch.object(IterationProfiler, "end_iteration", end_iteration):
+            op.execute()
+        # Each version is measured, and then the whole chain of the iteration.
+        latencies = np.array(measurements).reshape(iterations, volume + 1)[:, :-1].mean(axis=0)
+        self.assertEqual(len(op.opcounts), volume)
+        np.testing.assert_allclose(op.opcounts["Latency (ns)"], latencies)
+        np.testing.assert_allclose(op.opcounts["Peak Memory (Bytes)"], 2 * latencies)
+        self.assertTrue((op.opcounts["Policy Latency (ns)"] >= 0).all())
+
+    def test_profile_is_saved_when_the_operation_fails(self):
+        with tempfile.TemporaryDirectory() as directory:
+            op = GetNthOperation(self.get_env(iterations=5, profile=True, output_dir=directory), save_to_file=False)
+            with patch.object(GetNthOperation, "step", side_effect=RuntimeError):
+                self.assertRaises(RuntimeError, op.execute)
+            self.assertTrue(os.path.exists(os.path.join(directory, op.profile_path)))
+
+
+if __name__ == '__main__':
+    unittest.main()
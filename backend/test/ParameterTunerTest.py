@@ -0,0 +1,57 @@
+import unittest
+
+import pandas as pd
+
+from simulation.IPFS import ipfs
+from simulation.IPNS import ipns
+from tuning.ParameterTuner import Objective, ParameterSpace, successive_halving, to_dataframe, \
+    get_pareto_front, get_best_candidate
+
+VOLUME = 50
+
+
+class ParameterTunerTest(unittest.TestCase):
+
+    def tearDown(self):
+        ipns.reset_data()
+        ipns.reset_counts()
+        ipfs.reset_data()
+        ipfs.reset_counts()
+
+    def test_parameter_values_are_spaced_on_a_log_scale(self):
+        self.assertListEqual(ParameterSpace("-p {}", 1, 64).get_values(7), [1, 2, 4, 8, 16, 32, 64])
+        self.assertListEqual(ParameterSpace("-p {}", 1, 4).get_values(10), [1, 2, 3, 4])
+        self.assertListEqual(ParameterSpace("-e {}", 2, 8, integer=False).get_values(3), [2.0, 4.0, 8.0])
+
+    def test_evaluations_are_repeatable(self):
+        objective = Objective(VOLUME, weights={"nth": 1, "latest": 2})
+        evaluation = objective.evaluate("Previous", 4, 10)
+        self.assertEqual(evaluation, objective.evaluate("Previous", 4, 10))
+        self.assertSetEqual(set(evaluation.costs), {"Nth", "Latest"})
+        self.assertEqual(evaluation.retrieval_cost, evaluation.costs["Nth"] + 2 * evaluation.costs["Latest"])
+        self.assertTrue(evaluation.feasible)
+
+    def test_successive_halving_keeps_the_best_candidates_within_the_budget(self):
+        objective = Objective(VOLUME, max_links=4)
+        evaluations = successive_halving(objective, "Sequential-Max-Gap", num_candidates=9, min_iterations=5,
+                                         max_iterations=45)
+        self.assertListEqual([evaluation.iterations for evaluation in evaluations], [5] * 9 + [15] * 3 + [45])
+        first_rung = [evaluation for evaluation in evaluations[:9] if evaluation.feasible]
+        survivors = {evaluation.value for evaluation in evaluations[9:12]}
+        self.assertTrue(all(evaluation.value in survivors
+                            for evaluation in sorted(first_rung, key=lambda e: e.retrieval_cost)[:3]))
+        best = get_best_candidate(to_dataframe(evaluations))
+        self.assertEqual(best["Value"], evaluations[-1].value)
+        self.assertLessEqual(best["Links"], 4)
+
+    def test_pareto_front(self):
+        evaluations = pd.DataFrame({"Policy": "Previous", "Args": ["A", "B", "C", "D", "A"],
+                                    "Iterations": [10, 10, 10, 10, 30], "Links": [1, 2, 3, 4, 1],
+                                    "Retrieval Cost": [9, 5, 6, 1, 8], "Feasible": True})
+        front = get_pareto_front(evaluations)
+        self.assertListEqual(front["Args"].tolist(), ["A", "B", "D"])
+        self.assertEqual(front.loc[0, "Retrieval Cost"], 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
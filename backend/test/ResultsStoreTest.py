@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from simulation.OnlineStatistics import OnlineStatistics
+from simulation.ResultsStore import write_partition, read_partition, read_legacy_csv, load_results, \
+    write_summary, read_summary, load_summaries, KEY_COLUMNS, SUMMARY_KEY_COLUMNS, CONSOLIDATED_NAME
+
+
+def get_opcounts(iterations: int) -> pd.DataFrame:
+    return pd.DataFrame({"IPFS Retrieve": np.arange(iterations) * 2, "IPNS Get": np.ones(iterations)},
+                        index=pd.RangeIndex(iterations, name="Iteration"))
+
+
+class ResultsStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.root = Path(self.directory.name)
+        self.param_folder = self.root / "Previous" / "2"
+        os.makedirs(self.param_folder)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_partition_round_trip(self):
+        path = self.param_folder / "10-Uniform-Nth.npz"
+        write_partition(str(path), get_opcounts(3), 10, "Uniform", "Nth")
+        df = read_partition(path)
+        self.assertListEqual(df["IPFS Retrieve"].tolist(), [0, 2, 4])
+        self.assertListEqual(df["Iteration"].tolist(), [0, 1, 2])
+        self.assertEqual(df["Volume"].iloc[0], 10)
+        self.assertEqual(df["Density"].iloc[0], "Uniform")
+        self.assertEqual(df["Operation"].iloc[0], "Nth")
+
+    def test_legacy_csv_leaves_out_the_summary(self):
+        path = self.param_folder / "10-Uniform-Range-0.1.csv"
+        opcounts = get_opcounts(3)
+        pd.concat([opcounts, opcounts.describe()]).to_csv(path)
+        df = read_legacy_csv(path)
+        self.assertEqual(len(df), 3)
+        self.assertEqual(df["Operation"].iloc[0], "Range-0.1")
+        self.assertListEqual(df["Iteration"].tolist(), [0, 1, 2])
+
+    def test_load_results_rebuilds_after_a_new_partition(self):
+        write_partition(str(self.param_folder / "10-Uniform-Nth.npz"), get_opcounts(3), 10, "Uniform", "Nth")
+        df = load_results(self.root)
+        self.assertListEqual(list(df.columns[:len(KEY_COLUMNS)]), KEY_COLUMNS)
+        self.assertEqual(len(df), 3)
+        self.assertTrue((self.root / CONSOLIDATED_NAME).exists())
+
+        # Makes sure that the new partition is newer than the consolidated results.
+        consolidated_mtime = os.stat(self.root / CONSOLIDATED_NAME).st_mtime
+        os.makedirs(self.root / "Single" / "None")
+        path = self.root / "Single" / "None" / "10-Uniform-Store.npz"
+        write_partition(str(path), get_opcounts(2), 10, "Uniform", "Store")
+        os.utime(path.parent, (consolidated_mtime + 1, consolidated_mtime + 1))
+        df = load_results(self.root)
+        self.assertEqual(len(df), 5)
+        self.assertSetEqual(set(df["Group"]), {"Previous", "Single"})
+
+    def test_replacing_a_partition_modifies_its_directory(self):
+        path = self.param_folder / "10-Uniform-Nth.npz"
+        write_partition(str(path), get_opcounts(3), 10, "Uniform", "Nth")
+        os.utime(self.param_folder, (0, 0))
+        write_partition(str(path), get_opcounts(4), 10, "Uniform", "Nth")
+        self.assertGreater(os.stat(self.param_folder).st_mtime, 0)
+        self.assertListEqual(os.listdir(self.param_folder), ["10-Uniform-Nth.npz"])
+        self.assertEqual(len(read_partition(path)), 4)
+
+    def test_load_results_of_an_empty_folder(self):
+        self.assertTrue(load_results(self.root).empty)
+
+    def test_summaries_are_kept_apart_from_the_partitions(self):
+        statistics = OnlineStatistics(["IPFS Retrieve", "IPNS Get"])
+        for row in get_opcounts(5).to_numpy():
+            statistics.add(row)
+        path = self.param_folder / "10-Uniform-Nth.summary.npz"
+        write_summary(str(path), statistics, 10, "Uniform", "Nth")
+        write_partition(str(self.param_folder / "10-Uniform-Latest.npz"), get_opcounts(3), 10, "Uniform", "Latest")
+
+        read_statistics, volume, density, operation = read_summary(path)
+        self.assertEqual((volume, density, operation), (10, "Uniform", "Nth"))
+        pd.testing.assert_frame_equal(read_statistics.describe(), statistics.describe())
+        self.assertSetEqual(set(load_results(self.root)["Operation"]), {"Latest"})
+
+        summaries = load_summaries(self.root)
+        self.assertListEqual(list(summaries.columns[:len(SUMMARY_KEY_COLUMNS)]), SUMMARY_KEY_COLUMNS)
+        self.assertEqual(len(summaries), 8)
+        mean = summaries[summaries["Statistic"] == "mean"].iloc[0]
+        self.assertEqual(mean["Operation"], "Nth")
+        self.assertEqual(mean["IPFS Retrieve"], 4)
+
+    def test_load_summaries_of_an_empty_folder(self):
+        self.assertTrue(load_summaries(self.root).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
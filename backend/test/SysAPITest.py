@@ -27,6 +27,12 @@ class APITest(unittest.TestCase):
         self.assertEqual(res.status_code, 400)
         self.assertIn(b"Missing 'url'", res.data)
 
+    def test_api_snapshots_negative_start_or_limit(self):
+        for query in ["start=-1", "limit=-1", "start=2&limit=-5"]:
+            res = self.client.get(f'/api/snapshots?url=example.com&{query}')
+            self.assertEqual(res.status_code, 400)
+            self.assertIn(b"must be nonnegative", res.data)
+
     def test_api_snapshot_by_date_missing_params(self):
         res = self.client.get('/api/snapshots/date')
         self.assertEqual(res.status_code, 400)
@@ -5,8 +5,9 @@ const API = path =>
       return r.json()
     })
 
-export const fetchSnapshotsByUrl = url =>
-  API(`/api/snapshots?url=${encodeURIComponent(url)}`)
+export const fetchSnapshotsByUrl = (url, start=0, limit=null) =>
+  API(`/api/snapshots?url=${encodeURIComponent(url)}&start=${start}` +
+      (limit !== null ? `&limit=${limit}` : ''))
     .then(data => data.map(item => ({ id: item.cid, timestamp: item.timestamp })))
 
 export const fetchSnapshotsByDate = (url, date, limit=3) =>